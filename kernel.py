@@ -3,65 +3,67 @@ from src.simulations.kin.kin import Kinematics
 from src.simulations.qss.qss import QSS
 from src.simulations.comp_eval.comp_eval import CompEval
 from src.simulations.transient_comp_eval.transient_comp_eval import TransientCompEval
+from src._3_custom_libraries import telemetry
 
-import shutil
 import time
 import yaml
 import sys
-import os
 
-start_time = time.time()
+# Guard required for worker processes (multiprocessing spawn re-imports this module)
+if __name__ == "__main__":
+    start_time = time.time()
 
-# Initialization
-avail_sims = ["kin", "visual", "qss", "comp_eval", "transient_comp_eval"]
-input_dir = "./src/_1_model_inputs/"
+    # Initialization
+    avail_sims = ["kin", "visual", "qss", "comp_eval", "transient_comp_eval"]
+    input_dir = "./src/_1_model_inputs/"
 
-try:
-    sim_selected = sys.argv[1].lower()
-    model_path = input_dir + sys.argv[2]
+    try:
+        sim_selected = sys.argv[1].lower()
+        model_path = input_dir + sys.argv[2]
 
-    if sim_selected == "kin":
-        comparison_paths = [input_dir + path for path in sys.argv[3:]]
+        if sim_selected == "kin":
+            comparison_paths = [input_dir + path for path in sys.argv[3:]]
 
-except:
-    raise Exception("Please specify SIM arg: make sim SIM={} MODEL_PATH={}")
+    except:
+        raise Exception("Please specify SIM arg: make sim SIM={} MODEL_PATH={}")
 
-# Validation
-if sim_selected not in avail_sims:
-    raise Exception(f"Selected simulation is not available. Use the following command: make sim SIM=()\nWhere () is replaced with one of: {', '.join(avail_sims)}")
+    # Validation
+    if sim_selected not in avail_sims:
+        raise Exception(f"Selected simulation is not available. Use the following command: make sim SIM=()\nWhere () is replaced with one of: {', '.join(avail_sims)}")
 
-# Print model information
-with open(model_path) as f:
-    try:
-        model_properties: dict[str, dict[str, dict]] = yaml.safe_load(f)
-    except yaml.YAMLError as error:
-        print("Failed to import yaml file. Reason:\n")
-        print(error)
+    # Print model information
+    with open(model_path) as f:
+        try:
+            model_properties: dict[str, dict[str, dict]] = yaml.safe_load(f)
+        except yaml.YAMLError as error:
+            print("Failed to import yaml file. Reason:\n")
+            print(error)
 
-print(f"\nSelected Model: {model_properties["Name"]["Value"]}")
+    print(f"\nSelected Model: {model_properties["Name"]["Value"]}")
+
+    # Select simulation
+    if sim_selected == "kin":
+        print("Running simulation: kinematics")
+        kin = Kinematics(model_path=model_path, comparison_paths=comparison_paths)
+    elif sim_selected == "visual":
+        print("Running simulation: visual model")
+        visual = VisualModel(model_path=model_path)
+    elif sim_selected == "qss":
+        print("Running simulation: quasi-steady-state metrics")
+        visual = QSS(model_path=model_path)
+    elif sim_selected == "comp_eval":
+        print("Running simulation: comp evaluation")
+        comp_eval = CompEval(model_path=model_path)
+    elif sim_selected == "transient_comp_eval":
+        print("Running simulation: transient comp evaluation")
+        transient_comp_eval = TransientCompEval(model_path=model_path)
 
-# Select simulation
-if sim_selected == "kin":
-    print("Running simulation: kinematics")
-    kin = Kinematics(model_path=model_path, comparison_paths=comparison_paths)
-elif sim_selected == "visual":
-    print("Running simulation: visual model")
-    visual = VisualModel(model_path=model_path)
-elif sim_selected == "qss":
-    print("Running simulation: quasi-steady-state metrics")
-    # Generate animation
-    shutil.rmtree("./src/simulations/qss/qss_outputs/ymd_animation")
-    os.mkdir("./src/simulations/qss/qss_outputs/ymd_animation")
-    visual = QSS(model_path=model_path)
-elif sim_selected == "comp_eval":
-    print("Running simulation: comp evaluation")
-    comp_eval = CompEval(model_path=model_path)
-elif sim_selected == "transient_comp_eval":
-    print("Running simulation: transient comp evaluation")
-    transient_comp_eval = TransientCompEval(model_path=model_path)
 
 
+    # Solver statistics from this process and every worker it ran
+    print("\nSolver telemetry:")
+    telemetry.write_summary(path=f"./src/simulations/{sim_selected}/{sim_selected}_outputs/solver_telemetry.json")
 
-end_time = time.time()
+    end_time = time.time()
 
-print(f"Workflow duration: {end_time - start_time} sec")
\ No newline at end of file
+    print(f"Workflow duration: {end_time - start_time} sec")
@@ -0,0 +1,138 @@
+from src.vehicle_model.aero_model.aero import Aero
+
+from typing import Any, Callable, Tuple
+
+import hashlib
+import pickle
+import os
+
+
+KIN_FMU_PATH = "./src/simulations/kin/kin_outputs/kin_FMU.pkl"
+AERO_MAP_PATH = "./src/_1_model_inputs/aero_map.csv"
+
+# Loaded assets keyed by (kind, absolute path, content hash), and file hashes keyed by absolute path
+_assets: dict[Tuple[str, str, str], Any] = {}
+_hashes: dict[str, Tuple[int, int, str]] = {}
+
+
+def file_hash(path: str) -> str:
+    """
+    ## File Hash
+
+    Hashes a file's contents, rehashing only when its size or modification time changes
+
+    Parameters
+    ----------
+    path : str
+        Path to file
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest of the file contents
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+
+    if abs_path in _hashes and _hashes[abs_path][:2] == (stat.st_mtime_ns, stat.st_size):
+        return _hashes[abs_path][2]
+
+    with open(abs_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    _hashes[abs_path] = (stat.st_mtime_ns, stat.st_size, digest)
+
+    return digest
+
+
+def load_asset(path: str, kind: str, loader: Callable[[str], Any]) -> Any:
+    """
+    ## Load Asset
+
+    Loads a model asset once per process and hands out the shared instance afterwards
+    - Keyed by (kind, absolute path, content hash), so an edited or regenerated file is reloaded
+    - Shared instances must be treated as read-only
+
+    Parameters
+    ----------
+    path : str
+        Path to asset file
+    kind : str
+        Asset type, so one file can back several kinds of asset
+    loader : Callable[[str], Any]
+        Builds the asset from its path, called only on the first request
+
+    Returns
+    -------
+    Any
+        Shared asset instance
+    """
+    key = (kind, os.path.abspath(path), file_hash(path))
+
+    if key not in _assets:
+        _assets[key] = loader(path)
+
+    return _assets[key]
+
+
+def clear_assets() -> None:
+    """
+    ## Clear Assets
+
+    Drops every loaded asset
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+    _assets.clear()
+    _hashes.clear()
+
+
+def _unpickle(path: str) -> Any:
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def load_kin_FMU(path: str = KIN_FMU_PATH) -> dict:
+    """
+    ## Load Kinematics FMU
+
+    Loads the kinematics FMU generated by SIM=kin
+
+    Parameters
+    ----------
+    path : str, optional
+        Path to FMU pickle, by default KIN_FMU_PATH
+
+    Returns
+    -------
+    dict
+        Shared FMU interpolators, keyed by output name
+    """
+    if not os.path.exists(path):
+        raise Exception("Please run SIM=kin with FMU generation enabled")
+
+    return load_asset(path=path, kind="kin_FMU", loader=_unpickle)
+
+
+def load_aero(path: str = AERO_MAP_PATH) -> Aero:
+    """
+    ## Load Aero
+
+    Loads an aero map
+
+    Parameters
+    ----------
+    path : str, optional
+        Path to aero map csv, by default AERO_MAP_PATH
+
+    Returns
+    -------
+    Aero
+        Shared aero model
+    """
+    return load_asset(path=path, kind="Aero", loader=Aero)
@@ -1,34 +1,238 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Sequence, Tuple, Union
 from functools import wraps
-import copy
 
+import numpy as np
 
-def SISO_global_cache(func):
-    cache = {}
 
-    @wraps(func)
-    def wrapper(self, *args):
-        key = (id(self.__class__), *args)
+# Key tolerances for quantized cache keys, by argument unit (None or 0 uses exact keys)
+KEY_TOLERANCES: dict[str, Union[float, None]] = {
+    "m": 1e-7,
+    "deg": 1e-5,
+}
 
-        if key in cache:
-            return copy.deepcopy(cache[key])
 
-        func(self, *args)  # Mutate self in-place
-        cache[key] = copy.deepcopy(self)
-        return self
+def set_key_tolerance(unit: str, tolerance: Union[float, None]) -> None:
+    """
+    ## Set Key Tolerance
 
-    return wrapper
+    Sets the quantization tolerance used by every cached operation for arguments of a given unit
 
-def SISO_local_cache(func):
-    cache = {}
+    Parameters
+    ----------
+    unit : str
+        Argument unit, e.g. "m" or "deg"
+    tolerance : Union[float, None]
+        Quantization step, or None for exact keys
 
-    @wraps(func)
-    def wrapper(self, arg):
-        if arg in cache:
-            return copy.deepcopy(cache[arg])  # return a copy to avoid mutation
+    Returns
+    -------
+    None
+    """
+    KEY_TOLERANCES[unit] = tolerance
 
-        result = func(self, arg)
 
-        cache[arg] = copy.deepcopy(result)
-        return cache[arg]
+def quantize_key(args: Sequence, units: Union[Sequence[Union[str, None]], None] = None) -> Tuple:
+    """
+    ## Quantize Key
 
-    return wrapper
\ No newline at end of file
+    Snaps numeric arguments to multiples of their unit's tolerance so nearly identical values share a key
+
+    Parameters
+    ----------
+    args : Sequence
+        Positional arguments of the cached call
+    units : Union[Sequence[Union[str, None]], None], optional
+        Unit of each argument (None leaves that argument exact), by default None (all exact)
+
+    Returns
+    -------
+    Tuple
+        Hashable key
+    """
+    if units is None:
+        return tuple(args)
+
+    key = []
+
+    for arg, unit in zip(args, units):
+        tolerance = KEY_TOLERANCES.get(unit) if unit is not None else None
+
+        if tolerance:
+            key.append(int(round(float(arg) / tolerance)))
+        else:
+            key.append(arg)
+
+    return (*key, *args[len(units):])
+
+
+class LRUStateCache:
+    """
+    ## LRU State Cache
+
+    Least-recently-used cache of suspension state snapshots
+    - Snapshots are stored as a shared key tuple and a float64 value array, not as copies of the simulation object
+    - Bounded by number of entries and/or total snapshot bytes
+
+    Parameters
+    ----------
+    max_entries : Union[int, None], optional
+        Maximum number of snapshots held, by default 4096 (None for unbounded)
+    max_bytes : Union[int, None], optional
+        Maximum total bytes of snapshot values held, by default None (unbounded)
+    """
+    def __init__(self, max_entries: Union[int, None] = 4096, max_bytes: Union[int, None] = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.entries: OrderedDict[Hashable, Tuple[Tuple[str, ...], np.ndarray]] = OrderedDict()
+        self.nbytes = 0
+
+        # Every snapshot with the same keys references one tuple
+        self._key_sets: dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Union[dict[str, float], None]:
+        """
+        ## Get
+
+        Gets a restored state dict, marking the entry as most recently used
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key
+
+        Returns
+        -------
+        Union[dict[str, float], None]
+            Restored state, or None if not cached
+        """
+        if key not in self.entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        state_keys, values = self.entries[key]
+
+        return dict(zip(state_keys, values.tolist()))
+
+    def put(self, key: Hashable, state: dict[str, float]) -> None:
+        """
+        ## Put
+
+        Stores a snapshot of a state dict, evicting least recently used entries as needed
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key
+        state : dict[str, float]
+            Suspension state
+
+        Returns
+        -------
+        None
+        """
+        state_keys = tuple(state.keys())
+        state_keys = self._key_sets.setdefault(state_keys, state_keys)
+        values = np.fromiter(state.values(), dtype=np.float64, count=len(state_keys))
+
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[1].nbytes
+
+        self.entries[key] = (state_keys, values)
+        self.nbytes += values.nbytes
+
+        while (self.max_entries is not None and len(self.entries) > self.max_entries) or \
+              (self.max_bytes is not None and self.nbytes > self.max_bytes and len(self.entries) > 1):
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        ## Stats
+
+        Cache counters
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict[str, int]
+            Hits, misses, evictions, entries, and bytes held
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self.entries), "bytes": self.nbytes}
+
+    def clear(self) -> None:
+        """
+        ## Clear
+
+        Removes all snapshots and resets counters
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.entries.clear()
+        self._key_sets.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+def LRU_state_cache(max_entries: Union[int, None] = 4096, max_bytes: Union[int, None] = None,
+                    units: Union[Sequence[Union[str, None]], None] = None) -> Callable:
+    """
+    ## LRU State Cache Decorator
+
+    Caches the suspension state produced by a method that mutates self.sus in place
+    - On a hit, only self.sus.state is restored (suspension geometry is left as-is)
+    - The cache is exposed as the wrapper's cache attribute, e.g. Kinematics.heave.cache.stats()
+
+    Parameters
+    ----------
+    max_entries : Union[int, None], optional
+        Maximum number of snapshots held, by default 4096 (None for unbounded)
+    max_bytes : Union[int, None], optional
+        Maximum total bytes of snapshot values held, by default None (unbounded)
+    units : Union[Sequence[Union[str, None]], None], optional
+        Unit of each argument, for quantized keys (see KEY_TOLERANCES), by default None (exact keys)
+
+    Returns
+    -------
+    Callable
+        Decorator
+    """
+    def decorator(func):
+        cache = LRUStateCache(max_entries=max_entries, max_bytes=max_bytes)
+
+        @wraps(func)
+        def wrapper(self, *args):
+            key = (id(self.__class__), *quantize_key(args=args, units=units))
+            state = cache.get(key)
+
+            if state is not None:
+                self.sus.state = state
+                return self
+
+            func(self, *args)  # Mutate self in-place
+            cache.put(key, self.sus.state)
+            return self
+
+        wrapper.cache = cache  # type: ignore
+        return wrapper
+
+    return decorator
@@ -1,112 +1,158 @@
-from scipy.interpolate import griddata, interpn # type: ignore
+from scipy.interpolate import LinearNDInterpolator, RegularGridInterpolator # type: ignore
+from scipy.spatial import Delaunay, cKDTree # type: ignore
 from typing import Sequence, Union
 import numpy as np
 
 
+def _query_points(coords: Sequence, dims: int) -> np.ndarray:
+    """
+    ## Query Points
+
+    Stacks query coordinates into an (N, d) array
+    - Accepts either one coordinate per axis (scalars or arrays, broadcast together) or a single (N, d) array
+
+    Parameters
+    ----------
+    coords : Sequence
+        Query coordinates
+    dims : int
+        Number of interpolation axes
+
+    Returns
+    -------
+    np.ndarray
+        Query points, shape (N, d)
+    """
+    if len(coords) == 1:
+        return np.atleast_2d(np.asarray(coords[0], dtype=float)).reshape((-1, dims))
+
+    return np.column_stack([np.ravel(axis) for axis in np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in coords])])
+
+def _clamp(points: np.ndarray, lower: np.ndarray, upper: np.ndarray, nan_to_upper: bool = False) -> np.ndarray:
+    """
+    ## Clamp
+
+    Clamps query points to the data bounds
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Query points, shape (N, d)
+    lower : np.ndarray
+        Lower bound of each axis
+    upper : np.ndarray
+        Upper bound of each axis
+    nan_to_upper : bool, optional
+        Replace NaN coordinates with the upper bound, by default False
+
+    Returns
+    -------
+    np.ndarray
+        Clamped query points
+    """
+    if nan_to_upper:
+        points = np.where(np.isnan(points), upper, points)
+
+    return np.clip(points, lower, upper)
+
+
 class  interp4d:
-    def __init__(self, x: Union[np.ndarray, Sequence[float]], y: Union[np.ndarray, Sequence[float]], 
+    def __init__(self, x: Union[np.ndarray, Sequence[float]], y: Union[np.ndarray, Sequence[float]],
                  z: Union[np.ndarray, Sequence[float]], w: Union[np.ndarray, Sequence[float]], v: Union[np.ndarray, Sequence[float]]) -> None:
-        
-        self.x = x
-        self.y = y
-        self.z = z
-        self.w = w
-        self.v = v
-
-    def __call__(self, x: float, y: float, z: float, w: float) -> float:
-        points = (self.x, self.y, self.z, self.w)
-        values = np.array(self.v).reshape((len(self.x), len(self.y), len(self.z), len(self.w)))
-
-        if (x > max(self.x)) or (str(x) == 'nan'):
-            x = max(self.x)
-        elif (x < min(self.x)) or (str(x) == '-nan'):
-            x = min(self.x)
-
-        if (y > max(self.y)) or (str(y) == 'nan'):
-            y = max(self.y)
-        elif (y < min(self.y)) or (str(y) == '-nan'):
-            y = min(self.y)
-
-        if (z > max(self.z)) or (str(z) == 'nan'):
-            z = max(self.z)
-        elif (z < min(self.z)) or (str(z) == '-nan'):
-            z = min(self.z)
-
-        if (w > max(self.w)) or (str(w) == 'nan'):
-            w = max(self.w)
-        elif (w < min(self.w)) or (str(w) == '-nan'):
-            w = min(self.w)
-
-        try:
-            return interpn(points=points, values=values, xi=(x, y, z, w), method='linear')
-        
-        except:
-            return interpn(points=points, values=values, xi=(x, y, z, w), method='nearest')
+
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.z = np.asarray(z, dtype=float)
+        self.w = np.asarray(w, dtype=float)
+        self.v = np.asarray(v, dtype=float).reshape((len(self.x), len(self.y), len(self.z), len(self.w)))
+
+        axes = (self.x, self.y, self.z, self.w)
+        self.lower = np.array([axis.min() for axis in axes])
+        self.upper = np.array([axis.max() for axis in axes])
+
+        self.interp = RegularGridInterpolator(points=axes, values=self.v, method='linear')
+
+    def __call__(self, x: Union[float, np.ndarray], y: Union[float, np.ndarray, None] = None,
+                 z: Union[float, np.ndarray, None] = None, w: Union[float, np.ndarray, None] = None) -> np.ndarray:
+        """
+        Evaluates at (x, y, z, w), where each coordinate may be a scalar or array, or at an (N, 4) array passed as x
+        - Queries are clamped to the grid, and NaN coordinates are treated as the upper bound
+        """
+        coords = (x,) if y is None else (x, y, z, w)
+        points = _clamp(_query_points(coords=coords, dims=4), lower=self.lower, upper=self.upper, nan_to_upper=True)
+
+        return self.interp(points)
 
 class  interp3d:
-    def __init__(self, x: Union[np.ndarray, Sequence[float]], y: Union[np.ndarray, Sequence[float]], 
+    def __init__(self, x: Union[np.ndarray, Sequence[float]], y: Union[np.ndarray, Sequence[float]],
                  z: Union[np.ndarray, Sequence[float]], v: Union[np.ndarray, Sequence[float]]) -> None:
-        
-        self.x = x
-        self.y = y
-        self.z = z
-        self.v = v
 
-        self.v_mesh = np.array(self.v).reshape((len(self.x), len(self.y), len(self.z)))
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.z = np.asarray(z, dtype=float)
+        self.v = np.asarray(v, dtype=float).ravel()
+
+        # Regular grid: x, y, z are strictly increasing axes and v holds one value per grid node
+        self.regular = (self.v.size == len(self.x) * len(self.y) * len(self.z)) and (self.v.size != len(self.x)) and \
+                       all(np.all(np.diff(axis) > 0) for axis in (self.x, self.y, self.z))
+
+        if self.regular:
+            self.lower = np.array([self.x.min(), self.y.min(), self.z.min()])
+            self.upper = np.array([self.x.max(), self.y.max(), self.z.max()])
 
-    def __call__(self, x: float, y: float, z: float) -> float:
-        try:
-            points = (self.x, self.y, self.z)
+            self.interp = RegularGridInterpolator(points=(self.x, self.y, self.z), values=self.v.reshape((len(self.x), len(self.y), len(self.z))),
+                                                  method='linear')
 
-            if x > max(self.x):
-                x = max(self.x)
-            elif x < min(self.x):
-                x = min(self.x)
+        # Scattered data: x, y, z, and v hold one entry per data point
+        else:
+            self.points = np.column_stack((self.x, self.y, self.z))
+            self.lower = self.points.min(axis=0)
+            self.upper = self.points.max(axis=0)
 
-            if y > max(self.y):
-                y = max(self.y)
-            elif y < min(self.y):
-                y = min(self.y)
+            # Triangulate and build the nearest-neighbour tree once, reused by every query
+            self.triangulation = Delaunay(self.points)
+            self.interp = LinearNDInterpolator(self.triangulation, self.v)
+            self.tree = cKDTree(self.points)
 
-            if z > max(self.z):
-                z = max(self.z)
-            elif z < min(self.z):
-                z = min(self.z)
-                
-            interp_val = griddata((self.x, self.y, self.z), self.v_mesh, (x, y, z), method='linear')
-            
-            if str(interp_val) == "nan":
-                return griddata((self.x, self.y, self.z), self.v_mesh, (x, y, z), method='nearest')
+    def __call__(self, x: Union[float, np.ndarray], y: Union[float, np.ndarray, None] = None,
+                 z: Union[float, np.ndarray, None] = None) -> np.ndarray:
+        """
+        Evaluates at (x, y, z), where each coordinate may be a scalar or array, or at an (N, 3) array passed as x
+        - Queries are clamped to the data bounds, and points outside the convex hull use nearest values
+        """
+        coords = (x,) if y is None else (x, y, z)
+        points = _clamp(_query_points(coords=coords, dims=3), lower=self.lower, upper=self.upper)
 
-            return interp_val
+        interp_vals = self.interp(points)
 
-        except ValueError:
-            points = (self.x, self.y, self.z)
-            values = self.v
+        if not self.regular:
+            outside = np.isnan(interp_vals)
 
-            return interpn(points=points, values=values, xi=(x, y, z))
+            if outside.any():
+                interp_vals[outside] = self.v[self.tree.query(points[outside])[1]]
+
+        return interp_vals
 
 
 class interp2d:
-    def __init__(self, x: Union[np.ndarray, Sequence[float]], y: Union[np.ndarray, Sequence[float]], 
+    def __init__(self, x: Union[np.ndarray, Sequence[float]], y: Union[np.ndarray, Sequence[float]],
                  z: Union[np.ndarray, Sequence[float]]) -> None:
-        
-        self.x = x
-        self.y = y
-        self.z = z
-
-    def __call__(self, x: float, y: float) -> float:
-        points = (self.x, self.y)
-        values = np.array(self.z).reshape((len(self.x), len(self.y)))
-
-        if x > max(self.x):
-            x = max(self.x)
-        elif x < min(self.x):
-            x = min(self.x)
-
-        if y > max(self.y):
-            y = max(self.y)
-        elif y < min(self.y):
-            y = min(self.y)
-
-        return interpn(points=points, values=values, xi=(x, y))
\ No newline at end of file
+
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.z = np.asarray(z, dtype=float).reshape((len(self.x), len(self.y)))
+
+        self.lower = np.array([self.x.min(), self.y.min()])
+        self.upper = np.array([self.x.max(), self.y.max()])
+
+        self.interp = RegularGridInterpolator(points=(self.x, self.y), values=self.z, method='linear')
+
+    def __call__(self, x: Union[float, np.ndarray], y: Union[float, np.ndarray, None] = None) -> np.ndarray:
+        """
+        Evaluates at (x, y), where each coordinate may be a scalar or array, or at an (N, 2) array passed as x
+        - Queries are clamped to the grid
+        """
+        coords = (x,) if y is None else (x, y)
+        points = _clamp(_query_points(coords=coords, dims=2), lower=self.lower, upper=self.upper)
+
+        return self.interp(points)
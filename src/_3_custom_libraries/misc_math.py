@@ -1,5 +1,8 @@
+from src._3_custom_libraries import telemetry
+
 from typing import Sequence, Tuple, Union, Callable
 import numpy as np
+import time
 
 
 def unit_vec(p1: Union[np.ndarray, Sequence[float]], p2: Union[np.ndarray, Sequence[float]]) -> Sequence[float]:
@@ -67,7 +70,17 @@ def rotation_matrix(unit_vec: Union[np.ndarray, Sequence[float], Tuple[float, fl
     
     return matrix
 
-def nearest_root(func: Callable, x0: float, bounds: Tuple[float, float], tol: float, args: Sequence = []):
+def _counted(func: Callable) -> Tuple[Callable, list[int]]:
+    # Wraps func to count its evaluations
+    count = [0]
+
+    def counted(x: float, args: Sequence) -> float:
+        count[0] += 1
+        return func(x, args)
+
+    return counted, count
+
+def nearest_root(func: Callable, x0: float, bounds: Tuple[float, float], tol: float, args: Sequence = [], site: str = "nearest_root"):
     """
     ## Nearest Root
 
@@ -89,7 +102,13 @@ def nearest_root(func: Callable, x0: float, bounds: Tuple[float, float], tol: fl
 
     args : Sequence, optional
         Args to func, by default []
+
+    site : str, optional
+        Solver site the call is recorded under (see telemetry.py), by default "nearest_root"
     """
+    start = time.perf_counter()
+    func, nfev = _counted(func)
+
     # Solution value
     soln = x0
 
@@ -129,10 +148,12 @@ def nearest_root(func: Callable, x0: float, bounds: Tuple[float, float], tol: fl
             x_low = x_mid
 
         residual = func(x_mid, args)
+
+    telemetry.record(site=site, nfev=nfev[0], wall_time=time.perf_counter() - start, converged=True)
     
     return x_mid
 
-def directional_root(func: Callable, x0: float, bounds: Tuple[float, float], tol: float, args: Sequence = []):
+def directional_root(func: Callable, x0: float, bounds: Tuple[float, float], tol: float, args: Sequence = [], site: str = "directional_root"):
     """
     ## Directional Root
 
@@ -154,8 +175,13 @@ def directional_root(func: Callable, x0: float, bounds: Tuple[float, float], tol
 
     args : Sequence, optional
         Args to func, by default []
+
+    site : str, optional
+        Solver site the call is recorded under (see telemetry.py), by default "directional_root"
     """
     # This method is typically used when the solution value is small. The semi-linear approach has advantages because of this.
+    start = time.perf_counter()
+    func, nfev = _counted(func)
 
     # Solution value
     soln = min([abs(x) for x in bounds])
@@ -176,5 +202,7 @@ def directional_root(func: Callable, x0: float, bounds: Tuple[float, float], tol
             continue
         else:
             step_size /= -2
+
+    telemetry.record(site=site, nfev=nfev[0], wall_time=time.perf_counter() - start, converged=True)
     
     return soln
\ No newline at end of file
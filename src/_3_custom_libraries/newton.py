@@ -0,0 +1,100 @@
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+def batch_newton(func: Callable[[np.ndarray, np.ndarray], np.ndarray], x0: np.ndarray, tol: float = 1e-6, xtol: float = 1.49012e-8,
+                 max_iter: int = 50, max_halvings: int = 10, fd_step: float = 1.49012e-8) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    ## Batch Newton
+
+    Solves many independent square nonlinear systems at once with a damped Newton method
+    - Jacobians are built by forward differences, one batched residual call per state column
+    - Steps are halved per point until its residual norm decreases (backtracking line search)
+    - Points drop out of the active set as soon as they converge
+
+    Parameters
+    ----------
+    func : Callable[[np.ndarray, np.ndarray], np.ndarray]
+        Residual function of the form func(x, rows), where x has shape (M, d) and rows holds the index of each of the M points
+    x0 : np.ndarray
+        Initial guesses, shape (N, d)
+    tol : float, optional
+        Convergence tolerance on the largest residual magnitude, by default 1e-6
+    xtol : float, optional
+        Convergence tolerance on the relative step size, by default 1.49012e-8
+    max_iter : int, optional
+        Maximum number of Newton iterations, by default 50
+    max_halvings : int, optional
+        Maximum number of step halvings per iteration, by default 10
+    fd_step : float, optional
+        Relative forward-difference step, by default 1.49012e-8
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, int]
+        Solutions (N, d), convergence flag of each point (N,), and number of iterations taken
+    """
+    x = np.array(x0, dtype=float)
+    n_points, n_dims = x.shape
+
+    rows = np.arange(n_points)
+    residuals = func(x, rows)
+    converged = np.all(np.abs(residuals) < tol, axis=1)
+
+    iteration = 0
+    while iteration < max_iter and not converged.all():
+        iteration += 1
+
+        active = rows[~converged]
+        x_active = x[active]
+        f_active = residuals[active]
+
+        # Forward-difference Jacobian, shape (M, d, d)
+        jacobian = np.empty((len(active), n_dims, n_dims))
+        for j in range(n_dims):
+            step = fd_step * np.maximum(1, np.abs(x_active[:, j]))
+            x_step = x_active.copy()
+            x_step[:, j] += step
+            jacobian[:, :, j] = (func(x_step, active) - f_active) / step[:, None]
+
+        try:
+            dx = np.linalg.solve(jacobian, -f_active[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            dx = np.array([np.linalg.lstsq(J, -f, rcond=None)[0] for J, f in zip(jacobian, f_active)])
+
+        # Backtracking line search on the residual norm
+        t = np.ones(len(active))
+        pending = np.ones(len(active), dtype=bool)
+        norm = np.linalg.norm(f_active, axis=1)
+        x_new = x_active.copy()
+        f_new = f_active.copy()
+
+        for _ in range(max_halvings + 1):
+            trial = x_active[pending] + t[pending, None] * dx[pending]
+            f_trial = func(trial, active[pending])
+            accept = np.linalg.norm(f_trial, axis=1) < (1 - 1e-4 * t[pending]) * norm[pending]
+
+            index = np.flatnonzero(pending)[accept]
+            x_new[index] = trial[accept]
+            f_new[index] = f_trial[accept]
+
+            pending[np.flatnonzero(pending)[accept]] = False
+            t[pending] /= 2
+
+            if not pending.any():
+                break
+
+        # Points without a decreasing step take the smallest step tried
+        if pending.any():
+            x_new[pending] = x_active[pending] + t[pending, None] * dx[pending]
+            f_new[pending] = func(x_new[pending], active[pending])
+
+        step_size = np.linalg.norm(x_new - x_active, axis=1)
+        x[active] = x_new
+        residuals[active] = f_new
+
+        converged[active] = np.all(np.abs(f_new) < tol, axis=1) | \
+                            ((step_size <= xtol * (1 + np.linalg.norm(x_new, axis=1))) & ~pending & np.all(np.isfinite(f_new), axis=1))
+
+    return x, converged, iteration
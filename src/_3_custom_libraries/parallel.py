@@ -0,0 +1,166 @@
+from src._3_custom_libraries import telemetry
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Sequence, Tuple, Union
+
+
+def _with_telemetry(func: Callable, *args: Any, **kwargs: Any) -> Tuple[Any, dict]:
+    # Runs in a worker, returning the solver statistics recorded since the last item (initializer included) with the result
+    return func(*args, **kwargs), telemetry.drain()
+
+def _init_telemetry(initializer: Union[Callable, None], initargs: Tuple) -> None:
+    # Forked workers start with a copy of the parent's statistics, which the parent already holds
+    telemetry.reset()
+
+    if initializer is not None:
+        initializer(*initargs)
+
+def _merged(outputs: Iterable[Tuple[Any, dict]]) -> Iterator[Any]:
+    for result, drained in outputs:
+        telemetry.merge(drained)
+
+        yield result
+
+
+def run_parallel(jobs: Sequence[Tuple[Callable, dict]], max_workers: Union[int, None] = None) -> list[Any]:
+    """
+    ## Run Parallel
+
+    Runs independent jobs in worker processes
+    - Each job gets a fresh process, so class-level caches are never shared between jobs
+    - Functions must be defined at module level (picklable)
+    - Solver statistics recorded in the jobs are merged into this process (see telemetry.py)
+
+    Parameters
+    ----------
+    jobs : Sequence[Tuple[Callable, dict]]
+        Jobs in the form (function, keyword arguments)
+    max_workers : Union[int, None], optional
+        Maximum number of concurrent processes, by default None (number of CPUs)
+
+    Returns
+    -------
+    list[Any]
+        Return value of each job, in the same order as jobs
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=1, initializer=_init_telemetry, initargs=(None, ())) as executor:
+        futures = [executor.submit(_with_telemetry, func, **kwargs) for func, kwargs in jobs]
+
+        return list(_merged(future.result() for future in futures))
+
+
+class WorkerPool:
+    """
+    ## Worker Pool
+
+    Long-lived worker processes for mapping functions over many small work items
+    - Workers are reused between items and between map() calls, so anything the initializer loads is paid for once per process
+    - A single worker runs everything in the calling process, which keeps tracebacks and debuggers usable
+    - Functions must be defined at module level (picklable)
+    - Solver statistics recorded in the workers are merged into this process as results are returned (see telemetry.py)
+
+    Parameters
+    ----------
+    initializer : Union[Callable, None], optional
+        Function run once at the start of each worker process, by default None
+    initargs : Tuple, optional
+        Arguments passed to initializer, by default ()
+    max_workers : Union[int, None], optional
+        Maximum number of concurrent processes, by default None (number of CPUs)
+    chunksize : int, optional
+        Number of items sent to a worker at a time, by default 1
+    """
+    def __init__(self, initializer: Union[Callable, None] = None, initargs: Tuple = (), max_workers: Union[int, None] = None,
+                 chunksize: int = 1) -> None:
+        self.chunksize = chunksize
+        self.executor: Union[ProcessPoolExecutor, None] = None
+
+        if max_workers == 1:
+            if initializer is not None:
+                initializer(*initargs)
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_telemetry, initargs=(initializer, initargs))
+
+    def map(self, func: Callable, items: Iterable) -> Iterator[Any]:
+        """
+        ## Map
+
+        Applies a function to each work item
+
+        Parameters
+        ----------
+        func : Callable
+            Function applied to each item
+        items : Iterable
+            Work items
+
+        Returns
+        -------
+        Iterator[Any]
+            Return value of each item, in the same order as items
+        """
+        if self.executor is None:
+            return map(func, items)
+
+        return _merged(self.executor.map(partial(_with_telemetry, func), items, chunksize=self.chunksize))
+
+    def submit(self, func: Callable, *args: Any) -> Future:
+        """
+        ## Submit
+
+        Schedules a single call without waiting for it, for work items produced one at a time
+
+        Parameters
+        ----------
+        func : Callable
+            Function to call
+        *args : Any
+            Positional arguments passed to func
+
+        Returns
+        -------
+        Future
+            Pending return value (already resolved when running in the calling process)
+        """
+        if self.executor is None:
+            future: Future = Future()
+            future.set_result(func(*args))
+
+            return future
+
+        future = self.executor.submit(_with_telemetry, func, *args)
+        merged: Future = Future()
+
+        def merge(done: Future) -> None:
+            try:
+                merged.set_result(next(_merged([done.result()])))
+            except BaseException as error:
+                merged.set_exception(error)
+
+        future.add_done_callback(merge)
+
+        return merged
+
+    def close(self) -> None:
+        """
+        ## Close
+
+        Shuts down the worker processes
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,225 @@
+from src._3_custom_libraries.assets import file_hash
+
+from typing import Any, Sequence, Tuple, Union
+
+import numpy as np
+import hashlib
+import sqlite3
+import json
+import yaml
+import time
+import glob
+import os
+
+
+# Bumped whenever the database layout changes, older databases are cleared on open
+SCHEMA_VERSION = 2
+
+SUSPENSION_CODE_DIR = "./src/vehicle_model/suspension_model"
+
+
+def _tir_paths(node: Any) -> list[str]:
+    if not isinstance(node, dict):
+        return []
+
+    paths = [node["tir_path"]["Value"]] if isinstance(node.get("tir_path"), dict) else []
+
+    return paths + [path for value in node.values() for path in _tir_paths(value)]
+
+def model_hash(model_path: str) -> str:
+    """
+    ## Model Hash
+
+    Hashes everything a solved pose depends on, so stored poses are only reused for identical geometry and solver code
+    - The vehicle model yaml and every .tir file it references
+    - The suspension model source files
+    - The store's schema version
+
+    Parameters
+    ----------
+    model_path : str
+        Path to vehicle model yaml
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest
+    """
+    with open(model_path) as f:
+        tir_paths = sorted(set(_tir_paths(yaml.safe_load(f))))
+
+    code_paths = sorted(glob.glob(os.path.join(SUSPENSION_CODE_DIR, "**", "*.py"), recursive=True))
+
+    digest = hashlib.sha256(f"schema {SCHEMA_VERSION}".encode())
+    for path in [model_path, *tir_paths, *code_paths]:
+        digest.update(file_hash(path).encode())
+
+    return digest.hexdigest()
+
+
+class PoseStore:
+    """
+    ## Pose Store
+
+    Persistent SQLite store of solved suspension states
+    - Keyed by (model hash, solve path, hwa, heave, pitch, roll), with the pose tuple as the primary key index
+    - The solve path names how a pose was reached (e.g. "fmu", or "sweep roll 5" for a roll sweep in 5 steps), since
+      the same pose solved along different paths can settle differently
+    - States are stored as float64 blobs, with each model's state keys stored once
+
+    Parameters
+    ----------
+    path : str
+        Path to SQLite database (created if missing)
+    decimals : int, optional
+        Decimal places pose values are rounded to before keying, by default 9
+    """
+    def __init__(self, path: str, decimals: int = 9) -> None:
+        self.path = path
+        self.decimals = decimals
+
+        # Several worker processes may share the database
+        self.connection = sqlite3.connect(path, timeout=60)
+        # Switching to WAL needs an exclusive lock the busy timeout doesn't wait for, so workers opening a new database retry
+        deadline = time.monotonic() + 60
+        while self.connection.execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+            try:
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError:
+                if time.monotonic() > deadline:
+                    raise
+
+                time.sleep(0.01)
+
+        # The schema check and migration hold the write lock, so a worker can't drop tables another has just created
+        self.connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            if self.connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self.connection.execute("DROP TABLE IF EXISTS models")
+                self.connection.execute("DROP TABLE IF EXISTS poses")
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            self.connection.execute("CREATE TABLE IF NOT EXISTS models (model_hash TEXT PRIMARY KEY, keys TEXT NOT NULL)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS poses (model_hash TEXT NOT NULL, solve_path TEXT NOT NULL, hwa REAL NOT NULL, "
+                                    "heave REAL NOT NULL, pitch REAL NOT NULL, roll REAL NOT NULL, state BLOB NOT NULL, "
+                                    "PRIMARY KEY (model_hash, solve_path, hwa, heave, pitch, roll))")
+        except Exception:
+            self.connection.rollback()
+            raise
+
+        self.connection.commit()
+
+        self._keys: dict[str, Tuple[str, ...]] = {}
+
+    def _pose(self, pose: Sequence[float]) -> Tuple[float, ...]:
+        return tuple(round(float(x), self.decimals) + 0.0 for x in pose)
+
+    def _model_keys(self, model_hash: str) -> Union[Tuple[str, ...], None]:
+        if model_hash not in self._keys:
+            row = self.connection.execute("SELECT keys FROM models WHERE model_hash = ?", (model_hash,)).fetchone()
+
+            if row is None:
+                return None
+
+            self._keys[model_hash] = tuple(json.loads(row[0]))
+
+        return self._keys[model_hash]
+
+    def get(self, model_hash: str, solve_path: str, pose: Sequence[float]) -> Union[dict[str, float], None]:
+        """
+        ## Get
+
+        Gets a previously solved state
+
+        Parameters
+        ----------
+        model_hash : str
+            Hash of the vehicle model
+        solve_path : str
+            How the pose was solved
+        pose : Sequence[float]
+            Pose in the form [hwa (deg), heave (m), pitch (deg), roll (deg)]
+
+        Returns
+        -------
+        Union[dict[str, float], None]
+            Stored state, or None if the pose hasn't been solved
+        """
+        keys = self._model_keys(model_hash=model_hash)
+
+        if keys is None:
+            return None
+
+        row = self.connection.execute("SELECT state FROM poses WHERE model_hash = ? AND solve_path = ? AND hwa = ? AND heave = ? AND pitch = ? "
+                                      "AND roll = ?", (model_hash, solve_path, *self._pose(pose))).fetchone()
+
+        if row is None:
+            return None
+
+        return dict(zip(keys, np.frombuffer(row[0], dtype=np.float64).tolist()))
+
+    def put(self, model_hash: str, solve_path: str, pose: Sequence[float], state: dict[str, float]) -> None:
+        """
+        ## Put
+
+        Stores a solved state (call commit() to persist)
+
+        Parameters
+        ----------
+        model_hash : str
+            Hash of the vehicle model
+        solve_path : str
+            How the pose was solved
+        pose : Sequence[float]
+            Pose in the form [hwa (deg), heave (m), pitch (deg), roll (deg)]
+        state : dict[str, float]
+            Suspension state
+
+        Returns
+        -------
+        None
+        """
+        keys = self._model_keys(model_hash=model_hash)
+
+        if keys is None:
+            keys = tuple(state.keys())
+            self.connection.execute("INSERT OR IGNORE INTO models (model_hash, keys) VALUES (?, ?)", (model_hash, json.dumps(keys)))
+            self._keys[model_hash] = keys
+
+        values = np.array([state[key] for key in keys], dtype=np.float64)
+        self.connection.execute("INSERT OR REPLACE INTO poses (model_hash, solve_path, hwa, heave, pitch, roll, state) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                (model_hash, solve_path, *self._pose(pose), values.tobytes()))
+
+    def commit(self) -> None:
+        """
+        ## Commit
+
+        Writes pending states to disk
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.connection.commit()
+
+    def close(self) -> None:
+        """
+        ## Close
+
+        Commits pending states and closes the database
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.connection.commit()
+        self.connection.close()
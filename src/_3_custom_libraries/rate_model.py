@@ -0,0 +1,131 @@
+from numpy.polynomial import Polynomial
+from typing import Sequence, Union
+
+import numpy as np
+
+
+class RateModel:
+    """
+    ## Rate Model
+
+    Polynomial stiffness curve with closed-form force and energy
+    - rate(x) is the stiffness, force(x) its integral from 0 to x, and energy(x) the integral of force from 0 to x
+    - Antiderivatives are computed once, so every evaluation is a vectorized polynomial evaluation
+
+    Parameters
+    ----------
+    rate_poly : Polynomial
+        Stiffness as a function of displacement
+    """
+    def __init__(self, rate_poly: Polynomial) -> None:
+        self.rate_poly = rate_poly
+        self.force_poly = rate_poly.integ(lbnd=0)
+        self.energy_poly = self.force_poly.integ(lbnd=0)
+
+    @classmethod
+    def fit(cls, x: Union[np.ndarray, Sequence[float]], y: Union[np.ndarray, Sequence], deg: int = 3) -> "RateModel":
+        """
+        ## Fit
+
+        Least-squares fit of a stiffness curve
+
+        Parameters
+        ----------
+        x : Union[np.ndarray, Sequence[float]]
+            Displacements
+        y : Union[np.ndarray, Sequence]
+            Stiffness at each displacement
+        deg : int, optional
+            Polynomial degree, by default 3
+
+        Returns
+        -------
+        RateModel
+            Fitted rate model
+        """
+        return cls(rate_poly=Polynomial.fit(np.ravel(x), np.ravel(y), deg=deg).convert())
+
+    @classmethod
+    def from_motion_ratio(cls, spring_rate: float, motion_ratio: Polynomial, x: Union[np.ndarray, Sequence[float]], deg: int = 4) -> "RateModel":
+        """
+        ## From Motion Ratio
+
+        Fits the wheel rate of a spring acting through a motion ratio, k / MR(x)^2
+        - k / MR(x)^2 isn't itself a polynomial, so it's sampled over x and fitted directly
+
+        Parameters
+        ----------
+        spring_rate : float
+            Spring rate
+        motion_ratio : Polynomial
+            Spring motion ratio as a function of wheel displacement
+        x : Union[np.ndarray, Sequence[float]]
+            Wheel displacements to sample
+        deg : int, optional
+            Polynomial degree, by default 4
+
+        Returns
+        -------
+        RateModel
+            Fitted wheel rate model
+        """
+        x = np.ravel(x)
+
+        return cls.fit(x=x, y=spring_rate / motion_ratio(x)**2, deg=deg)
+
+    def rate(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        ## Rate
+
+        Stiffness at x
+
+        Parameters
+        ----------
+        x : Union[float, np.ndarray]
+            Displacement
+
+        Returns
+        -------
+        Union[float, np.ndarray]
+            Stiffness
+        """
+        return self.rate_poly(x)
+
+    def force(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        ## Force
+
+        Force at x, integrating stiffness from zero displacement
+
+        Parameters
+        ----------
+        x : Union[float, np.ndarray]
+            Displacement
+
+        Returns
+        -------
+        Union[float, np.ndarray]
+            Force
+        """
+        return self.force_poly(x)
+
+    def energy(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        ## Energy
+
+        Stored energy at x, integrating force from zero displacement
+
+        Parameters
+        ----------
+        x : Union[float, np.ndarray]
+            Displacement
+
+        Returns
+        -------
+        Union[float, np.ndarray]
+            Energy
+        """
+        return self.energy_poly(x)
+
+    def __call__(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        return self.rate(x)
@@ -0,0 +1,132 @@
+from src._3_custom_libraries.parallel import WorkerPool
+
+from matplotlib.backends.backend_pdf import PdfPages
+from concurrent.futures import Future
+from typing import Any, Callable, Sequence, Union
+from matplotlib.figure import Figure
+from pypdf import PdfWriter
+
+import matplotlib.pyplot as plt
+import tempfile
+import os
+
+
+def _write_figures(figs: Union[Figure, Sequence[Figure]], path: str) -> str:
+    # Writes figures to their own PDF, closing each as soon as it's written
+    if isinstance(figs, Figure):
+        figs = [figs]
+
+    with PdfPages(path) as pdf:
+        for fig in figs:
+            fig.savefig(pdf, format="pdf")
+            plt.close(fig)
+
+    return path
+
+def _render_page(builder: Callable[..., Union[Figure, Sequence[Figure]]], kwargs: dict, path: str) -> str:
+    return _write_figures(builder(**kwargs), path)
+
+
+class Report:
+    """
+    ## Report
+
+    PDF report assembled from pages rendered in worker processes
+    - add_page() hands a page builder to the worker pool, add_figure() writes a figure already built in this process
+    - Every page is written to its own temporary PDF and its figures are closed right away, so only pages still being drawn are held in memory
+    - close() streams the page PDFs into the report, in the order they were added
+    - Builders must be picklable (module-level functions, or methods of small objects that only hold plot data)
+
+    Parameters
+    ----------
+    save_path : str
+        Output path of the report
+    max_workers : Union[int, None], optional
+        Maximum number of rendering processes, by default None (number of CPUs)
+    """
+    def __init__(self, save_path: str, max_workers: Union[int, None] = None) -> None:
+        self.save_path = save_path
+        self.pool = WorkerPool(max_workers=max_workers)
+        self.tmp_dir = tempfile.TemporaryDirectory(prefix="report_")
+        self.pages: list[Future] = []
+
+    def _next_path(self) -> str:
+        return os.path.join(self.tmp_dir.name, f"page_{len(self.pages):04d}.pdf")
+
+    def add_page(self, builder: Callable[..., Union[Figure, Sequence[Figure]]], **kwargs: Any) -> None:
+        """
+        ## Add Page
+
+        Renders one or more pages in a worker process
+
+        Parameters
+        ----------
+        builder : Callable[..., Union[Figure, Sequence[Figure]]]
+            Function returning the page figure(s)
+        **kwargs : Any
+            Keyword arguments passed to builder
+
+        Returns
+        -------
+        None
+        """
+        self.pages.append(self.pool.submit(_render_page, builder, kwargs, self._next_path()))
+
+    def add_figure(self, figs: Union[Figure, Sequence[Figure]]) -> None:
+        """
+        ## Add Figure
+
+        Writes and closes figure(s) built in this process
+
+        Parameters
+        ----------
+        figs : Union[Figure, Sequence[Figure]]
+            Page figure(s)
+
+        Returns
+        -------
+        None
+        """
+        future: Future = Future()
+        future.set_result(_write_figures(figs, self._next_path()))
+
+        self.pages.append(future)
+
+    def close(self) -> int:
+        """
+        ## Close
+
+        Waits for outstanding pages and writes the report
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            Number of pages in the report
+        """
+        try:
+            writer = PdfWriter()
+
+            for future in self.pages:
+                writer.append(future.result())
+
+            with open(self.save_path, "wb") as f:
+                writer.write(f)
+
+            return len(writer.pages)
+        finally:
+            self.pool.close()
+            self.tmp_dir.cleanup()
+
+    def __enter__(self) -> "Report":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.pool.close()
+            self.tmp_dir.cleanup()
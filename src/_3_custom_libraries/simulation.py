@@ -1,42 +1,120 @@
 from src.vehicle_model.suspension_model.suspension_data import SuspensionData
 from src.vehicle_model.suspension_model.suspension import Suspension
+from src.vehicle_model.suspension_model.suspension_elements._2_elements.tire import Tire
 from src.vehicle_model.aero_model.aero import Aero
 
 from src._3_custom_libraries.misc_math import rotation_matrix
+from src._3_custom_libraries.assets import file_hash, load_aero, load_kin_FMU
+from src._3_custom_libraries.rate_model import RateModel
 
-from matplotlib.backends.backend_pdf import PdfPages
+from numpy.polynomial import Polynomial
 from scipy.interpolate import interp1d
-from matplotlib.figure import Figure
 from scipy.optimize import fsolve
-from scipy.integrate import quad
-from typing import Sequence
+from typing import Any, Tuple, Union
+from functools import cached_property
 from copy import deepcopy
 
 import matplotlib.pyplot as plt
 import numpy as np
 import subprocess
-import pickle
 import os
 
 
-class Simulation:
-    def __init__(self, model_path: str):
-        self.sus_data = SuspensionData(path=model_path)
-        self.sus = Suspension(sus_data=self.sus_data)
-        self.sus_copy = deepcopy(self.sus)
+# Model pieces a Simulation reads from its context, see Simulation.__getattr__()
+CONTEXT_PIECES = ("sus_data", "sus", "tires", "kin_FMU", "aero")
+RATE_MODELS = ("Fr_Kr", "Rr_Kr", "Avg_Kp", "Avg_Kh")
 
-        if not ("kin_FMU.pkl" in os.listdir("./src/simulations/kin/kin_outputs/")):
-            raise Exception("Please run SIM=kin with FMU generation enabled")
-        
-        with open("./src/simulations/kin/kin_outputs/kin_FMU.pkl", 'rb') as f:
-            self.kin_FMU = pickle.load(f)
-        
-        self.initialize_funcs()
+# Jounce (m) and roll (deg) sweeps the stiffness and motion ratio fits are made over
+JOUNCE_SWEEP = np.linspace(-5, 5, 20) * 0.0254
+ROLL_SWEEP = np.linspace(-5, 5, 20)
+
+
+class SimulationContext:
+    """
+    ## Simulation Context
+
+    Vehicle model pieces shared by simulations, each built the first time it is read
+    - Geometry (SuspensionData and the Suspension built from it, which loads the tire models), the kinematics FMU,
+      modal stiffness, motion ratio, and wheel rate fits, and the aero map
+    - One context can back every simulation of a model in the same process (see shared()), so chained simulations pay setup once
+    - Shared pieces must be treated as read-only, simulations that move the suspension work on copy_suspension()
+
+    Parameters
+    ----------
+    model_path : str
+        Path to vehicle model yaml
+    """
+    # Contexts handed out by shared(), keyed by (absolute path, content hash)
+    _shared: dict[Tuple[str, str], "SimulationContext"] = {}
+
+    def __init__(self, model_path: str) -> None:
+        self.model_path = model_path
+
+    @classmethod
+    def shared(cls, model_path: str) -> "SimulationContext":
+        """
+        ## Shared
+
+        Returns the process-wide context of a vehicle model, creating it on the first request
+        - Keyed by the yaml's content hash, so an edited model gets a fresh context
+        - Worker processes forked after a piece was loaded inherit it
+
+        Parameters
+        ----------
+        model_path : str
+            Path to vehicle model yaml
+
+        Returns
+        -------
+        SimulationContext
+            Shared context
+        """
+        key = (os.path.abspath(model_path), file_hash(model_path))
+
+        if key not in cls._shared:
+            cls._shared[key] = cls(model_path=model_path)
+
+        return cls._shared[key]
+
+    @cached_property
+    def sus_data(self) -> SuspensionData:
+        return SuspensionData(path=self.model_path)
 
-    def initialize_funcs(self) -> None:
+    @cached_property
+    def sus(self) -> Suspension:
+        return Suspension(sus_data=self.sus_data)
+
+    @cached_property
+    def tires(self) -> dict[str, Tire]:
+        return {corner: getattr(self.sus, f"{corner}_quarter_car").tire for corner in ["FL", "FR", "RL", "RR"]}
+
+    @cached_property
+    def kin_FMU(self) -> dict:
+        return load_kin_FMU()
+
+    @cached_property
+    def aero(self) -> Aero:
+        return load_aero()
+
+    @cached_property
+    def rate_models(self) -> dict[str, RateModel]:
+        """
+        ## Rate Models
+
+        Cubic fits of the front and rear roll stiffness, pitch stiffness, and heave stiffness from the kinematics FMU
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict[str, RateModel]
+            Fits keyed by "Fr_Kr", "Rr_Kr", "Avg_Kp", and "Avg_Kh"
+        """
         # Initialize sweeps
-        jounce_sweep = np.linspace(-5, 5, 20) * 0.0254
-        roll_sweep = np.linspace(-5, 5, 20)
+        jounce_sweep = JOUNCE_SWEEP
+        roll_sweep = ROLL_SWEEP
         pitch_sweep = np.linspace(-5, 5, 20)
 
         # Sweep to create arrays of modal stiffnesses
@@ -52,17 +130,136 @@ class Simulation:
         Avg_Kh = np.array(FL_wheelrate) + np.array(FR_wheelrate) + np.array(RL_wheelrate) + np.array(RR_wheelrate)
 
         # Create cubic fits from previous arrays
-        Fr_Kr_coeffs = np.polyfit(roll_sweep, Fr_Krs, deg=3).T[0]
-        Rr_Kr_coeffs = np.polyfit(roll_sweep, Rr_Krs, deg=3).T[0]
-        Avg_Kp_coeffs = np.polyfit(pitch_sweep, Avg_Kps, deg=3).T[0]
-        Avg_Kh_coeffs = np.polyfit(jounce_sweep, Avg_Kh, deg=3).T[0]
-
-        # Represent cubic fits as lambda functions
-        self.Fr_Kr = lambda x: sum([Fr_Kr_coeffs[i] * x**(3 - i) for i in range(4)])
-        self.Rr_Kr = lambda x: sum([Rr_Kr_coeffs[i] * x**(3 - i) for i in range(4)])
-        self.Avg_Kp = lambda x: sum([Avg_Kp_coeffs[i] * x**(3 - i) for i in range(4)])
-        self.Avg_Kh = lambda x: sum([Avg_Kh_coeffs[i] * x**(3 - i) for i in range(4)])
-    
+        return {"Fr_Kr": RateModel.fit(roll_sweep, Fr_Krs, deg=3),
+                "Rr_Kr": RateModel.fit(roll_sweep, Rr_Krs, deg=3),
+                "Avg_Kp": RateModel.fit(pitch_sweep, Avg_Kps, deg=3),
+                "Avg_Kh": RateModel.fit(jounce_sweep, Avg_Kh, deg=3)}
+
+    @cached_property
+    def motion_ratios(self) -> dict[str, Polynomial]:
+        """
+        ## Motion Ratios
+
+        Cubic fits of each corner's spring motion ratio over jounce and each axle's stabar motion ratio over roll, from the kinematics FMU
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict[str, Polynomial]
+            Fits keyed by "<corner>_spring" and "<Fr/Rr>_stabar"
+        """
+        fits = {}
+
+        for corner in ["FL", "FR", "RL", "RR"]:
+            spring_MRs = [self.kin_FMU[f"{corner}_bump_spring_MR"](np.array([0, jounce, 0, 0])) for jounce in JOUNCE_SWEEP]
+            fits[f"{corner}_spring"] = Polynomial.fit(JOUNCE_SWEEP, np.ravel(spring_MRs), deg=3).convert()
+
+        for axle in ["Fr", "Rr"]:
+            stabar_MRs = [self.kin_FMU[f"{axle}_roll_stabar_MR"](np.array([0, 0, 0, roll])) for roll in ROLL_SWEEP]
+            fits[f"{axle}_stabar"] = Polynomial.fit(ROLL_SWEEP, np.ravel(stabar_MRs), deg=3).convert()
+
+        return fits
+
+    @cached_property
+    def wheel_rates(self) -> dict[str, RateModel]:
+        """
+        ## Wheel Rates
+
+        Wheel rate of each corner (spring rate / MR^2), whose closed-form integrals give the elastic load transfer
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict[str, RateModel]
+            Wheel rates keyed by corner
+        """
+        return {corner: RateModel.from_motion_ratio(spring_rate=getattr(self.sus, f"{corner}_quarter_car").push_pull_rod.spring.compliance,
+                                                    motion_ratio=self.motion_ratios[f"{corner}_spring"], x=JOUNCE_SWEEP)
+                for corner in ["FL", "FR", "RL", "RR"]}
+
+    def preload(self, *names: str) -> None:
+        """
+        ## Preload
+
+        Builds pieces ahead of first use, e.g. before starting a worker pool so forked workers inherit them
+
+        Parameters
+        ----------
+        *names : str
+            Piece names, e.g. "sus", "kin_FMU"
+
+        Returns
+        -------
+        None
+        """
+        for name in names:
+            getattr(self, name)
+
+    def copy_suspension(self) -> Suspension:
+        """
+        ## Copy Suspension
+
+        Deep copy of the shared suspension, safe to move
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Suspension
+            Suspension copy
+        """
+        # Tire models are shared read-only assets, so the copy keeps the same instances
+        tire_models = [tire.tire for tire in self.tires.values()]
+
+        return deepcopy(self.sus, memo={id(tire_model): tire_model for tire_model in tire_models})
+
+
+class Simulation:
+    """
+    ## Simulation
+
+    Base class of the simulations run by kernel.py
+    - Model pieces (sus_data, sus, kin_FMU, aero, tires, and the Fr_Kr, Rr_Kr, Avg_Kp, and Avg_Kh fits) are read from
+      the context on first use, so a simulation only pays for what it touches
+    - sus_copy is a private copy of the suspension, made on first use
+
+    Parameters
+    ----------
+    model_path : str
+        Path to vehicle model yaml
+    context : Union[SimulationContext, None], optional
+        Context to share with other simulations, by default the process-wide context of model_path
+    """
+    def __init__(self, model_path: str, context: Union[SimulationContext, None] = None):
+        self.context = context if context is not None else SimulationContext.shared(model_path=model_path)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the simulation doesn't set itself
+        context = self.__dict__.get("context")
+
+        if context is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        if name == "sus_copy":
+            self.sus_copy = context.copy_suspension()
+            return self.sus_copy
+
+        if name in CONTEXT_PIECES:
+            return getattr(context, name)
+
+        if name in RATE_MODELS:
+            return context.rate_models[name]
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def get_git_username(self):
         try:
             name = subprocess.check_output(
@@ -80,11 +277,3 @@ class Simulation:
             return name if name else "Unknown"
         except Exception:
             return "Unknown"
-
-    def _generate_pdf(self, figs: Sequence[Figure], save_path: str) -> Figure:
-        p = PdfPages(save_path)
-
-        for page in figs:
-            page.savefig(p, format="pdf")
-
-        p.close()
\ No newline at end of file
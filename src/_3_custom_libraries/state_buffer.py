@@ -0,0 +1,113 @@
+from typing import Sequence, Union
+
+import numpy as np
+
+
+class StateBuffer:
+    """
+    ## State Buffer
+
+    Preallocated float64 table of suspension states, one row per evaluated pose
+    - Optionally backed by a memory-mapped .npy file for very large grids
+
+    Parameters
+    ----------
+    keys : Sequence[str]
+        State keys, defining the column order of the buffer
+    n_points : int
+        Number of poses (rows) to allocate
+    memmap_path : Union[str, None], optional
+        File path for a memory-mapped buffer, by default None (in-memory)
+    """
+    def __init__(self, keys: Sequence[str], n_points: int, memmap_path: Union[str, None] = None) -> None:
+        self.keys = list(keys)
+        self.n_points = n_points
+        self.memmap_path = memmap_path
+
+        self.columns: dict[str, int] = {key: index for index, key in enumerate(self.keys)}
+
+        if memmap_path:
+            self.data = np.lib.format.open_memmap(memmap_path, mode="w+", dtype=np.float64, shape=(n_points, len(self.keys)))
+        else:
+            self.data = np.empty((n_points, len(self.keys)), dtype=np.float64)
+
+    def write(self, index: int, state: dict[str, float]) -> None:
+        """
+        ## Write
+
+        Writes a pose's state vector into its row in place
+
+        Parameters
+        ----------
+        index : int
+            Row index of the pose
+        state : dict[str, float]
+            Suspension state, containing every key in the buffer
+
+        Returns
+        -------
+        None
+        """
+        row = self.data[index]
+
+        for column, key in enumerate(self.keys):
+            row[column] = state[key]
+
+    def column(self, key: str, shape: Union[Sequence[int], None] = None) -> np.ndarray:
+        """
+        ## Column
+
+        Gets all values of a single state key
+
+        Parameters
+        ----------
+        key : str
+            State key
+        shape : Union[Sequence[int], None], optional
+            Shape to reshape the column into, by default None (flat)
+
+        Returns
+        -------
+        np.ndarray
+            Contiguous array of the state's values
+        """
+        values = np.ascontiguousarray(self.data[:, self.columns[key]])
+
+        if shape is not None:
+            return values.reshape(shape)
+
+        return values
+
+    def flush(self) -> None:
+        """
+        ## Flush
+
+        Writes memory-mapped buffers to disk (no-op for in-memory buffers)
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+
+    def close(self) -> None:
+        """
+        ## Close
+
+        Releases the buffer, unmapping its memory-mapped file so the file can be deleted
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.flush()
+        self.data = np.empty((0, len(self.keys)), dtype=np.float64)
@@ -0,0 +1,220 @@
+from scipy.optimize import fsolve as _fsolve # type: ignore
+from typing import Any, Callable, Sequence, Union
+
+import numpy as np
+import threading
+import json
+import time
+import os
+
+
+# Per-process solver statistics keyed by site, and YMD failure maps keyed by grid name
+# Worker processes drain() theirs after every work item so the parent can merge() them (see parallel.py)
+_sites: dict[str, dict[str, float]] = {}
+_failures: dict[str, list[dict]] = {}
+_lock = threading.Lock()
+
+STAT_NAMES = ("calls", "converged", "failed", "nfev", "wall_time")
+
+
+def record(site: str, nfev: int, wall_time: float, converged: Union[bool, int], calls: int = 1) -> None:
+    """
+    ## Record
+
+    Adds solver calls to a site's statistics
+
+    Parameters
+    ----------
+    site : str
+        Solver site name, e.g. "QuarterCar._update_geometry"
+    nfev : int
+        Residual function evaluations
+    wall_time : float
+        Wall time in seconds
+    converged : Union[bool, int]
+        Whether the call converged, or the number of converged calls when recording several at once
+    calls : int, optional
+        Number of solver calls, by default 1
+
+    Returns
+    -------
+    None
+    """
+    with _lock:
+        stats = _sites.setdefault(site, dict.fromkeys(STAT_NAMES, 0))
+        stats["calls"] += calls
+        stats["converged"] += int(converged)
+        stats["failed"] += calls - int(converged)
+        stats["nfev"] += int(nfev)
+        stats["wall_time"] += wall_time
+
+def fsolve(site: str, func: Callable, x0: Any, args: Sequence = (), full_output: bool = False, **kwargs: Any) -> Any:
+    """
+    ## fsolve
+
+    scipy.optimize.fsolve, recorded under a solver site
+
+    Parameters
+    ----------
+    site : str
+        Solver site name
+    func : Callable
+        Residual function
+    x0 : Any
+        Initial guess
+    args : Sequence, optional
+        Extra arguments to func, by default ()
+    full_output : bool, optional
+        Return (x, infodict, ier, mesg) instead of x, by default False
+    **kwargs : Any
+        Passed to scipy.optimize.fsolve
+
+    Returns
+    -------
+    Any
+        Same as scipy.optimize.fsolve
+    """
+    start = time.perf_counter()
+    output = _fsolve(func, x0=x0, args=tuple(args), full_output=True, **kwargs)
+    record(site=site, nfev=output[1]["nfev"], wall_time=time.perf_counter() - start, converged=output[2] == 1)
+
+    return output if full_output else output[0]
+
+def record_failures(name: str, points: list[dict]) -> None:
+    """
+    ## Record Failures
+
+    Stores the unconverged points of a solved grid
+
+    Parameters
+    ----------
+    name : str
+        Grid name, e.g. "CV 15.0"
+    points : list[dict]
+        Unconverged points, e.g. {"hwa": ..., "beta": ...}
+
+    Returns
+    -------
+    None
+    """
+    with _lock:
+        _failures[name] = list(points)
+
+def drain() -> dict[str, dict]:
+    """
+    ## Drain
+
+    Returns and clears this process's statistics
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    dict[str, dict]
+        Site statistics and failure maps, in the form accepted by merge()
+    """
+    global _sites, _failures
+
+    with _lock:
+        drained: dict[str, dict] = {"sites": _sites, "failures": _failures}
+        _sites, _failures = {}, {}
+
+    return drained
+
+def merge(drained: dict[str, dict]) -> None:
+    """
+    ## Merge
+
+    Adds statistics drained from another process
+
+    Parameters
+    ----------
+    drained : dict[str, dict]
+        Output of drain()
+
+    Returns
+    -------
+    None
+    """
+    with _lock:
+        for site, stats in drained["sites"].items():
+            totals = _sites.setdefault(site, dict.fromkeys(STAT_NAMES, 0))
+            for key in STAT_NAMES:
+                totals[key] += stats[key]
+
+        _failures.update(drained["failures"])
+
+def reset() -> None:
+    """
+    ## Reset
+
+    Clears this process's statistics
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+    drain()
+
+def summary() -> dict[str, dict]:
+    """
+    ## Summary
+
+    Statistics of every solver site, with per-call averages, and the failure maps of every grid
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    dict[str, dict]
+        {"sites": {site: stats}, "failures": {grid name: points}}
+    """
+    with _lock:
+        sites = {}
+        for site, stats in sorted(_sites.items()):
+            calls = max(stats["calls"], 1)
+            sites[site] = {**stats,
+                           "mean_nfev": stats["nfev"] / calls,
+                           "mean_time": stats["wall_time"] / calls,
+                           "failure_rate": stats["failed"] / calls}
+
+        return {"sites": sites, "failures": {name: list(points) for name, points in _failures.items()}}
+
+def write_summary(path: str) -> dict[str, dict]:
+    """
+    ## Write Summary
+
+    Writes summary() to a JSON file and prints one line per solver site
+
+    Parameters
+    ----------
+    path : str
+        Output path
+
+    Returns
+    -------
+    dict[str, dict]
+        Summary that was written
+    """
+    data = summary()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4, default=lambda x: x.item() if isinstance(x, np.generic) else str(x))
+
+    for site, stats in data["sites"].items():
+        print(f"  {site}: {stats['calls']} calls, {stats['failed']} unconverged, {stats['nfev']} evaluations, {stats['wall_time']:.2f}s")
+
+    n_failed = sum(len(points) for points in data["failures"].values())
+    if n_failed:
+        print(f"  {n_failed} unconverged YMD points, see {path}")
+
+    return data
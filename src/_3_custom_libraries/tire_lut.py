@@ -0,0 +1,352 @@
+from src._3_custom_libraries.assets import file_hash
+
+from scipy.interpolate import RegularGridInterpolator # type: ignore
+from typing import Any, Sequence, Tuple, Union
+
+import numpy as np
+import itertools
+import hashlib
+import json
+import os
+
+
+# Tables are cached in this folder next to their .tir file, which make sim copies back out of the container
+TIRE_LUT_DIRNAME = "tire_luts"
+LOAD_NAMES = ("Fx", "Fy", "Fz", "Mx", "My", "Mz")
+AXIS_NAMES = ("FZ", "alpha", "kappa", "gamma")
+
+
+def tire_model_eval_many(tire: Any, FZ: np.ndarray, alpha: np.ndarray, kappa: np.ndarray, gamma: np.ndarray,
+                         vectorized: Union[bool, None] = None) -> Tuple[np.ndarray, bool]:
+    """
+    ## Tire Model Evaluate Many
+
+    Evaluates a tire model at many operating points, in one array call if the model accepts arrays
+    - Falls back to one tire_eval() per point otherwise
+
+    Parameters
+    ----------
+    tire : Any
+        Tire model with an MF52 style tire_eval()
+    FZ : np.ndarray
+        Normal loads in N, shape (N,)
+    alpha : np.ndarray
+        Slip angles in radians, shape (N,)
+    kappa : np.ndarray
+        Slip ratios, shape (N,)
+    gamma : np.ndarray
+        Inclination angles in radians, shape (N,)
+    vectorized : Union[bool, None], optional
+        Result of an earlier call, where False skips the array call, by default None (try it)
+
+    Returns
+    -------
+    Tuple[np.ndarray, bool]
+        Loads in the form [Fx, Fy, Fz, Mx, My, Mz], shape (N, 6), and whether the array call worked
+    """
+    if vectorized is not False:
+        try:
+            output = tire.tire_eval(FZ=FZ, alpha=alpha, kappa=kappa, gamma=gamma)
+            loads = np.array(np.broadcast_arrays(*[np.asarray(load, dtype=float) for load in output]))
+        except (TypeError, ValueError):
+            loads = np.empty(0)
+
+        if loads.shape == (6, len(FZ)):
+            return loads.T, True
+
+    loads = np.array([tire.tire_eval(FZ=fz, alpha=a, kappa=k, gamma=g) for fz, a, k, g in zip(FZ, alpha, kappa, gamma)], dtype=float)
+
+    return loads.reshape((-1, 6)), False
+
+
+class TireLUT:
+    """
+    ## Tire LUT
+
+    Tire loads tabulated on a regular (FZ, alpha, kappa, gamma) grid, used in place of the exact tire model
+    - tire_eval() matches the MF52 signature and accepts scalars or arrays, so Tire.tire_eval_many() is a single table lookup
+    - Multilinear lookup is done directly on the flattened table, which keeps the per-call cost low for the handful of points a residual needs
+    - Queries outside the grid are clamped to its bounds
+
+    Parameters
+    ----------
+    tire_name : str
+        Name of the tabulated tire
+    axes : Sequence[np.ndarray]
+        Grid of FZ (N), alpha (rad), kappa, and gamma (rad)
+    loads : np.ndarray
+        Loads in the form [Fx, Fy, Fz, Mx, My, Mz] at every grid point, shape (n_FZ, n_alpha, n_kappa, n_gamma, 6)
+    method : str, optional
+        Interpolation method, "linear" (multilinear) or a RegularGridInterpolator spline ("cubic", "pchip"), by default "linear"
+    """
+    def __init__(self, tire_name: str, axes: Sequence[np.ndarray], loads: np.ndarray, method: str = "linear") -> None:
+        self.tire_name = tire_name
+        self.axes = [np.asarray(axis, dtype=float) for axis in axes]
+        self.loads = np.asarray(loads, dtype=float)
+        self.method = method
+
+        self.lower = np.array([axis[0] for axis in self.axes])
+        self.upper = np.array([axis[-1] for axis in self.axes])
+
+        # Multilinear lookup gathers the 16 cell corners from the flattened table, splines go through scipy
+        sizes = np.array(self.loads.shape[:4])
+        strides = np.array([int(np.prod(sizes[i + 1:])) for i in range(4)])
+        corners = np.array(list(itertools.product((0, 1), repeat=4)))
+
+        self.flat_loads = self.loads.reshape((-1, 6))
+        self.strides = strides
+        self.corner_bits = corners
+        self.corner_offsets = corners @ (strides * (sizes > 1))
+
+        if method != "linear":
+            self.interp = RegularGridInterpolator(self.axes, self.loads, method=method)
+
+    @classmethod
+    def build(cls, tire: Any, tire_name: str, axes: Sequence[np.ndarray], method: str = "linear") -> "TireLUT":
+        """
+        ## Build
+
+        Tabulates an exact tire model over a grid
+
+        Parameters
+        ----------
+        tire : Any
+            Tire model exposing tire_eval(FZ, alpha, kappa, gamma), e.g. MF52
+        tire_name : str
+            Name of the tabulated tire
+        axes : Sequence[np.ndarray]
+            Grid of FZ (N), alpha (rad), kappa, and gamma (rad)
+        method : str, optional
+            Interpolation method, by default "linear"
+
+        Returns
+        -------
+        TireLUT
+            Lookup table of the tire model
+        """
+        grid = np.meshgrid(*axes, indexing="ij")
+        loads, _ = tire_model_eval_many(tire, *[axis.ravel() for axis in grid])
+
+        return cls(tire_name=tire_name, axes=axes, loads=loads.reshape(grid[0].shape + (6,)), method=method)
+
+    def lookup(self, points: np.ndarray) -> np.ndarray:
+        """
+        ## Lookup
+
+        Interpolates the table at points inside the grid
+
+        Parameters
+        ----------
+        points : np.ndarray
+            (FZ, alpha, kappa, gamma) of each point, shape (N, 4)
+
+        Returns
+        -------
+        np.ndarray
+            Loads in the form [Fx, Fy, Fz, Mx, My, Mz], shape (N, 6)
+        """
+        if self.method != "linear":
+            return self.interp(points)
+
+        base = np.zeros(len(points), dtype=int)
+        fractions = np.zeros(points.shape)
+
+        for i, axis in enumerate(self.axes):
+            if len(axis) == 1:
+                continue
+
+            cell = np.clip(np.searchsorted(axis, points[:, i], side="right") - 1, 0, len(axis) - 2)
+            fractions[:, i] = (points[:, i] - axis[cell]) / (axis[cell + 1] - axis[cell])
+            base += cell * self.strides[i]
+
+        # Weight of each cell corner, shape (N, 16)
+        weights = np.prod(np.where(self.corner_bits[None, :, :], fractions[:, None, :], 1 - fractions[:, None, :]), axis=2)
+
+        return np.einsum("nk,nkl->nl", weights, self.flat_loads[base[:, None] + self.corner_offsets[None, :]])
+
+    def tire_eval(self, FZ: Union[float, np.ndarray], alpha: Union[float, np.ndarray], kappa: Union[float, np.ndarray],
+                  gamma: Union[float, np.ndarray]) -> list:
+        """
+        ## Tire Evaluate
+
+        Looks up tire loads
+
+        Parameters
+        ----------
+        FZ : Union[float, np.ndarray]
+            Normal load in N
+        alpha : Union[float, np.ndarray]
+            Slip angle in radians
+        kappa : Union[float, np.ndarray]
+            Slip ratio
+        gamma : Union[float, np.ndarray]
+            Inclination angle in radians
+
+        Returns
+        -------
+        list
+            Loads in the form [Fx, Fy, Fz, Mx, My, Mz], floats for scalar inputs and arrays of the broadcast input shape otherwise
+        """
+        coords = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (FZ, alpha, kappa, gamma)])
+        shape = coords[0].shape
+
+        points = np.clip(np.column_stack([np.ravel(x) for x in coords]), self.lower, self.upper)
+        loads = self.lookup(points)
+
+        if not shape:
+            return [float(load) for load in loads[0]]
+
+        return [load.reshape(shape) for load in loads.T]
+
+    def validate(self, tire: Any, n_samples: int = 2000, seed: int = 0) -> dict[str, dict[str, float]]:
+        """
+        ## Validate
+
+        Compares the table against the exact tire model at random points inside the grid
+
+        Parameters
+        ----------
+        tire : Any
+            Exact tire model the table was built from
+        n_samples : int, optional
+            Number of sample points, by default 2000
+        seed : int, optional
+            Random seed, by default 0
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            Error of each load, keyed by load name
+            - max: largest absolute error
+            - rms: root mean square error
+            - max_rel: largest absolute error relative to the load's peak magnitude over the grid
+        """
+        rng = np.random.default_rng(seed)
+        points = rng.uniform(self.lower, self.upper, size=(n_samples, 4))
+
+        exact, _ = tire_model_eval_many(tire, *points.T)
+        error = np.abs(self.lookup(points) - exact)
+        scale = np.max(np.abs(self.loads.reshape((-1, 6))), axis=0)
+
+        report = {}
+        for i, name in enumerate(LOAD_NAMES):
+            report[name] = {"max": float(error[:, i].max()),
+                            "rms": float(np.sqrt(np.mean(error[:, i]**2))),
+                            "max_rel": float(error[:, i].max() / scale[i]) if scale[i] > 0 else 0.0}
+
+        return report
+
+    def save(self, path: str) -> None:
+        """
+        ## Save
+
+        Saves the table to an .npz file
+
+        Parameters
+        ----------
+        path : str
+            Output path
+
+        Returns
+        -------
+        None
+        """
+        arrays: dict[str, Any] = {"tire_name": np.array(self.tire_name), "loads": self.loads, **dict(zip(AXIS_NAMES, self.axes))}
+
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str, method: str = "linear") -> "TireLUT":
+        """
+        ## Load
+
+        Loads a table saved with save()
+
+        Parameters
+        ----------
+        path : str
+            Path to .npz file
+        method : str, optional
+            Interpolation method, by default "linear"
+
+        Returns
+        -------
+        TireLUT
+            Loaded table
+        """
+        with np.load(path) as f:
+            return cls(tire_name=str(f["tire_name"]), axes=[f[name] for name in AXIS_NAMES], loads=f["loads"], method=method)
+
+
+def grid_axes(grid: Sequence[Tuple[float, float, int]]) -> list[np.ndarray]:
+    """
+    ## Grid Axes
+
+    Builds the table axes from (min, max, count) per axis, with alpha and gamma given in degrees
+
+    Parameters
+    ----------
+    grid : Sequence[Tuple[float, float, int]]
+        (min, max, count) of FZ (N), alpha (deg), kappa, and gamma (deg)
+
+    Returns
+    -------
+    list[np.ndarray]
+        Grid of FZ (N), alpha (rad), kappa, and gamma (rad)
+    """
+    if len(grid) != 4:
+        raise Exception("Tire LUT grid must give (min, max, count) for FZ, alpha, kappa, and gamma")
+
+    scales = (1, np.pi / 180, 1, np.pi / 180)
+
+    return [np.linspace(low, high, int(count)) * scale for (low, high, count), scale in zip(grid, scales)]
+
+
+def cached_tire_lut(tire: Any, tir_path: str, grid: Sequence[Tuple[float, float, int]], method: str = "linear",
+                    cache_dir: Union[str, None] = None) -> TireLUT:
+    """
+    ## Cached Tire LUT
+
+    Loads the lookup table of a .tir file from disk, building it (and its validation report) on the first request
+    - Cached as <cache_dir>/<tire name>_<hash>.npz, keyed by the .tir contents and the grid, so an edited .tir file or grid is rebuilt
+    - The validation report of each interpolation method (see TireLUT.validate()) is saved next to the table as <tire name>_<hash>_<method>.json
+
+    Parameters
+    ----------
+    tire : Any
+        Exact tire model loaded from tir_path
+    tir_path : str
+        Path to .tir file
+    grid : Sequence[Tuple[float, float, int]]
+        (min, max, count) of FZ (N), alpha (deg), kappa, and gamma (deg)
+    method : str, optional
+        Interpolation method, by default "linear"
+    cache_dir : Union[str, None], optional
+        Cache directory, by default the TIRE_LUT_DIRNAME folder next to the .tir file
+
+    Returns
+    -------
+    TireLUT
+        Lookup table of the tire model
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(tir_path), TIRE_LUT_DIRNAME)
+
+    tire_name = os.path.splitext(os.path.basename(tir_path))[0]
+    key = hashlib.sha256(f"{file_hash(tir_path)} {[list(axis) for axis in grid]}".encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"{tire_name}_{key}")
+
+    if os.path.exists(path + ".npz"):
+        lut = TireLUT.load(path + ".npz", method=method)
+    else:
+        lut = TireLUT.build(tire=tire, tire_name=tire_name, axes=grid_axes(grid), method=method)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        lut.save(path + ".npz")
+
+    report_path = f"{path}_{method}.json"
+    if not os.path.exists(report_path):
+        with open(report_path, "w") as f:
+            json.dump(lut.validate(tire=tire), f, indent=4)
+
+    return lut
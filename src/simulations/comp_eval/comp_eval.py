@@ -1,5 +1,6 @@
 
 from src._3_custom_libraries.simulation import Simulation
+from src._3_custom_libraries.report import Report
 from datetime import datetime
 from PIL import Image
 
@@ -36,19 +37,14 @@ class CompEval(Simulation):
         print(f"    Time: {self.skidpad_results['time']:.3f}s, {self.skidpad_results['lat_g']:.2f}G")
 
         print("\nGenerating PDF report...")
-        plots = []
+        report = Report(save_path="./src/simulations/comp_eval/comp_eval_outputs/comp_eval_report.pdf")
 
+        # Pages are written and closed one at a time
+        for plot in (self.plot_title_page, self.plot_ggv_surface, self.plot_gg_envelopes, self.plot_summary, self.plot_acceleration,
+                     self.plot_skidpad):
+            report.add_figure(plot())
 
-        plots.append(self.plot_title_page())
-
-        plots.append(self.plot_ggv_surface())
-        plots.append(self.plot_gg_envelopes())
-
-        plots.append(self.plot_summary())
-        plots.append(self.plot_acceleration())
-        plots.append(self.plot_skidpad())
-
-        self._generate_pdf(figs=plots, save_path="./src/simulations/comp_eval/comp_eval_outputs/comp_eval_report.pdf")
+        report.close()
         print("\n✓ Done! Report saved: ./src/simulations/comp_eval/comp_eval_outputs/comp_eval_report.pdf")
 
         with open("./src/simulations/comp_eval/comp_eval_outputs/debug.txt", "w") as f:
@@ -1,7 +1,12 @@
 from src.vehicle_model.suspension_model.suspension_data import SuspensionData
 from src.vehicle_model.suspension_model.suspension import Suspension
 from src._3_custom_libraries.simulation import Simulation
-from src._3_custom_libraries.cache import SISO_global_cache, SISO_local_cache
+from src._3_custom_libraries.cache import LRU_state_cache, set_key_tolerance
+from src._3_custom_libraries.parallel import run_parallel
+from src._3_custom_libraries.report import Report
+from src._3_custom_libraries.pose_store import PoseStore, model_hash
+from src._3_custom_libraries.state_buffer import StateBuffer
+from src._3_custom_libraries.assets import load_kin_FMU
 
 from typing import Callable, Sequence, MutableSequence, Set, Tuple
 from scipy.interpolate import RegularGridInterpolator
@@ -14,12 +19,16 @@ import matplotlib.gridspec as gridspec
 import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 import numpy as np
+import tempfile
 import tzlocal
 import pickle
 import yaml
+import os
 
 from copy import deepcopy
 
+POSE_STORE_PATH = "./src/simulations/kin/kin_outputs/kin_poses.db"
+
 
 class Kinematics(Simulation):
     def __init__(self, model_path: str, comparison_paths: Sequence[str]):
@@ -28,8 +37,6 @@ class Kinematics(Simulation):
         self.sus_copy = deepcopy(self.sus)
 
         self.comparison_data: MutableSequence[SuspensionData] = [SuspensionData(path=path) for path in comparison_paths]
-        self.comparison_sus: MutableSequence[Suspension] = [Suspension(sus_data=sus_data) for sus_data in self.comparison_data]
-        self.comparison_sus_copy = [deepcopy(comparison_sus) for comparison_sus in self.comparison_sus]
 
         roll_n_steps = 1
 
@@ -38,63 +45,50 @@ class Kinematics(Simulation):
                 self.plot_config: dict[str, dict[str, dict]] = yaml.safe_load(f)
                 self.FMU_config: dict[str, dict] = self.plot_config.pop("FMU Settings")
                 self.fit_config: dict[str, dict] = self.plot_config.pop("Fit Settings")
+                self.parallel_config: dict[str, dict] = self.plot_config.pop("Parallel Settings")
+                self.cache_config: dict[str, dict] = self.plot_config.pop("Cache Settings")
             except yaml.YAMLError as error:
                 print("Failed to import yaml file. Reason:\n")
                 print(error)
 
-        # Generate FMU
+        # Generate plots (from FMU and kin model)
+        self.outputs: Set[str] = set([key[key.index("_") + 1:] for key in self.sus.state.keys()])
+        sweeps = self._collect_sweeps()
+
+        # FMU-only reports skip the suspension sweeps (FMU exists for the baseline model only)
+        if self.FMU_config["Report From FMU"] and len(comparison_paths) > 0:
+            print("FMU-only report selected, comparison models will not be plotted")
+            comparison_paths = []
+            self.comparison_data = []
+
+        # Evaluate FMU generation and each model's sweeps in separate processes
+        # FMU generation is submitted first since it's the longest job
+        jobs = []
+
         if self.FMU_config["Generate"]:
-            FMU_refinement = self.FMU_config["Refinement"]
-            
-            # Sweeps
-            hwa_sweep = np.linspace(-self.FMU_config["Hwa Sweep"], self.FMU_config["Hwa Sweep"], FMU_refinement)
-            heave_sweep = np.linspace(-self.FMU_config["Heave Sweep"], self.FMU_config["Heave Sweep"], FMU_refinement) * 0.0254
-            pitch_sweep = np.linspace(-self.FMU_config["Pitch Sweep"], self.FMU_config["Pitch Sweep"], FMU_refinement)
-            roll_sweep = np.linspace(-self.FMU_config["Roll Sweep"], self.FMU_config["Roll Sweep"], FMU_refinement)
+            jobs.append((_generate_FMU, {"model_path": model_path, "FMU_config": self.FMU_config, "cache_config": self.cache_config}))
 
-            state_tracking: dict[str, MutableSequence] = {x: [] for x in self.sus_copy.state.keys()}
-            
-            eval_num = 0
-            total_evals = FMU_refinement**4 + FMU_refinement**4 * len(comparison_paths)
+        if not self.FMU_config["Report From FMU"]:
+            jobs += [(_evaluate_sweeps, {"model_path": path, "sweeps": sweeps, "roll_n_steps": roll_n_steps, "cache_config": self.cache_config}) \
+                     for path in [model_path, *comparison_paths]]
 
-            for hwa in hwa_sweep:
-                for heave in heave_sweep:
-                    for pitch in pitch_sweep:
-                        for roll in roll_sweep:
-                            eval_num += 1
-                            print(f"FMU Generation Progress: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
+        if len(jobs) > 0:
+            print(f"Evaluating {len(jobs)} job(s) in parallel")
+            results = run_parallel(jobs=jobs, max_workers=self.parallel_config["Max Workers"])
 
-                            self.sus_copy = deepcopy(self.sus)
-                            self.sus_copy.steer(hwa=hwa)
-                            self.sus_copy.heave(heave=heave)
-                            self.sus_copy.pitch(pitch=pitch)
-                            self.sus_copy.roll(roll=roll)
-
-                            for key in self.sus_copy.state.keys():
-                                state_tracking[key].append(float(self.sus_copy.state[key]))
-                                
-                            
-                            self.sus_copy = deepcopy(self.sus)
+        self.FMU_tables: dict[Tuple, dict[str, np.ndarray]] = {}
 
-            FMU_fits: dict[str, RegularGridInterpolator] = {}
-            
-            for key in state_tracking.keys():
-                output_state = np.array(state_tracking[key]).reshape((FMU_refinement, FMU_refinement, FMU_refinement, FMU_refinement))
-                
-                if self.FMU_config["Extrapolate"]:
-                    interp_func = RegularGridInterpolator((hwa_sweep, heave_sweep, pitch_sweep, roll_sweep), output_state,
-                                                          bounds_error=False, fill_value=None)
-                else:
-                    interp_func = RegularGridInterpolator((hwa_sweep, heave_sweep, pitch_sweep, roll_sweep), output_state)
-                
-                FMU_fits[key] = interp_func
-            
-            FMU_fits["keys"] = list(FMU_fits.keys())
-            
-            with open("./src/simulations/kin/kin_outputs/kin_FMU.pkl", 'wb') as f:
-                pickle.dump(FMU_fits, f)
-            
-            print()
+        if self.FMU_config["Evaluate"] or self.FMU_config["Report From FMU"]:
+            self.FMU_tables = self.evaluate_FMU_sweeps(FMU_fits=_load_FMU(model_path=model_path), sweeps=sweeps)
+
+        if self.FMU_config["Report From FMU"]:
+            self.sweep_tables = {sweep_key: [self.FMU_tables[sweep_key]] for sweep_key in sweeps}
+
+            # Dashed overlays would duplicate the FMU traces
+            self.FMU_tables = {}
+        else:
+            model_tables = results[-(1 + len(comparison_paths)):]
+            self.sweep_tables = {sweep_key: [tables[sweep_key] for tables in model_tables] for sweep_key in sweeps}
 
         # Make cover page :D
         
@@ -148,21 +142,14 @@ class Kinematics(Simulation):
             title_fig.text(0.5, 0.4, f"Date: {now.strftime("%Y-%m-%d, %I:%M %p %Z")}", fontsize=12, ha='center')
             title_fig.gca().axis('off')
         
-        # Generate Plots (from FMU and kin model)
-        self.outputs: Set[str] = set([key[key.index("_") + 1:] for key in self.sus.state.keys()])
-
-        plots = []
-        plots.append(title_fig)
-
-        total_evals = sum([x["x-axis"]["Number Steps"] for x in self.plot_config.values()]) * (1 + len(comparison_paths))
-        eval_num = 0
-
-        if self.FMU_config["Evaluate"]:
-            with open("./src/simulations/kin/kin_outputs/kin_FMU.pkl", 'rb') as f:
-                FMU_fits = pickle.load(f)
+        # Figures are written and closed as soon as they're drawn, so one page is held in memory at a time
+        report = Report(save_path="./src/simulations/kin/kin_outputs/kin_report.pdf")
+        report.add_figure(title_fig)
 
         for _, value in self.plot_config.items():
             num_plots = [x[1] for x in value["Corners"].items()].count(True)
+            sweep_table = self.sweep_tables[self._sweep_key(x_axis=value["x-axis"])]
+            FMU_table = self.FMU_tables[self._sweep_key(x_axis=value["x-axis"])] if self.FMU_tables else None
             if num_plots == 2:
                 axle_vals = [[], []]
                 comparison_axle_vals = []
@@ -189,30 +176,12 @@ class Kinematics(Simulation):
                     else:
                         sweep = jounce_sweep
                     
-                    for jounce_val in sweep:
-                        eval_num += 1
-                        print(f"Percent Completion: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
-                        self = self.heave(jounce_val)
-                        
-                        for _, val in value["y-axis"]["Outputs"].items():
-                            if (val not in self.outputs) and not (val == None):
-                                raise Exception(f"Invalid output specified in {value["Title"]} ({val}). Please use one of the following: {", ".join(self.outputs)}")
-                            
-                        axle_vals[0].append(self.sus.state["Fr_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
-                        axle_vals[1].append(self.sus.state["Rr_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
-                    
-                    for i in range(len(self.comparison_sus)):
-                        comparison_axle_vals.append([[], []])
-
-                        for jounce_val in sweep:
-                            eval_num += 1
-                            print(f"Percent Completion: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
-                            
-                            self.public_comparison_sus_copy = self.comparison_sus_copy[i]
-                            comparison_sus = self.comparison_heave(jounce_val)
+                    axle_vals[0] = list(sweep_table[0]["Fr_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
+                    axle_vals[1] = list(sweep_table[0]["Rr_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
 
-                            comparison_axle_vals[i][0].append(comparison_sus.state["Fr_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
-                            comparison_axle_vals[i][1].append(comparison_sus.state["Rr_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
+                    for comparison_table in sweep_table[1:]:
+                        comparison_axle_vals.append([list(comparison_table["Fr_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"]),
+                                                     list(comparison_table["Rr_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])])
 
                     ax1.set_title(f"Fr {value["Title"]}", fontsize=14)
                     ax2.set_title(f"Rr {value["Title"]}", fontsize=14)
@@ -233,9 +202,9 @@ class Kinematics(Simulation):
                         ax1.plot(jounce_sweep, Fr)
                         ax2.plot(jounce_sweep, Rr)
 
-                    if self.FMU_config["Evaluate"]:
-                        Fr_FMU_vals = np.array([FMU_fits["Fr_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, jounce, 0, 0]))[0] for jounce in sweep])
-                        Rr_FMU_vals = np.array([FMU_fits["Rr_" + value["y-axis"]["Outputs"]["RL"]](np.array([0, jounce, 0, 0]))[0] for jounce in sweep])
+                    if FMU_table is not None:
+                        Fr_FMU_vals = FMU_table["Fr_" + value["y-axis"]["Outputs"]["FL"]]
+                        Rr_FMU_vals = FMU_table["Rr_" + value["y-axis"]["Outputs"]["RL"]]
                         
                         ax1.plot(jounce_sweep, Fr_FMU_vals * value["y-axis"]["Multipliers"]["FL"], linestyle='--')
                         ax2.plot(jounce_sweep, Rr_FMU_vals * value["y-axis"]["Multipliers"]["RL"], linestyle='--')
@@ -272,30 +241,12 @@ class Kinematics(Simulation):
                     else:
                         sweep = roll_sweep
 
-                    for roll_val in sweep:
-                        eval_num += 1
-                        print(f"Percent Completion: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
-                        self = self.roll(roll_val, roll_n_steps)
-                        
-                        for _, val in value["y-axis"]["Outputs"].items():
-                            if (val not in self.outputs) and not (val == None):
-                                raise Exception(f"Invalid output specified in {value["Title"]} ({val}). Please use one of the following: {", ".join(self.outputs)}")
-                            
-                        axle_vals[0].append(self.sus.state["Fr_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
-                        axle_vals[1].append(self.sus.state["Rr_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
-                    
-                    for i in range(len(self.comparison_sus)):
-                        comparison_axle_vals.append([[], []])
-
-                        for roll_val in sweep:
-                            eval_num += 1
-                            print(f"Percent Completion: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
-                            
-                            self.public_comparison_sus_copy = self.comparison_sus_copy[i]
-                            comparison_sus = self.comparison_roll(roll_val)
+                    axle_vals[0] = list(sweep_table[0]["Fr_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
+                    axle_vals[1] = list(sweep_table[0]["Rr_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
 
-                            comparison_axle_vals[i][0].append(comparison_sus.state["Fr_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
-                            comparison_axle_vals[i][1].append(comparison_sus.state["Rr_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
+                    for comparison_table in sweep_table[1:]:
+                        comparison_axle_vals.append([list(comparison_table["Fr_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"]),
+                                                     list(comparison_table["Rr_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])])
 
                     ax1.set_title(f"Fr {value["Title"]}", fontsize=14)
                     ax2.set_title(f"Rr {value["Title"]}", fontsize=14)
@@ -316,9 +267,9 @@ class Kinematics(Simulation):
                         ax1.plot(roll_sweep, Fr)
                         ax2.plot(roll_sweep, Rr)
 
-                    if self.FMU_config["Evaluate"]:
-                        Fr_FMU_vals = np.array([FMU_fits["Fr_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, 0, 0, roll]))[0] for roll in sweep])
-                        Rr_FMU_vals = np.array([FMU_fits["Rr_" + value["y-axis"]["Outputs"]["RL"]](np.array([0, 0, 0, roll]))[0] for roll in sweep])
+                    if FMU_table is not None:
+                        Fr_FMU_vals = FMU_table["Fr_" + value["y-axis"]["Outputs"]["FL"]]
+                        Rr_FMU_vals = FMU_table["Rr_" + value["y-axis"]["Outputs"]["RL"]]
                         
                         ax1.plot(roll_sweep, Fr_FMU_vals * value["y-axis"]["Multipliers"]["FL"], linestyle='--')
                         ax2.plot(roll_sweep, Rr_FMU_vals * value["y-axis"]["Multipliers"]["RL"], linestyle='--')
@@ -455,34 +406,12 @@ class Kinematics(Simulation):
                     else:
                         sweep = jounce_sweep
                     
-                    for jounce_val in sweep:
-                        eval_num += 1
-                        print(f"Percent Completion: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
-                        self = self.heave(jounce_val)
-                        
-                        for _, val in value["y-axis"]["Outputs"].items():
-                            if val not in self.outputs:
-                                raise Exception(f"Invalid output specified in {value["Title"]} ({val}). Please use one of the following: {", ".join(self.outputs)}")
-                            
-                        corner_vals[0].append(self.sus.state["FL_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
-                        corner_vals[1].append(self.sus.state["FR_" + value["y-axis"]["Outputs"]["FR"]] * value["y-axis"]["Multipliers"]["FR"])
-                        corner_vals[2].append(self.sus.state["RL_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
-                        corner_vals[3].append(self.sus.state["RR_" + value["y-axis"]["Outputs"]["RR"]] * value["y-axis"]["Multipliers"]["RR"])
-                    
-                    for i in range(len(self.comparison_sus)):
-                        comparison_corner_vals.append([[], [], [], []])
+                    for index, corner in enumerate(["FL", "FR", "RL", "RR"]):
+                        corner_vals[index] = list(sweep_table[0][f"{corner}_" + value["y-axis"]["Outputs"][corner]] * value["y-axis"]["Multipliers"][corner])
 
-                        for jounce_val in sweep:
-                            eval_num += 1
-                            print(f"Percent Completion: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
-                            
-                            self.public_comparison_sus_copy = self.comparison_sus_copy[i]
-                            comparison_sus = self.comparison_heave(jounce_val)
-
-                            comparison_corner_vals[i][0].append(comparison_sus.state["FL_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
-                            comparison_corner_vals[i][1].append(comparison_sus.state["FR_" + value["y-axis"]["Outputs"]["FR"]] * value["y-axis"]["Multipliers"]["FR"])
-                            comparison_corner_vals[i][2].append(comparison_sus.state["RL_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
-                            comparison_corner_vals[i][3].append(comparison_sus.state["RR_" + value["y-axis"]["Outputs"]["RR"]] * value["y-axis"]["Multipliers"]["RR"])
+                    for comparison_table in sweep_table[1:]:
+                        comparison_corner_vals.append([list(comparison_table[f"{corner}_" + value["y-axis"]["Outputs"][corner]] * value["y-axis"]["Multipliers"][corner]) \
+                                                       for corner in ["FL", "FR", "RL", "RR"]])
                         
                     ax1.set_title(f"FL {value["Title"]}", fontsize=14)
                     ax2.set_title(f"FR {value["Title"]}", fontsize=14)
@@ -513,17 +442,11 @@ class Kinematics(Simulation):
                         ax3.plot(jounce_sweep, RL)
                         ax4.plot(jounce_sweep, RR)
 
-                    if self.FMU_config["Evaluate"]:
-                        FL_FMU_vals = []
-                        FR_FMU_vals = []
-                        RL_FMU_vals = []
-                        RR_FMU_vals = []
-
-                        for jounce in sweep:
-                            FL_FMU_vals.append(FMU_fits["FL_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, jounce, 0, 0]))[0])
-                            FR_FMU_vals.append(FMU_fits["FR_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, jounce, 0, 0]))[0])
-                            RL_FMU_vals.append(FMU_fits["RL_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, jounce, 0, 0]))[0])
-                            RR_FMU_vals.append(FMU_fits["RR_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, jounce, 0, 0]))[0])
+                    if FMU_table is not None:
+                        FL_FMU_vals = FMU_table["FL_" + value["y-axis"]["Outputs"]["FL"]]
+                        FR_FMU_vals = FMU_table["FR_" + value["y-axis"]["Outputs"]["FR"]]
+                        RL_FMU_vals = FMU_table["RL_" + value["y-axis"]["Outputs"]["RL"]]
+                        RR_FMU_vals = FMU_table["RR_" + value["y-axis"]["Outputs"]["RR"]]
 
                         ax1.plot(jounce_sweep, np.array(FL_FMU_vals) * value["y-axis"]["Multipliers"]["FL"], linestyle='--')
                         ax2.plot(jounce_sweep, np.array(FR_FMU_vals) * value["y-axis"]["Multipliers"]["FR"], linestyle='--')
@@ -571,30 +494,12 @@ class Kinematics(Simulation):
                     else:
                         sweep = roll_sweep
 
-                    for roll_val in sweep:
-                        eval_num += 1
-                        print(f"Percent Completion: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
-                        self = self.roll(roll_val, roll_n_steps)
+                    for index, corner in enumerate(["FL", "FR", "RL", "RR"]):
+                        corner_vals[index] = list(sweep_table[0][f"{corner}_" + value["y-axis"]["Outputs"][corner]] * value["y-axis"]["Multipliers"][corner])
 
-                        corner_vals[0].append(self.sus.state["FL_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
-                        corner_vals[1].append(self.sus.state["FR_" + value["y-axis"]["Outputs"]["FR"]] * value["y-axis"]["Multipliers"]["FR"])
-                        corner_vals[2].append(self.sus.state["RL_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
-                        corner_vals[3].append(self.sus.state["RR_" + value["y-axis"]["Outputs"]["RR"]] * value["y-axis"]["Multipliers"]["RR"])
-                    
-                    for i in range(len(self.comparison_sus)):
-                        comparison_corner_vals.append([[], [], [], []])
-
-                        for roll_val in sweep:
-                            eval_num += 1
-                            print(f"Percent Completion: {round(eval_num / total_evals * 100, 2)}%\t", end="\r")
-                            
-                            self.public_comparison_sus_copy = self.comparison_sus_copy[i]
-                            comparison_sus = self.comparison_roll(roll_val)
-
-                            comparison_corner_vals[i][0].append(comparison_sus.state["FL_" + value["y-axis"]["Outputs"]["FL"]] * value["y-axis"]["Multipliers"]["FL"])
-                            comparison_corner_vals[i][1].append(comparison_sus.state["FR_" + value["y-axis"]["Outputs"]["FR"]] * value["y-axis"]["Multipliers"]["FR"])
-                            comparison_corner_vals[i][2].append(comparison_sus.state["RL_" + value["y-axis"]["Outputs"]["RL"]] * value["y-axis"]["Multipliers"]["RL"])
-                            comparison_corner_vals[i][3].append(comparison_sus.state["RR_" + value["y-axis"]["Outputs"]["RR"]] * value["y-axis"]["Multipliers"]["RR"])
+                    for comparison_table in sweep_table[1:]:
+                        comparison_corner_vals.append([list(comparison_table[f"{corner}_" + value["y-axis"]["Outputs"][corner]] * value["y-axis"]["Multipliers"][corner]) \
+                                                       for corner in ["FL", "FR", "RL", "RR"]])
                         
                     ax1.set_title(f"FL {value["Title"]}")
                     ax2.set_title(f"FR {value["Title"]}")
@@ -625,17 +530,11 @@ class Kinematics(Simulation):
                         ax3.plot(roll_sweep, RL)
                         ax4.plot(roll_sweep, RR)
 
-                    if self.FMU_config["Evaluate"]:
-                        FL_FMU_vals = []
-                        FR_FMU_vals = []
-                        RL_FMU_vals = []
-                        RR_FMU_vals = []
-
-                        for roll in sweep:
-                            FL_FMU_vals.append(FMU_fits["FL_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, 0, 0, roll]))[0])
-                            FR_FMU_vals.append(FMU_fits["FR_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, 0, 0, roll]))[0])
-                            RL_FMU_vals.append(FMU_fits["RL_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, 0, 0, roll]))[0])
-                            RR_FMU_vals.append(FMU_fits["RR_" + value["y-axis"]["Outputs"]["FL"]](np.array([0, 0, 0, roll]))[0])
+                    if FMU_table is not None:
+                        FL_FMU_vals = FMU_table["FL_" + value["y-axis"]["Outputs"]["FL"]]
+                        FR_FMU_vals = FMU_table["FR_" + value["y-axis"]["Outputs"]["FR"]]
+                        RL_FMU_vals = FMU_table["RL_" + value["y-axis"]["Outputs"]["RL"]]
+                        RR_FMU_vals = FMU_table["RR_" + value["y-axis"]["Outputs"]["RR"]]
 
                         ax1.plot(roll_sweep, np.array(FL_FMU_vals) * value["y-axis"]["Multipliers"]["FL"], linestyle='--')
                         ax2.plot(roll_sweep, np.array(FR_FMU_vals) * value["y-axis"]["Multipliers"]["FR"], linestyle='--')
@@ -798,9 +697,9 @@ class Kinematics(Simulation):
 
             fig.tight_layout()
 
-            plots.append(fig)
+            report.add_figure(fig)
 
-        self._generate_pdf(figs=plots, save_path="./src/simulations/kin/kin_outputs/kin_report.pdf")
+        report.close()
 
     def nom_tangent(self, a: MutableSequence[float], b: MutableSequence[float]) -> Tuple[float, Callable]:
         """
@@ -825,30 +724,311 @@ class Kinematics(Simulation):
 
         return (float(kin_deriv(0)), lambda x: float(kin_deriv(0)) * np.array(x) + float(kin_curve(0)))
 
-    @SISO_global_cache
+    def _sweep_key(self, x_axis: dict) -> Tuple[str, str, Tuple[float, ...], int]:
+        """
+        ## Sweep Key
+
+        Hashable identifier for a plot's x-axis sweep
+
+        Parameters
+        ----------
+        x_axis : dict
+            x-axis entry of a plot config
+
+        Returns
+        -------
+        Tuple[str, str, Tuple[float, ...], int]
+            Sweep label, unit, bounds, and number of steps
+        """
+        return (x_axis["Label"].lower(), x_axis["Unit"].lower(), tuple(float(x) for x in x_axis["Values"]), int(x_axis["Number Steps"]))
+
+    def _collect_sweeps(self) -> MutableSequence[Tuple[str, str, Tuple[float, ...], int]]:
+        """
+        ## Collect Sweeps
+
+        Collects each distinct sweep across all plot configs, validating plot outputs
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        MutableSequence[Tuple[str, str, Tuple[float, ...], int]]
+            Unique sweep keys, in order of first appearance
+        """
+        sweeps: dict[Tuple, None] = {}
+
+        for value in self.plot_config.values():
+            num_plots = [x[1] for x in value["Corners"].items()].count(True)
+
+            # Validate outputs before any suspension solves
+            for _, val in value["y-axis"]["Outputs"].items():
+                if (val not in self.outputs) and not (num_plots == 2 and val == None):
+                    raise Exception(f"Invalid output specified in {value["Title"]} ({val}). Please use one of the following: {", ".join(self.outputs)}")
+
+            if value["x-axis"]["Label"].lower() not in ["jounce", "roll"]:
+                raise Exception(f"Invalid x-axis specified in {value["Title"]} ({value["x-axis"]["Label"]}). Please use one of the following: Jounce, Roll")
+
+            sweeps[self._sweep_key(x_axis=value["x-axis"])] = None
+
+        return list(sweeps.keys())
+
+    def evaluate_sweeps(self, sweeps: Sequence[Tuple[str, str, Tuple[float, ...], int]], roll_n_steps: int) -> dict[Tuple, dict[str, np.ndarray]]:
+        """
+        ## Evaluate Sweeps
+
+        Evaluates each sweep once, tracking every state key
+
+        Parameters
+        ----------
+        sweeps : Sequence[Tuple[str, str, Tuple[float, ...], int]]
+            Unique sweep keys
+        roll_n_steps : int
+            Number of steps used to converge each roll condition
+
+        Returns
+        -------
+        dict[Tuple, dict[str, np.ndarray]]
+            State traces for each sweep key
+        """
+        sweep_tables: dict[Tuple, dict[str, np.ndarray]] = {}
+
+        for sweep_key in sweeps:
+            label, unit, bounds, steps = sweep_key
+            sweep = np.linspace(*bounds, steps)
+
+            if label == "jounce" and unit == "mm":
+                sweep = sweep / 1000
+            elif label == "roll" and unit == "rad":
+                sweep = sweep * 180 / np.pi
+
+            states: MutableSequence[dict[str, float]] = []
+
+            # Heave is solved directly, roll is stepped up to, so each is stored apart from the FMU poses
+            solve_path = "sweep heave" if label == "jounce" else f"sweep roll {roll_n_steps}"
+
+            for sweep_val in sweep:
+                pose = [0, sweep_val, 0, 0] if label == "jounce" else [0, 0, 0, sweep_val]
+                state = self.pose_store.get(model_hash=self.model_hash, solve_path=solve_path, pose=pose) if self.pose_store else None
+
+                if state is None:
+                    if label == "jounce":
+                        model = self.heave(sweep_val)
+                    else:
+                        model = self.roll(sweep_val, roll_n_steps)
+
+                    state = dict(model.sus.state)
+
+                    if self.pose_store:
+                        self.pose_store.put(model_hash=self.model_hash, solve_path=solve_path, pose=pose, state=state)
+
+                states.append(state)
+
+            sweep_tables[sweep_key] = {key: np.array([state[key] for state in states]) for key in states[0].keys()}
+
+        if self.pose_store:
+            self.pose_store.commit()
+
+        return sweep_tables
+
+    def evaluate_FMU_sweeps(self, FMU_fits: dict[str, RegularGridInterpolator], sweeps: Sequence[Tuple[str, str, Tuple[float, ...], int]]) -> dict[Tuple, dict[str, np.ndarray]]:
+        """
+        ## Evaluate FMU Sweeps
+
+        Evaluates each sweep from the FMU, querying every state key in a single batch
+
+        Parameters
+        ----------
+        FMU_fits : dict[str, RegularGridInterpolator]
+            FMU interpolators over (hwa, heave, pitch, roll)
+        sweeps : Sequence[Tuple[str, str, Tuple[float, ...], int]]
+            Unique sweep keys
+
+        Returns
+        -------
+        dict[Tuple, dict[str, np.ndarray]]
+            State traces for each sweep key
+        """
+        sweep_tables: dict[Tuple, dict[str, np.ndarray]] = {}
+
+        for sweep_key in sweeps:
+            label, unit, bounds, steps = sweep_key
+            sweep = np.linspace(*bounds, steps)
+            points = np.zeros((steps, 4))
+
+            if label == "jounce":
+                points[:, 1] = sweep / 1000 if unit == "mm" else sweep
+            else:
+                points[:, 3] = sweep * 180 / np.pi if unit == "rad" else sweep
+
+            sweep_tables[sweep_key] = {key: FMU_fits[key](points) for key in FMU_fits["keys"]}
+
+        return sweep_tables
+
+    def generate_FMU(self) -> None:
+        """
+        ## Generate FMU
+
+        Sweeps hwa, heave, pitch, and roll and pickles a RegularGridInterpolator for every state key
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        FMU_refinement = self.FMU_config["Refinement"]
+        
+        # Sweeps
+        hwa_sweep = np.linspace(-self.FMU_config["Hwa Sweep"], self.FMU_config["Hwa Sweep"], FMU_refinement)
+        heave_sweep = np.linspace(-self.FMU_config["Heave Sweep"], self.FMU_config["Heave Sweep"], FMU_refinement) * 0.0254
+        pitch_sweep = np.linspace(-self.FMU_config["Pitch Sweep"], self.FMU_config["Pitch Sweep"], FMU_refinement)
+        roll_sweep = np.linspace(-self.FMU_config["Roll Sweep"], self.FMU_config["Roll Sweep"], FMU_refinement)
+
+        # Preallocate one row per pose (hwa, heave, pitch, roll in C order)
+        # A memmapped buffer lives in a scratch file outside kin_outputs, deleted once the FMU is pickled
+        memmap_path = None
+        if self.FMU_config["Memmap"]:
+            handle, memmap_path = tempfile.mkstemp(prefix="kin_FMU_states_", suffix=".npy")
+            os.close(handle)
+
+        try:
+            state_tracking = StateBuffer(keys=self.sus_copy.state.keys(), n_points=FMU_refinement**4, memmap_path=memmap_path)
+
+            eval_num = 0
+            total_evals = FMU_refinement**4
+
+            for hwa in hwa_sweep:
+                for heave in heave_sweep:
+                    for pitch in pitch_sweep:
+                        for roll in roll_sweep:
+                            print(f"FMU Generation Progress: {round((eval_num + 1) / total_evals * 100, 2)}%\t", end="\r")
+
+                            pose = [hwa, heave, pitch, roll]
+                            state = self.pose_store.get(model_hash=self.model_hash, solve_path="fmu", pose=pose) if self.pose_store else None
+
+                            if state is None:
+                                self.sus_copy = deepcopy(self.sus)
+                                self.sus_copy.steer(hwa=hwa)
+                                self.sus_copy.heave(heave=heave)
+                                self.sus_copy.pitch(pitch=pitch)
+                                self.sus_copy.roll(roll=roll)
+
+                                state = self.sus_copy.state
+
+                                if self.pose_store:
+                                    self.pose_store.put(model_hash=self.model_hash, solve_path="fmu", pose=pose, state=state)
+
+                            state_tracking.write(index=eval_num, state=state)
+                            eval_num += 1
+
+                            self.sus_copy = deepcopy(self.sus)
+
+                    # Commit periodically so an interrupted generation keeps its progress
+                    if self.pose_store:
+                        self.pose_store.commit()
+
+            state_tracking.flush()
+
+            FMU_fits: dict[str, RegularGridInterpolator] = {}
+
+            for key in state_tracking.keys:
+                output_state = state_tracking.column(key, shape=(FMU_refinement, FMU_refinement, FMU_refinement, FMU_refinement))
+
+                if self.FMU_config["Extrapolate"]:
+                    interp_func = RegularGridInterpolator((hwa_sweep, heave_sweep, pitch_sweep, roll_sweep), output_state,
+                                                          bounds_error=False, fill_value=None)
+                else:
+                    interp_func = RegularGridInterpolator((hwa_sweep, heave_sweep, pitch_sweep, roll_sweep), output_state)
+            
+                FMU_fits[key] = interp_func
+        
+            FMU_fits["keys"] = list(FMU_fits.keys())
+
+            # Reports check this before reading the FMU, so a stale FMU isn't plotted as the current model
+            FMU_fits["model_hash"] = self.model_hash
+            state_tracking.close()
+
+            with open("./src/simulations/kin/kin_outputs/kin_FMU.pkl", 'wb') as f:
+                pickle.dump(FMU_fits, f)
+        finally:
+            if memmap_path:
+                os.remove(memmap_path)
+        
+        print()
+
+    @LRU_state_cache(max_entries=4096, units=("m",))
     def heave(self, heave: float):
         self.sus = deepcopy(self.sus_copy)
         self.sus.heave(heave=heave)
 
         return self
 
-    @SISO_global_cache
+    @LRU_state_cache(max_entries=4096, units=("deg", None))
     def roll(self, roll, n_steps):
         self.sus = deepcopy(self.sus_copy)
         self.sus.roll(roll=roll, n_steps=n_steps)
 
         return self
-    
-    @SISO_local_cache
-    def comparison_heave(self, heave: float):
-        self.public_comparison_sus = deepcopy(self.public_comparison_sus_copy)
-        self.public_comparison_sus.heave(heave=heave)
 
-        return self.public_comparison_sus
 
-    @SISO_local_cache
-    def comparison_roll(self, roll: float):
-        self.public_comparison_sus = deepcopy(self.public_comparison_sus_copy)
-        self.public_comparison_sus.roll(roll=roll)
+def _kin_shell(model_path: str, cache_config: dict) -> Kinematics:
+    """
+    ## Kinematics Shell
+
+    Builds a Kinematics object for a single model without running the report
+
+    Parameters
+    ----------
+    model_path : str
+        Path to vehicle model yaml
+    cache_config : dict
+        Cache Settings from kin.yml
+
+    Returns
+    -------
+    Kinematics
+        Kinematics object with suspension initialized
+    """
+    # Key tolerances are module state, so they're set inside each worker process
+    set_key_tolerance(unit="m", tolerance=cache_config["Jounce Tolerance"])
+    set_key_tolerance(unit="deg", tolerance=cache_config["Roll Tolerance"])
+
+    kin = Kinematics.__new__(Kinematics)
+    kin.sus_data = SuspensionData(path=model_path)
+    kin.sus = Suspension(sus_data=kin.sus_data)
+    kin.sus_copy = deepcopy(kin.sus)
+
+    kin.model_hash = model_hash(model_path=model_path)
+    kin.pose_store = PoseStore(path=POSE_STORE_PATH) if cache_config["Persistent Store"] else None
+
+    return kin
+
+def _load_FMU(model_path: str) -> dict:
+    FMU_fits = load_kin_FMU()
+
+    if FMU_fits.get("model_hash") != model_hash(model_path=model_path):
+        raise Exception("Please run SIM=kin with FMU generation enabled (kin_FMU.pkl was generated from a different model, tire, or suspension code)")
+
+    return FMU_fits
+
+def _evaluate_sweeps(model_path: str, sweeps: Sequence[Tuple[str, str, Tuple[float, ...], int]], roll_n_steps: int,
+                     cache_config: dict) -> dict[Tuple, dict[str, np.ndarray]]:
+    kin = _kin_shell(model_path=model_path, cache_config=cache_config)
+    sweep_tables = kin.evaluate_sweeps(sweeps=sweeps, roll_n_steps=roll_n_steps)
+
+    if kin.pose_store:
+        kin.pose_store.close()
+
+    return sweep_tables
+
+def _generate_FMU(model_path: str, FMU_config: dict, cache_config: dict) -> None:
+    kin = _kin_shell(model_path=model_path, cache_config=cache_config)
+    kin.FMU_config = FMU_config
+    kin.generate_FMU()
 
-        return self.public_comparison_sus
\ No newline at end of file
+    if kin.pose_store:
+        kin.pose_store.close()
@@ -0,0 +1,589 @@
+from src.simulations.qss._qss_helpers.ymd_result import YMDResult
+
+from scipy.interpolate import CubicSpline
+from matplotlib.lines import Line2D
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.axes import Axes
+from typing import Sequence
+
+import matplotlib.gridspec as gridspec
+import matplotlib.pyplot as plt
+import pandas as pd
+import numpy as np
+
+
+class QSSPlots:
+    """
+    ## QSS Plots
+
+    Report pages of the QSS simulation
+    - Only holds the metric tables and the data the pages need, so its methods can be sent to report workers as page builders
+
+    Parameters
+    ----------
+    yaw_inertia : float
+        Vehicle yaw moment of inertia in kg*m^2
+    """
+    def __init__(self, yaw_inertia: float) -> None:
+        self.yaw_inertia = yaw_inertia
+
+        self.max_table_dict = {"max_accY":          "max" + r"$\left( a_{y} \right)$"                                 ,
+                               "max_trim_accY":     "max" + r"$\left( \left. a_{y} \right|_{\ddot{\psi} = 0} \right)$",
+                               "N_at_max_accY":     r"$\left. \ddot{\psi} \right|_{max(a_{y})}$"                      ,
+                            #    "alpha_at_max_accY": alpha_at_max_accY                                               ,
+                               "beta_at_max_accY":  r"$\left. \beta \right|_{max(a_{y})}$"                            ,
+                               "hwa_at_max_accY":   r"$\left. \delta \right|_{max(a_{y})}$"                           ,
+                               "max_N":             "max" + r"$ \left( \ddot{\psi} \right)$"                          ,
+                            #    "alpha_at_max_N":    alpha_at_max_N                                                  ,
+                               "beta_at_max_N":     r"$\left. \beta \right|_{max(\ddot{\psi})}$"                      ,
+                               "hwa_at_max_N":      r"$\left. \delta \right|_{max(\ddot{\psi})}$"                     ,
+                               "accY_at_max_N":     r"$\left. a_{y} \right|_{max(\ddot{\psi})}$"                      ,
+                               "dN_dd_b1_pos_accY": r"$\left. \frac{d \ddot{\psi} }{d \delta} \right|_{max(a_{y})}$"  ,
+                               "dN_db_d1_pos_accY": r"$\left. \frac{d \ddot{\psi} }{d \beta} \right|_{max(a_{y})}$"   ,
+                               "dN_dd_b0":          r"$\left. \frac{d \ddot{\psi} }{d \delta} \right|_{\beta = 0}$"   ,
+                               "dN_db_d0":          r"$\left. \frac{d \ddot{\psi} }{d \beta} \right|_{\delta = 0}$"   ,
+                               }
+
+        self.min_table_dict = {"min_accY":          "min" + r"$\left( a_{y} \right)$"                                  ,
+                               "min_trim_accY":     "min" + r"$\left( \left. a_{y} \right|_{ \ddot{\psi} = 0} \right)$",
+                               "N_at_min_accY":     r"$\left. \ddot{\psi} \right|_{min(a_{y})}$"                       ,
+                            #    "alpha_at_min_accY": alpha_at_min_accY                                                ,
+                               "beta_at_min_accY":  r"$\left. \beta \right|_{min(a_{y})}$"                             ,
+                               "hwa_at_min_accY":   r"$\left. \delta \right|_{min(a_{y})}$"                            ,
+                               "min_N":             "min" + r"$ \left( \ddot{\psi} \right)$"                           ,
+                            #    "alpha_at_min_N":    alpha_at_min_N                                                   ,
+                               "beta_at_min_N":     r"$\left. \beta \right|_{min( \ddot{\psi} )}$"                     ,
+                               "hwa_at_min_N":      r"$\left. \delta \right|_{min( \ddot{\psi} )}$"                    ,
+                               "accY_at_min_N":     r"$\left. a_{y} \right|_{min( \ddot{\psi} )}$"                     ,
+                               "dN_dd_b1_neg_accY": r"$\left. \frac{d \ddot{\psi} }{d \delta} \right|_{min(a_{y})}$"   ,
+                               "dN_db_d1_neg_accY": r"$\left. \frac{d \ddot{\psi} }{d \beta} \right|_{min(a_{y})}$"    ,
+                               "dN_dd_b0":          r"$\left. \frac{d \ddot{\psi} }{d \delta} \right|_{\beta = 0}$"    ,
+                               "dN_db_d0":          r"$\left. \frac{d \ddot{\psi} }{d \beta} \right|_{\delta = 0}$"    ,
+                               }
+
+        self.unit_lst = [r"$\left( m/s^{2} \right)$",
+                         r"$\left( m/s^{2} \right)$",
+                         r"$\left( rad/s^{2} \right)$",
+                        #  r"$\left( deg \right)$",
+                         r"$\left( deg \right)$",
+                         r"$\left( deg \right)$",
+                         r"$\left( rad/s^{2} \right)$",
+                        #  r"$\left( deg \right)$",
+                         r"$\left( deg \right)$",
+                         r"$\left( deg \right)$",
+                         r"$\left( m/s^{2} \right)$",
+                         r"$\left( \frac{rad/s^{2}}{deg} \right)$",
+                         r"$\left( \frac{rad/s^{2}}{deg} \right)$",
+                         r"$\left( \frac{rad/s^{2}}{deg} \right)$",
+                         r"$\left( \frac{rad/s^{2}}{deg} \right)$"]
+
+    def cv_metric_plots(self, velocity_schedule: Sequence[float], ymd_metrics: list[dict], cr_results: Sequence[YMDResult]) -> list[Figure]:
+        cv_plots = []
+
+        fig = plt.figure(figsize=(14, 8.5), dpi=300)
+        gs = gridspec.GridSpec(2, 3, height_ratios=[1, 1], width_ratios=[1, 1, 1])
+        
+        fig.text(0.015, 0.94, "Acceleration vs Velocity", fontsize=24, ha='left')
+
+        peak_accY = []
+        peak_trim_accY = []
+        N_at_peak_accY = []
+
+        for i in range(len(velocity_schedule)):
+            avg_accY = (-1 * ymd_metrics[i]["min_accY"] + ymd_metrics[i]["max_accY"]) / 2
+            avg_trim_accY = (-1 * ymd_metrics[i]["min_trim_accY"] + ymd_metrics[i]["max_trim_accY"]) / 2
+            avg_N_at_peak_accY = (-1 * ymd_metrics[i]["N_at_min_accY"] + ymd_metrics[i]["N_at_max_accY"]) / 2 * self.yaw_inertia
+            
+            peak_accY.append(avg_accY)
+            peak_trim_accY.append(avg_trim_accY)
+            N_at_peak_accY.append(avg_N_at_peak_accY)
+
+        max_vel = max(velocity_schedule)
+        min_vel = min(velocity_schedule)
+        avg_vel = np.average(velocity_schedule)
+
+        graph_ax = fig.add_subplot(gs[0, 0])
+        peak_accY_deriv = CubicSpline(velocity_schedule, peak_accY).derivative()
+        graph_ax.set_xlabel(r"Velocity $(m/s)$")
+        graph_ax.set_ylabel(r"$A_{y}$ $(G)$")
+        graph_ax.set_title(r"Peak $A_{y}$ vs Velocity")
+        graph_ax.plot(velocity_schedule, [x / 9.81 for x in peak_accY])
+        graph_ax.grid()
+
+        graph_ax = fig.add_subplot(gs[0, 1])
+        peak_trim_accY_deriv = CubicSpline(velocity_schedule, peak_trim_accY).derivative()
+        graph_ax.set_xlabel(r"Velocity $(m/s)$")
+        graph_ax.set_ylabel(r"$A_{y}$ $(G)$")
+        graph_ax.set_title(r"Peak Trim $A_{y}$ vs Velocity")
+        graph_ax.plot(velocity_schedule, [x / 9.81 for x in peak_trim_accY])
+        graph_ax.grid()
+
+        graph_ax = fig.add_subplot(gs[0, 2])
+        N_at_peak_accY_deriv = CubicSpline(velocity_schedule, N_at_peak_accY).derivative()
+        graph_ax.set_xlabel(r"Velocity $(m/s)$")
+        graph_ax.set_ylabel(r"N $(Nm)$")
+        graph_ax.set_title(r"Yaw Moment at Peak $A_{y}$ vs Velocity")
+        graph_ax.plot(velocity_schedule, N_at_peak_accY)
+        graph_ax.grid()
+        
+        # Tables!
+        table_ax = fig.add_subplot(gs[1, 0])
+        table_ax.axis("off")
+        table_content = [[None, r"$\frac{d A_{y}}{d V} \quad \left( \frac{G}{m/s} \right)$"],
+                         ["at Min Velocity", "{:.3f}".format(peak_accY_deriv(min_vel) / 9.81)],
+                         ["at Avg Velocity", "{:.3f}".format(peak_accY_deriv(avg_vel) / 9.81)],
+                         ["at Max Velocity", "{:.3f}".format(peak_accY_deriv(max_vel) / 9.81)]]
+
+        metric_table = table_ax.table(
+            cellText=table_content,
+            loc="center",
+            cellLoc="center",
+            colWidths=[0.5, 0.5]
+        )
+        metric_table.scale(1, 5)
+        metric_table.auto_set_font_size(False)
+        metric_table.set_fontsize(14)
+
+        for i in range(len(table_content)):
+            for j in range(2):
+                cell = metric_table[i, j]
+                cell.visible_edges = "TB"
+                cell.set_linewidth(1)
+                cell.set_facecolor("#f0f0f0")
+                cell.set_text_props(ha="center")
+                
+        for j in range(2):
+            cell = metric_table[1, j]
+            cell.visible_edges = "B"
+            cell.set_text_props(ha="center") # weight="bold", 
+
+        table_ax = fig.add_subplot(gs[1, 1])
+        table_ax.axis("off")
+        table_content = [[None, r"$\frac{d A_{y}}{d V} \quad \left( \frac{G}{m/s} \right)$"],
+                         ["at Min Velocity", "{:.3f}".format(peak_trim_accY_deriv(min_vel) / 9.81)],
+                         ["at Avg Velocity", "{:.3f}".format(peak_trim_accY_deriv(avg_vel) / 9.81)],
+                         ["at Max Velocity", "{:.3f}".format(peak_trim_accY_deriv(max_vel) / 9.81)]]
+
+        metric_table = table_ax.table(
+            cellText=table_content,
+            loc="center",
+            cellLoc="center",
+            colWidths=[0.5, 0.5]
+        )
+        metric_table.scale(1, 5)
+        metric_table.auto_set_font_size(False)
+        metric_table.set_fontsize(14)
+
+        for i in range(len(table_content)):
+            for j in range(2):
+                cell = metric_table[i, j]
+                cell.visible_edges = "TB"
+                cell.set_linewidth(1)
+                cell.set_facecolor("#f0f0f0")
+                cell.set_text_props(ha="center")
+                
+        for j in range(2):
+            cell = metric_table[1, j]
+            cell.visible_edges = "B"
+            cell.set_text_props(ha="center") # weight="bold", 
+        
+        table_ax = fig.add_subplot(gs[1, 2])
+        table_ax.axis("off")
+        table_content = [[None, r"$\frac{d N}{d V} \quad \left( \frac{Nm}{m/s} \right)$"],
+                         ["at Min Velocity", "{:.3f}".format(N_at_peak_accY_deriv(min_vel) / 9.81)],
+                         ["at Avg Velocity", "{:.3f}".format(N_at_peak_accY_deriv(avg_vel) / 9.81)],
+                         ["at Max Velocity", "{:.3f}".format(N_at_peak_accY_deriv(max_vel) / 9.81)]]
+
+        metric_table = table_ax.table(
+            cellText=table_content,
+            loc="center",
+            cellLoc="center",
+            colWidths=[0.5, 0.5]
+        )
+        metric_table.scale(1, 5)
+        metric_table.auto_set_font_size(False)
+        metric_table.set_fontsize(14)
+
+        for i in range(len(table_content)):
+            for j in range(2):
+                cell = metric_table[i, j]
+                cell.visible_edges = "TB"
+                cell.set_linewidth(1)
+                cell.set_facecolor("#f0f0f0")
+                cell.set_text_props(ha="center")
+                
+        for j in range(2):
+            cell = metric_table[1, j]
+            cell.visible_edges = "B"
+            cell.set_text_props(ha="center") # weight="bold", 
+
+        fig.tight_layout()
+        fig.subplots_adjust(left=0.075, right=0.95, top=0.85, bottom=0.10, wspace=0.35, hspace=0.35)
+        cv_plots.append(fig)
+
+        fig = plt.figure(figsize=(14, 8.5), dpi=300)
+        gs = gridspec.GridSpec(1, 2, width_ratios=[1, 1])
+        
+        fig.text(0.015, 0.94, "Control, Stability, and Handling", fontsize=24, ha='left')
+
+        dN_dd_b0 = []
+        dN_dd_b1 = []
+        dN_db_d0 = []
+        dN_db_d1 = []
+
+        for i in range(len(velocity_schedule)):
+            dN_dd_b0_val = ymd_metrics[i]["dN_dd_b0"]
+            dN_dd_b1_val = (-1 * ymd_metrics[i]["dN_dd_b1_neg_accY"] + ymd_metrics[i]["dN_dd_b1_pos_accY"]) / 2
+            dN_db_d0_val = ymd_metrics[i]["dN_db_d0"]
+            dN_db_d1_val = (-1 * ymd_metrics[i]["dN_db_d1_neg_accY"] + ymd_metrics[i]["dN_db_d1_pos_accY"]) / 2
+            
+            dN_dd_b0.append(dN_dd_b0_val)
+            dN_dd_b1.append(dN_dd_b1_val)
+            dN_db_d0.append(dN_db_d0_val)
+            dN_db_d1.append(dN_db_d1_val)
+        
+        graph_ax = fig.add_subplot(gs[0])
+        graph_ax.set_xlabel(r"Velocity $(m/s)$")
+        graph_ax.set_ylabel(r"$\frac{d \ddot{\psi} }{d \delta} \quad \left( \frac{ rad/s^{2}}{deg} \right)$")
+        graph_ax.set_title(r"Control Derivative vs Velocity")
+        graph_ax.plot(velocity_schedule, dN_dd_b0, label=r'$\beta = 0$', c='b')
+        graph_ax.plot(velocity_schedule, dN_dd_b1, label=r'$\left. \beta \right|_{max(A_{y})}$', c='r')
+        graph_ax.legend(loc='upper right')
+        graph_ax.grid()
+
+        graph_ax = fig.add_subplot(gs[1])
+        graph_ax.set_xlabel(r"Velocity $(m/s)$")
+        graph_ax.set_ylabel(r"$\frac{d \ddot{\psi} }{d \beta} \quad \left( \frac{ rad/s^{2}}{deg} \right)$")
+        graph_ax.set_title(r"Stability Derivative vs Velocity")
+        graph_ax.plot(velocity_schedule, dN_db_d0, label=r'$\delta = 0$', c='b')
+        graph_ax.plot(velocity_schedule, dN_db_d1, label=r'$\left. \delta \right|_{max(A_{y})}$', c='r')
+        graph_ax.legend(loc='upper right')
+        graph_ax.grid()
+
+        fig.tight_layout(pad=2.5)
+        fig.subplots_adjust(top=0.85)
+        cv_plots.append(fig)
+
+        fig = plt.figure(figsize=(14, 8.5), dpi=300)
+        gs = gridspec.GridSpec(1, 2, width_ratios=[1, 1])
+        
+        fig.text(0.015, 0.94, "...continued", fontsize=24, ha='left')
+
+        graph_ax = fig.add_subplot(gs[0])
+        graph_ax.set_xlabel(r"$A_{y} \quad (G)$")
+        graph_ax.set_ylabel(r"$\delta \quad (deg)$")
+        graph_ax.set_title(r"$\delta$ vs $A_{y}$")
+
+        # Standard test is done with 100m radius
+        radius_schedule = np.array([x.const for x in cr_results])
+        target_result = cr_results[np.argmin(np.abs(radius_schedule - 100))]
+
+        trim_delta = []
+        trim_accY = []
+
+        for lines, hwa_isolines in ((target_result.hwa_lines, True), (target_result.beta_lines, False)):
+            for accYaws, accYs, deltas in zip(lines("accYaw"), lines("accY"), lines("delta")[..., :2].mean(axis=-1)):
+                min_accYaw_index = np.argmin(np.abs(accYaws))
+
+                # Only keep hwa isolines that actually cross trim
+                if hwa_isolines and abs(accYaws[min_accYaw_index]) > 0.05 * max(np.abs(accYaws)):
+                    continue
+
+                trim_delta.append(deltas[min_accYaw_index])
+                trim_accY.append(accYs[min_accYaw_index])
+
+        sorted_trim_accY = sorted(trim_accY)
+        sorted_trim_delta = [x for _, x in sorted(zip(trim_accY, trim_delta))]
+
+        trim_accY_filtered = [x for x in sorted_trim_accY if x > 0.5]
+        trim_delta_filtered = [delta for accY, delta in zip(sorted_trim_accY, sorted_trim_delta) if accY > 0.5]
+
+        # Make cubic fit to deal with solver precision
+        fit_coeffs = np.polyfit(trim_accY_filtered, trim_delta_filtered, deg=3)
+        fit_poly = np.poly1d(fit_coeffs)
+        accY_range = np.linspace(min(trim_accY_filtered), max(trim_accY_filtered), 100)
+
+        # graph_ax.plot(accY_range / 9.81, fit_poly(accY_range))
+        graph_ax.scatter(accY_range / 9.81, fit_poly(accY_range))
+        graph_ax.grid()
+
+        graph_ax = fig.add_subplot(gs[1])
+        graph_ax.set_xlabel(r"$A_{y} \quad (G)$")
+        graph_ax.set_ylabel(r"$K \quad \left( \frac{deg}{G} \right)$")
+        graph_ax.set_title(r"Understeer Gradient vs $A_{y}$")
+        graph_ax.plot(accY_range / 9.81, fit_poly.deriv()(accY_range))
+        graph_ax.grid()
+        fig.tight_layout(pad=2.5)
+        fig.subplots_adjust(top=0.85)
+
+        cv_plots.append(fig)
+
+        return cv_plots
+    
+    def metric_velocity_plots(self, velocity_schedule: Sequence[float], ymd_metrics: list[dict]) -> list[Figure]:
+        plots = []
+
+        fig = plt.figure(figsize=(14, 8.5), dpi=300)
+        axes = fig.subplots(nrows=2, ncols=3)
+        metric_arrays = {}
+
+        for metric_set in ymd_metrics:
+            for key in metric_set.keys():
+                if key not in metric_arrays.keys():
+                    metric_arrays[key] = [metric_set[key]]
+                else:
+                    metric_arrays[key] += [metric_set[key]]
+        
+        counter = 0
+        for index, key in enumerate(metric_arrays.keys()):
+            if key in self.max_table_dict.keys():
+                axes[counter // 3, counter % 3].set_xlabel(r"Velocity $(m/s)$")
+                axes[counter // 3, counter % 3].set_ylabel(self.max_table_dict[key])
+                axes[counter // 3, counter % 3].set_title(self.max_table_dict[key] + " vs " + r"Velocity $(m/s)$")
+                axes[counter // 3, counter % 3].plot(velocity_schedule, metric_arrays[key])
+                axes[counter // 3, counter % 3].grid()
+            else:
+                continue
+
+            counter += 1
+
+            if counter == 6:
+                fig.tight_layout(pad=2.5)
+                plots.append(fig)
+
+                fig = plt.figure(figsize=(14, 8.5), dpi=300)
+                axes = fig.subplots(nrows=2, ncols=3)
+                counter = 0
+        
+        if not counter == 0:
+            for i in range(counter, 6):
+                axes[i // 3, i % 3].axis("off")
+
+            fig.tight_layout(pad=2.5)
+            plots.append(fig)
+        else:
+            # Nothing was drawn on the last page
+            plt.close(fig)
+
+        return plots
+    
+    def draw_ymd(self, ymd_ax: Axes, states: YMDResult, title: str) -> None:
+        ymd_ax.set_title(title + r" | Yaw Acceleration vs Lateral Acceleration")
+        ymd_ax.set_xlabel(r"Lateral Acceleration $(m/s^{2})$")
+        ymd_ax.set_ylabel(r"Yaw Acceleration $(rad/s^{2})$")
+        ymd_ax.axhline(c="gray", linewidth=0.5)
+        ymd_ax.axvline(c="gray", linewidth=0.5)
+
+        for accY_line, accYaw_line in zip(states.hwa_lines("accY"), states.hwa_lines("accYaw")):
+            ymd_ax.plot(accY_line, accYaw_line, c='b')
+        for accY_line, accYaw_line in zip(states.beta_lines("accY"), states.beta_lines("accYaw")):
+            ymd_ax.plot(accY_line, accYaw_line, c='r')
+
+        custom_lines = [Line2D([0], [0], color='b', lw=1.5),
+                        Line2D([0], [0], color='r', lw=1.5)]
+
+        ymd_ax.legend(custom_lines, [r"Constant $\delta$ (hwa)", r"Constant $\beta$ (beta)"], loc='upper right')
+        ymd_ax.grid()
+
+    def cv_ymd_frame(self, cv_states: YMDResult, dpi: int = 100) -> np.ndarray:
+        """
+        ## CV YMD Frame
+
+        Renders the diagram of a CV report page as an animation frame, without going through an image file
+        - The frame is the diagram's area of the page, padded by 25% and cropped to the page
+
+        Parameters
+        ----------
+        cv_states : YMDResult
+            Solved CV grid
+        dpi : int, optional
+            Frame resolution, by default 100 (a page-sized 300 dpi frame is about 20 MB of RGB)
+
+        Returns
+        -------
+        np.ndarray
+            RGB frame, shape (height, width, 3)
+        """
+        # Off-screen canvas, so frames are never registered with pyplot
+        fig = Figure(figsize=(14, 8.5), dpi=dpi)
+        canvas = FigureCanvasAgg(fig)
+        gs = gridspec.GridSpec(1, 2, width_ratios=[0.75, 0.25])
+
+        ymd_ax = fig.add_subplot(gs[0])
+        self.draw_ymd(ymd_ax=ymd_ax, states=cv_states, title=f"Constant Velocity: {cv_states.const}" + r" $m/s$")
+
+        canvas.draw()
+        rgba = np.asarray(canvas.buffer_rgba())
+        height, width = rgba.shape[:2]
+
+        # Window extent is in pixels from the bottom left, buffer rows start at the top
+        extent = ymd_ax.get_window_extent().expanded(1.25, 1.25)
+        x0, x1 = max(int(extent.x0), 0), min(int(np.ceil(extent.x1)), width)
+        y0, y1 = max(int(extent.y0), 0), min(int(np.ceil(extent.y1)), height)
+
+        return rgba[height - y1:height - y0, x0:x1, :3].copy()
+
+    def plot_cv_ymd(self, cv_states: YMDResult, cv_metrics: dict, dataset_path) -> Figure:
+        fig = plt.figure(figsize=(14, 8.5), dpi=300)
+        gs = gridspec.GridSpec(1, 2, width_ratios=[0.75, 0.25])
+
+        ### Graph ###
+        ymd_ax = fig.add_subplot(gs[0])
+        self.draw_ymd(ymd_ax=ymd_ax, states=cv_states, title=f"Constant Velocity: {cv_states.const}" + r" $m/s$")
+
+        if dataset_path:
+            fig.text(0.015, 0.94, "Correlation Dataset", fontsize=24, ha='left')
+
+            df = pd.read_csv(dataset_path)
+            data_pairs = df["ordered_pairs"]
+            formatted_pairs = [[], []]
+            for row in data_pairs:
+                for triplet in row.split(")), ("):
+                    triplet_rm_np = triplet.replace("np.float64", "")
+                    triplet_rm_pb = triplet_rm_np.replace("(", "").replace(")", "").replace("[", "").replace("]", "")
+                    
+                    vals = [float(x) for x in triplet_rm_pb.split(", ")]
+
+                    formatted_pairs[0] += vals[1::3]
+                    formatted_pairs[1] += vals[2::3]
+            
+            ymd_ax.scatter(np.array(formatted_pairs[0][::10]) * -1 * 1.75, np.array(formatted_pairs[1][::10]) * 3, s=0.1)
+
+        ### Tables ###
+        table_ax = fig.add_subplot(gs[1])
+        table_ax.axis("off")
+
+        labels_table_data = []
+        min_table_data = []
+        max_table_data = []
+
+        for key in self.min_table_dict.keys():
+            min_table_data.append("{:.3f}".format(cv_metrics[key]))
+        
+        for key in self.max_table_dict.keys():
+            labels_table_data.append(self.max_table_dict[key])
+            max_table_data.append("{:.3f}".format(cv_metrics[key]))
+
+        table_content = []
+
+        table_content.append([None, None, "Left Half", "Right Half"])
+        
+        for i, label in enumerate(labels_table_data):
+            if i < len(labels_table_data) - 2:
+                table_content.append([label, self.unit_lst[i], min_table_data[i], max_table_data[i]])
+            else:
+                table_content.append([label, self.unit_lst[i], None, max_table_data[i]])
+
+        metric_table = table_ax.table(
+            cellText=table_content,
+            loc="center",
+            cellLoc="center",
+            colWidths=[0.35, 0.20, 0.225, 0.225]
+        )
+        metric_table.scale(1.35, 3)
+        metric_table.auto_set_font_size(True)
+
+        for i in range(len(labels_table_data) + 1):
+            for j in range(4):
+                cell = metric_table[i, j]
+                cell.visible_edges = "TB"
+                cell.set_linewidth(1)
+                cell.set_facecolor("#f0f0f0")
+                cell.set_text_props(ha="center")
+                
+        for j in range(4):
+            cell = metric_table[0, j]
+            cell.visible_edges = "B"
+            cell.set_text_props(ha="center") # weight="bold", 
+        
+        # for i in range(1, len(labels_table_data) + 1):
+        #     cell = metric_table[i, 0]
+        #     cell.set_text_props(ha="center")
+
+        fig.tight_layout(pad=3.5)
+
+        pos = ymd_ax.get_position()
+        dy = -0.03375
+        ymd_ax.set_position([pos.x0, pos.y0 + dy, pos.width, pos.height])
+
+        return fig
+    
+    def plot_cr_ymd(self, cr_states: YMDResult, cr_metrics: dict, dataset_path) -> Figure:
+        fig = plt.figure(figsize=(14, 8.5), dpi=300)
+        gs = gridspec.GridSpec(1, 2, width_ratios=[0.75, 0.25])
+
+        ### Graph ###
+        ymd_ax = fig.add_subplot(gs[0])
+        self.draw_ymd(ymd_ax=ymd_ax, states=cr_states, title=f"Constant Radius: {cr_states.const}" + r" $m$")
+
+        if dataset_path:
+            fig.text(0.015, 0.94, "Correlation Dataset", fontsize=24, ha='left')
+
+            df = pd.read_csv(dataset_path)
+            data_pairs = df["ordered_pairs"]
+            formatted_pairs = [[], []]
+            for row in data_pairs:
+                formatted_pairs[0] += [float(x[1]) for x in row]
+                formatted_pairs[1] += [float(x[2]) for x in row]
+
+            ymd_ax.scatter(formatted_pairs[0], formatted_pairs[1])
+
+        ### Tables ###
+        table_ax = fig.add_subplot(gs[1])
+        table_ax.axis("off")
+
+        labels_table_data = []
+        min_table_data = []
+        max_table_data = []
+
+        for key in self.min_table_dict.keys():
+            min_table_data.append("{:.3f}".format(cr_metrics[key]))
+        
+        for key in self.max_table_dict.keys():
+            labels_table_data.append(self.max_table_dict[key])
+            max_table_data.append("{:.3f}".format(cr_metrics[key]))
+
+        table_content = []
+
+        table_content.append([None, None, "Left Half", "Right Half"])
+        
+        for i, label in enumerate(labels_table_data):
+            if i < len(labels_table_data) - 2:
+                table_content.append([label, self.unit_lst[i], min_table_data[i], max_table_data[i]])
+            else:
+                table_content.append([label, self.unit_lst[i], None, max_table_data[i]])
+
+        metric_table = table_ax.table(
+            cellText=table_content,
+            loc="center",
+            cellLoc="center",
+            colWidths=[0.35, 0.20, 0.225, 0.225]
+        )
+        metric_table.scale(1.35, 3)
+        metric_table.auto_set_font_size(True)
+
+        for i in range(len(labels_table_data) + 1):
+            for j in range(4):
+                cell = metric_table[i, j]
+                cell.visible_edges = "TB"
+                cell.set_linewidth(1)
+                cell.set_facecolor("#f0f0f0")
+                cell.set_text_props(ha="center")
+                
+        for j in range(4):
+            cell = metric_table[0, j]
+            cell.visible_edges = "B"
+            cell.set_text_props(ha="center") # weight="bold", 
+        
+        # for i in range(1, len(labels_table_data) + 1):
+        #     cell = metric_table[i, 0]
+        #     cell.set_text_props(ha="center")
+
+        fig.tight_layout(pad=3.5)
+
+        pos = ymd_ax.get_position()
+        dy = -0.03375
+        ymd_ax.set_position([pos.x0, pos.y0 + dy, pos.width, pos.height])
+
+        return fig
@@ -0,0 +1,320 @@
+from src.vehicle_model.suspension_model.suspension_data import SuspensionData
+from src.vehicle_model.suspension_model.suspension import Suspension
+from src.simulations.qss._qss_helpers.ymd_result import YMDResult
+from src.simulations.qss._qss_helpers.ymd_continuation import solve_ymd_grid
+from src.simulations.qss._qss_helpers.ymd_batch import solve_ymd_grid_batch, ymd_residuals
+from src.simulations.qss._qss_helpers.ymd_adaptive import solve_ymd_adaptive
+from src.simulations.qss._qss_helpers.ymd_optimize import optimize_ymd_metrics
+from src._3_custom_libraries.simulation import SimulationContext
+from src._3_custom_libraries import telemetry
+
+from typing import Union, Sequence, Tuple, MutableSequence
+from scipy.optimize import fsolve
+
+import numpy as np
+import time
+
+
+class ConstantVelocity:
+    """
+    ## Constant Velocity
+
+    YMD operating condition with fixed forward velocity, where turn radius follows from lateral acceleration
+
+    Parameters
+    ----------
+    velX : float
+        Forward velocity in m/s
+    """
+    const_key = "velX"
+    mode = "CV"
+
+    # Cold start guess
+    COLD_START = [0, 0, 0, 0, 0, 0]
+
+    # Tire forces are rotated by each contact patch velocity angle
+    align_to_alpha = False
+
+    def __init__(self, velX: float) -> None:
+        self.value = velX
+
+    def speeds(self, accY: Union[float, np.ndarray]) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        ## Speeds
+
+        Forward velocity and turn radius at a given lateral acceleration
+
+        Parameters
+        ----------
+        accY : Union[float, np.ndarray]
+            Lateral acceleration in m/s^2
+
+        Returns
+        -------
+        Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]
+            Forward velocity (m/s) and turn radius (m)
+        """
+        velX = self.value + np.zeros_like(accY)
+
+        return velX, velX**2 / accY
+
+
+class ConstantRadius:
+    """
+    ## Constant Radius
+
+    YMD operating condition with fixed turn radius, where forward velocity follows from lateral acceleration
+
+    Parameters
+    ----------
+    turn_radius : float
+        Turn radius in m
+    """
+    const_key = "turn_radius"
+    mode = "CR"
+
+    # Cold start guess (accY starts at a non-zero value to avoid division by zero)
+    COLD_START = [0, 0.01, 0.01, 0, 0, 0]
+
+    # Tire forces are rotated by each slip angle
+    align_to_alpha = True
+
+    def __init__(self, turn_radius: float) -> None:
+        self.value = turn_radius
+
+    def speeds(self, accY: Union[float, np.ndarray]) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        ## Speeds
+
+        Forward velocity and turn radius at a given lateral acceleration
+
+        Parameters
+        ----------
+        accY : Union[float, np.ndarray]
+            Lateral acceleration in m/s^2
+
+        Returns
+        -------
+        Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]
+            Forward velocity (m/s) and turn radius (m)
+        """
+        return np.sqrt(np.abs(self.value * accY)), self.value + np.zeros_like(accY)
+
+
+class YMD:
+    """
+    ## YMD
+
+    Yaw moment diagram solver for one vehicle under a swappable operating condition
+    - The FMU, suspension, aero map, and fitted wheel rates are built once, so constant velocity and constant radius
+      sweeps of the same vehicle share them by changing only the constraint
+    - Model pieces come from a SimulationContext, by default the process-wide one of model_path, so a YMD built next to
+      a simulation of the same model reuses what that simulation already loaded
+
+    Parameters
+    ----------
+    model_path : str
+        Path to vehicle model yaml
+    constraint : Union[ConstantVelocity, ConstantRadius]
+        Operating condition held fixed across the diagram
+    hwa : float
+        Handwheel angle sweep half-range in degrees
+    beta : float
+        Body slip angle sweep half-range in degrees
+    refinement : int
+        Number of hwa and beta values in each sweep
+    solver : str, optional
+        Grid solver, "continuation" or "newton", by default "continuation"
+    adaptive : bool, optional
+        Solve only the hwa and beta lines the metrics need, with refinement setting the finest line spacing, by default False
+    adaptive_tol : float, optional
+        Relative change in the envelope metrics at which adaptive refinement stops, by default 1e-3
+    context : Union[SimulationContext, None], optional
+        Shared model pieces, by default the process-wide context of model_path
+    """
+    def __init__(self, model_path: str, constraint: Union[ConstantVelocity, ConstantRadius], hwa: float, beta: float, refinement: int,
+                 solver: str = "continuation", adaptive: bool = False, adaptive_tol: float = 1e-3,
+                 context: Union[SimulationContext, None] = None):
+        self.context = context if context is not None else SimulationContext.shared(model_path=model_path)
+
+        # Read FMU
+        self.kin_FMU = self.context.kin_FMU
+
+        # Simulation parameters
+        self.constraint = constraint
+        self.hwa = hwa
+        self.beta = beta
+        self.refinement = refinement
+        self.solver = solver
+        self.adaptive = adaptive
+        self.adaptive_tol = adaptive_tol
+
+        # Initialize simulation
+        self.sus_data: SuspensionData = self.context.sus_data
+        self.sus: Suspension = self.context.sus
+        self.aero = self.context.aero
+        self.initialize_funcs()
+
+        self.velX: float
+        self.turn_radius: float
+        self.gamma_vals: MutableSequence
+        self.delta_vals: MutableSequence
+        self.alpha_vals: MutableSequence
+
+    @property
+    def COLD_START(self) -> Sequence[float]:
+        return self.constraint.COLD_START
+
+    def run(self) -> YMDResult:
+        hwa_sweep = np.linspace(-self.hwa, self.hwa, self.refinement) # leave as deg
+        beta_sweep = np.linspace(-self.beta, self.beta, self.refinement) * np.pi / 180 # convert to rad
+
+        # Run simulation, either marching outward along the hwa = 0 line and then along each beta line, or batched over the whole grid
+        if self.adaptive:
+            hwa_sweep, beta_sweep, grid = solve_ymd_adaptive(model=self, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep, tol=self.adaptive_tol)
+        elif self.solver == "newton":
+            grid = solve_ymd_grid_batch(model=self, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep)
+        else:
+            grid = solve_ymd_grid(model=self, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep)
+
+        return YMDResult.from_grid(const_key=self.constraint.const_key, const=self.constraint.value, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep, grid=grid)
+    
+    def optimize_metrics(self) -> dict:
+        """
+        ## Optimize Metrics
+
+        Computes the YMD metrics directly with constrained optimization, without solving the diagram (see optimize_ymd_metrics())
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            Metrics with the same keys as QSS.ymd_metrics()
+        """
+        return optimize_ymd_metrics(model=self, hwa=self.hwa, beta=self.beta, refinement=self.refinement)
+
+    def solve_point(self, hwa: float, beta: float, x0: Union[Sequence[float], None] = None) -> dict:
+        """
+        ## Solve Point
+
+        Solves the force and moment balance at one (hwa, beta) point
+        - Starts from x0 when given (warm start), falling back to COLD_START if that solve fails
+
+        Parameters
+        ----------
+        hwa : float
+            Handwheel angle in degrees
+        beta : float
+            Body slip angle in radians
+        x0 : Union[Sequence[float], None], optional
+            Converged state of a neighbouring point, by default None (cold start)
+
+        Returns
+        -------
+        dict
+            Solved states and tire angles (rad) at the point, with warm start and convergence flags and the fsolve function evaluation count
+        """
+        start = time.perf_counter()
+        warm_start = x0 is not None
+        x, info, ier, _ = fsolve(self.physical_model, x0=x0 if warm_start else self.COLD_START, args=[hwa, beta], full_output=True)
+        nfev = info["nfev"]
+
+        if warm_start and ier != 1:
+            warm_start = False
+            x, info, ier, _ = fsolve(self.physical_model, x0=self.COLD_START, args=[hwa, beta], full_output=True)
+            nfev += info["nfev"]
+
+        telemetry.record(site=f"YMD {self.constraint.mode}", nfev=nfev, wall_time=time.perf_counter() - start, converged=ier == 1)
+
+        self.physical_model(x=x, args=[hwa, beta])
+
+        return {"x": list(x),
+                "gamma": list(self.gamma_vals),
+                "delta": list(self.delta_vals),
+                "alpha": list(self.alpha_vals),
+                "turn_radius": self.turn_radius,
+                "velX": self.velX,
+                "warm_start": warm_start,
+                "converged": ier == 1,
+                "nfev": nfev}
+    
+    def physical_model(self, x: Sequence[float], args: Tuple[float, float]) -> Sequence[float]:
+        """
+        ## Physical Model
+
+        Force and moment balance at one (hwa, beta) point, evaluated as a batch of one with physical_model_batch()
+        - Stores the operating condition and tire angles of the point for solve_point()
+
+        Parameters
+        ----------
+        x : Sequence[float]
+            States in the form [accX, accY, accYaw, heave, theta, phi]
+        args : Tuple[float, float]
+            Handwheel angle (deg) and body slip angle (rad)
+
+        Returns
+        -------
+        Sequence[float]
+            Force and moment residuals
+        """
+        residuals, outputs = self.physical_model_batch(x=np.asarray(x, dtype=float)[None, :], args=[[args[0]], [args[1]]])
+
+        self.velX = float(outputs["velX"][0])
+        self.turn_radius = float(outputs["turn_radius"][0])
+        self.gamma_vals = list(outputs["gamma"][0])
+        self.delta_vals = list(outputs["delta"][0])
+        self.alpha_vals = list(outputs["alpha"][0])
+
+        return residuals[0]
+
+    def physical_model_batch(self, x: np.ndarray, args: Sequence[np.ndarray]) -> Tuple[np.ndarray, dict[str, np.ndarray]]:
+        """
+        ## Physical Model (Batch)
+
+        Force and moment balance at N (hwa, beta) points at once (see ymd_residuals())
+
+        Parameters
+        ----------
+        x : np.ndarray
+            States in the form [accX, accY, accYaw, heave, theta, phi], shape (N, 6)
+        args : Sequence[np.ndarray]
+            Handwheel angles (deg) and body slip angles (rad), each shape (N,)
+
+        Returns
+        -------
+        Tuple[np.ndarray, dict[str, np.ndarray]]
+            Residuals (N, 6), and the tire angles, turn radius, and velocity at each point
+        """
+        hwa, beta = [np.asarray(arg, dtype=float) for arg in args]
+        x = np.asarray(x, dtype=float)
+
+        velX, turn_radius = self.constraint.speeds(x[:, 1])
+
+        return ymd_residuals(model=self, x=x, hwa=hwa, beta=beta, velX=velX, turn_radius=turn_radius, align_to_alpha=self.constraint.align_to_alpha)
+
+    def initialize_funcs(self) -> None:
+        # Motion ratio fits and wheel rates are fitted once per context and shared by every YMD built on it
+        motion_ratios = self.context.motion_ratios
+
+        self.FL_spring_MR_eqn = motion_ratios["FL_spring"]
+        self.FR_spring_MR_eqn = motion_ratios["FR_spring"]
+        self.RL_spring_MR_eqn = motion_ratios["RL_spring"]
+        self.RR_spring_MR_eqn = motion_ratios["RR_spring"]
+
+        self.Fr_stabar_MR_eqn = motion_ratios["Fr_stabar"]
+        self.Rr_stabar_MR_eqn = motion_ratios["Rr_stabar"]
+
+        # Store quarter car models
+        self.FL_quarter_car = self.sus.FL_quarter_car
+        self.FR_quarter_car = self.sus.FR_quarter_car
+        self.RL_quarter_car = self.sus.RL_quarter_car
+        self.RR_quarter_car = self.sus.RR_quarter_car
+
+        # Wheel rates (spring rate / MR^2), whose closed-form integrals give the elastic load transfer
+        self.FL_wheel_rate = self.context.wheel_rates["FL"]
+        self.FR_wheel_rate = self.context.wheel_rates["FR"]
+        self.RL_wheel_rate = self.context.wheel_rates["RL"]
+        self.RR_wheel_rate = self.context.wheel_rates["RR"]
\ No newline at end of file
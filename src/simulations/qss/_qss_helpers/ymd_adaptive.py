@@ -0,0 +1,218 @@
+from src.simulations.qss._qss_helpers.ymd_continuation import solve_ymd_grid
+from src.simulations.qss._qss_helpers.ymd_batch import solve_ymd_grid_batch
+
+from scipy.spatial import ConvexHull, QhullError # type: ignore
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+
+
+def coarse_indices(n: int, count: int) -> list[int]:
+    """
+    ## Coarse Indices
+
+    Evenly spaced indices into a sweep, always including both ends and the value nearest the center
+
+    Parameters
+    ----------
+    n : int
+        Number of sweep values
+    count : int
+        Number of indices to pick
+
+    Returns
+    -------
+    list[int]
+        Sorted sweep indices
+    """
+    indices = set(np.round(np.linspace(0, n - 1, min(count, n))).astype(int).tolist())
+    indices.add(n // 2)
+
+    return sorted(indices)
+
+
+def envelope_metrics(accY: np.ndarray, accYaw: np.ndarray) -> np.ndarray:
+    """
+    ## Envelope Metrics
+
+    Metrics set by the boundary of the diagram: peak accY, peak accYaw, and the accY limits of the trim (accYaw = 0) line
+
+    Parameters
+    ----------
+    accY : np.ndarray
+        Lateral acceleration at each solved point
+    accYaw : np.ndarray
+        Yaw acceleration at each solved point
+
+    Returns
+    -------
+    np.ndarray
+        [min accY, max accY, min accYaw, max accYaw, min trim accY, max trim accY]
+    """
+    pts = np.column_stack([np.ravel(accY), np.ravel(accYaw)])
+    hull_pts = pts[ConvexHull(pts).vertices]
+
+    # Hull edges crossing accYaw = 0
+    p1 = hull_pts
+    p2 = np.roll(hull_pts, -1, axis=0)
+    crossing = p1[:, 1] * p2[:, 1] < 0
+    t = -p1[crossing, 1] / (p2[crossing, 1] - p1[crossing, 1])
+    trim_accY = p1[crossing, 0] + t * (p2[crossing, 0] - p1[crossing, 0])
+
+    if len(trim_accY) == 0:
+        trim_accY = np.array([np.nan])
+
+    return np.array([pts[:, 0].min(), pts[:, 0].max(), pts[:, 1].min(), pts[:, 1].max(), trim_accY.min(), trim_accY.max()])
+
+
+def _split(indices: Sequence[int], position: int) -> list[int]:
+    # Sweep indices halfway between an active line and its active neighbours
+    splits = []
+
+    for neighbour in (position - 1, position + 1):
+        if 0 <= neighbour < len(indices) and abs(indices[neighbour] - indices[position]) > 1:
+            splits.append((indices[neighbour] + indices[position]) // 2)
+
+    return splits
+
+
+def refine_indices(accY: np.ndarray, accYaw: np.ndarray, hwa_idx: Sequence[int], beta_idx: Sequence[int],
+                   hwa_center: int, beta_center: int) -> Tuple[set[int], set[int]]:
+    """
+    ## Refine Indices
+
+    Picks the hwa and beta lines to add next
+    - Lines are split either side of every convex hull vertex, which also brackets the peaks and the trim crossings of the boundary
+    - Lines are split either side of the hwa = 0 and beta = 0 lines, where the control and stability derivatives are taken
+
+    Parameters
+    ----------
+    accY : np.ndarray
+        Lateral acceleration on the active grid, shape (len(beta_idx), len(hwa_idx))
+    accYaw : np.ndarray
+        Yaw acceleration on the active grid, shape (len(beta_idx), len(hwa_idx))
+    hwa_idx : Sequence[int]
+        Sorted hwa sweep indices of the active grid
+    beta_idx : Sequence[int]
+        Sorted beta sweep indices of the active grid
+    hwa_center : int
+        hwa sweep index nearest hwa = 0
+    beta_center : int
+        beta sweep index nearest beta = 0
+
+    Returns
+    -------
+    Tuple[set[int], set[int]]
+        New hwa sweep indices and new beta sweep indices
+    """
+    new_hwa: set[int] = set()
+    new_beta: set[int] = set()
+
+    pts = np.column_stack([accY.ravel(), accYaw.ravel()])
+
+    for vertex in ConvexHull(pts).vertices:
+        i, j = np.unravel_index(vertex, accY.shape)
+        new_beta.update(_split(beta_idx, int(i)))
+        new_hwa.update(_split(hwa_idx, int(j)))
+
+    new_hwa.update(_split(hwa_idx, list(hwa_idx).index(hwa_center)))
+    new_beta.update(_split(beta_idx, list(beta_idx).index(beta_center)))
+
+    return new_hwa - set(hwa_idx), new_beta - set(beta_idx)
+
+
+def _nearest_solved(solved: dict[Tuple[int, int], dict], i: int, j: int, beta_idx: Sequence[int], hwa_idx: Sequence[int]) -> Any:
+    # Converged state at the closest solved point on the same hwa or beta line
+    candidates = [(abs(k - i), (k, j)) for k in beta_idx if (k, j) in solved] + [(abs(k - j), (i, k)) for k in hwa_idx if (i, k) in solved]
+    candidates = [candidate for candidate in candidates if solved[candidate[1]]["converged"]]
+
+    if not candidates:
+        return None
+
+    return solved[min(candidates)[1]]["x"]
+
+
+def solve_ymd_adaptive(model: Any, hwa_sweep: Sequence[float], beta_sweep: Sequence[float], coarse: int = 5, tol: float = 1e-3,
+                       max_rounds: int = 10) -> Tuple[np.ndarray, np.ndarray, list[list[dict]]]:
+    """
+    ## Solve YMD Adaptive
+
+    Solves a YMD on a subset of the hwa and beta lines of a sweep, refined only where the metrics need resolution
+    - Starts from a coarse grid of lines, solved with the model's grid solver
+    - Each round adds lines either side of the convex hull vertices and of the hwa = 0 and beta = 0 lines,
+      warm starting every new point from the closest solved point on its hwa or beta line
+    - Stops when no lines are left to add or the envelope metrics change by less than tol (relative to their magnitude) between rounds
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing solve_point() and solver
+    hwa_sweep : Sequence[float]
+        Finest handwheel angle sweep in degrees
+    beta_sweep : Sequence[float]
+        Finest body slip angle sweep in radians
+    coarse : int, optional
+        Number of hwa and beta lines in the starting grid, by default 5
+    tol : float, optional
+        Relative change in the envelope metrics treated as converged, by default 1e-3
+    max_rounds : int, optional
+        Maximum number of refinement rounds, by default 10
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, list[list[dict]]]
+        Active hwa values (deg), active beta values (rad), and solved points indexed [beta][hwa]
+    """
+    hwa_sweep = np.asarray(hwa_sweep, dtype=float)
+    beta_sweep = np.asarray(beta_sweep, dtype=float)
+
+    hwa_center = int(np.argmin(np.abs(hwa_sweep)))
+    beta_center = int(np.argmin(np.abs(beta_sweep)))
+
+    hwa_idx = sorted(set(coarse_indices(n=len(hwa_sweep), count=coarse)) | {hwa_center})
+    beta_idx = sorted(set(coarse_indices(n=len(beta_sweep), count=coarse)) | {beta_center})
+
+    # Starting grid
+    if model.solver == "newton":
+        grid = solve_ymd_grid_batch(model=model, hwa_sweep=hwa_sweep[hwa_idx], beta_sweep=beta_sweep[beta_idx])
+    else:
+        grid = solve_ymd_grid(model=model, hwa_sweep=hwa_sweep[hwa_idx], beta_sweep=beta_sweep[beta_idx])
+
+    solved = {(i, j): point for i, line in zip(beta_idx, grid) for j, point in zip(hwa_idx, line)}
+    previous = None
+
+    for _ in range(max_rounds):
+        accY = np.array([[solved[(i, j)]["x"][1] for j in hwa_idx] for i in beta_idx])
+        accYaw = np.array([[solved[(i, j)]["x"][2] for j in hwa_idx] for i in beta_idx])
+
+        try:
+            metrics = envelope_metrics(accY=accY, accYaw=accYaw)
+            new_hwa, new_beta = refine_indices(accY=accY, accYaw=accYaw, hwa_idx=hwa_idx, beta_idx=beta_idx,
+                                               hwa_center=hwa_center, beta_center=beta_center)
+        except QhullError:
+            # Degenerate diagram (e.g. every point on one line), refine everywhere
+            metrics = np.full(6, np.nan)
+            new_hwa = set(coarse_indices(n=len(hwa_sweep), count=2 * len(hwa_idx) - 1)) - set(hwa_idx)
+            new_beta = set(coarse_indices(n=len(beta_sweep), count=2 * len(beta_idx) - 1)) - set(beta_idx)
+
+        # Rounds without metrics (NaN) never count as converged, so a degenerate diagram keeps refining
+        if previous is not None and not np.isnan(metrics).any() and not np.isnan(previous).any() and \
+                np.allclose(metrics, previous, rtol=tol, atol=1e-9):
+            break
+        if not new_hwa and not new_beta:
+            break
+
+        previous = metrics
+
+        # New beta lines across the current hwa lines, then new hwa lines across every beta line
+        beta_idx = sorted(set(beta_idx) | new_beta)
+        for i in sorted(new_beta, key=lambda k: abs(k - beta_center)):
+            for j in hwa_idx:
+                solved[(i, j)] = model.solve_point(hwa=hwa_sweep[j], beta=beta_sweep[i], x0=_nearest_solved(solved, i, j, beta_idx, hwa_idx))
+
+        hwa_idx = sorted(set(hwa_idx) | new_hwa)
+        for j in sorted(new_hwa, key=lambda k: abs(k - hwa_center)):
+            for i in beta_idx:
+                solved[(i, j)] = model.solve_point(hwa=hwa_sweep[j], beta=beta_sweep[i], x0=_nearest_solved(solved, i, j, beta_idx, hwa_idx))
+
+    return hwa_sweep[hwa_idx], beta_sweep[beta_idx], [[solved[(i, j)] for j in hwa_idx] for i in beta_idx]
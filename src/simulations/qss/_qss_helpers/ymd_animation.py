@@ -0,0 +1,84 @@
+from typing import Any, Union
+from io import BytesIO
+
+import imageio.v2 as imageio
+import numpy as np
+
+
+class YMDAnimation:
+    """
+    ## YMD Animation
+
+    Animation of the CV yaw moment diagrams across the velocity schedule, encoded as the diagrams are solved
+    - Frames are RGB buffers (see QSSPlots.cv_ymd_frame()), appended to the writer as soon as they arrive
+    - The animation plays forward then backward, so forward frames are kept PNG-encoded until close() appends them in reverse
+    - The writer is opened on the first frame, so nothing is written when there are no CV diagrams
+    - The container follows the output extension (.gif loops forever, .mp4 goes through imageio-ffmpeg)
+
+    Parameters
+    ----------
+    output_path : str
+        Path to the animation file
+    fps : int, optional
+        Frames per second, by default 30
+    """
+    def __init__(self, output_path: str, fps: int = 30) -> None:
+        self.output_path = output_path
+        self.fps = fps
+
+        self.writer: Union[Any, None] = None
+        self.frames: list[bytes] = []
+
+    def add_frame(self, frame: np.ndarray) -> None:
+        """
+        ## Add Frame
+
+        Encodes the next frame
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            RGB frame, shape (height, width, 3)
+
+        Returns
+        -------
+        None
+        """
+        if self.writer is None:
+            if self.output_path.endswith(".gif"):
+                self.writer = imageio.get_writer(self.output_path, mode='I', fps=self.fps, loop=0)
+            else:
+                self.writer = imageio.get_writer(self.output_path, fps=self.fps)
+
+        self.writer.append_data(frame)
+
+        # Compressed, a frame takes a small fraction of its raw RGB size
+        buffer = BytesIO()
+        imageio.imwrite(buffer, frame, format="png")
+        self.frames.append(buffer.getvalue())
+
+    def close(self) -> int:
+        """
+        ## Close
+
+        Appends the reversed frames and finishes the file
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            Number of frames written
+        """
+        if self.writer is None:
+            return 0
+
+        for frame in self.frames[::-1]:
+            self.writer.append_data(imageio.imread(frame, format="png"))
+
+        self.writer.close()
+        self.writer = None
+
+        return 2 * len(self.frames)
@@ -0,0 +1,187 @@
+from src._3_custom_libraries.newton import batch_newton
+from src._3_custom_libraries import telemetry
+from src.vehicle_model.suspension_model.suspension_elements._2_elements.tire import tire_eval_corners
+
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+import time
+
+
+CORNERS = ("FL", "FR", "RL", "RR")
+
+
+def _rotate_z(vectors: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    cos_t = np.cos(angles)
+    sin_t = np.sin(angles)
+
+    return np.column_stack([cos_t * vectors[:, 0] - sin_t * vectors[:, 1], sin_t * vectors[:, 0] + cos_t * vectors[:, 1], vectors[:, 2]])
+
+
+def ymd_residuals(model: Any, x: np.ndarray, hwa: np.ndarray, beta: np.ndarray, velX: np.ndarray, turn_radius: np.ndarray,
+                  align_to_alpha: bool) -> Tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    ## YMD Residuals
+
+    Vectorized force and moment balance of a YMD model, evaluated at N points at once
+    - physical_model() evaluates single points as a batch of one, so this is the only force and moment balance
+
+    Parameters
+    ----------
+    model : Any
+        YMD model providing kin_FMU, sus, aero, quarter cars, and wheel rate models
+    x : np.ndarray
+        States in the form [accX, accY, accYaw, heave, theta, phi], shape (N, 6)
+    hwa : np.ndarray
+        Handwheel angles in degrees, shape (N,)
+    beta : np.ndarray
+        Body slip angles in radians, shape (N,)
+    velX : np.ndarray
+        Vehicle speeds in m/s, shape (N,)
+    turn_radius : np.ndarray
+        Turn radii in m, shape (N,)
+    align_to_alpha : bool
+        Rotate tire forces by slip angle (constant radius) rather than by wheel velocity angle (constant velocity)
+
+    Returns
+    -------
+    Tuple[np.ndarray, dict[str, np.ndarray]]
+        Residuals (N, 6), and the gamma, delta, alpha (N, 4, rad), turn_radius, and velX (N,) at each point
+    """
+    accX, accY, accYaw, heave, theta, phi = x.T
+    n_points = len(x)
+    total_mass = model.sus.total_mass
+
+    vehVel = velX[:, None] * np.column_stack([np.cos(beta), np.sin(beta), np.zeros(n_points)])
+    velYaw = (np.sin(beta) * accX + np.cos(beta) * accY) / np.abs(velX)
+
+    # Kinematics
+    query_points = np.column_stack([hwa, heave, theta, phi])
+    fmu = lambda key: model.kin_FMU[key](query_points)
+
+    cg_pos = np.column_stack([fmu("veh_CG_x"), fmu("veh_CG_y"), fmu("veh_CG_z")])
+    cp_pos = {corner: np.column_stack([fmu(f"{corner}_cp_x"), fmu(f"{corner}_cp_y"), fmu(f"{corner}_cp_z")]) for corner in CORNERS}
+    cp_wrt_cg = {corner: cp_pos[corner] - cg_pos for corner in CORNERS}
+
+    gamma = np.column_stack([fmu(f"{corner}_gamma") for corner in CORNERS]) * np.pi / 180
+    delta = np.column_stack([fmu(f"{corner}_delta") for corner in CORNERS]) * np.pi / 180
+    jounce = np.column_stack([fmu(f"{corner}_wheel_jounce") for corner in CORNERS])
+
+    # Wheel velocities and slip angles
+    wheel_vel = np.stack([vehVel + np.column_stack([-velYaw * cp_wrt_cg[corner][:, 1], velYaw * cp_wrt_cg[corner][:, 0], np.zeros(n_points)])
+                          for corner in CORNERS], axis=1)
+    vel_ang = np.arctan2(wheel_vel[:, :, 1], wheel_vel[:, :, 0])
+    alpha = delta - vel_ang
+
+    # Wheel rates
+    quarter_cars = [getattr(model, f"{corner}_quarter_car") for corner in CORNERS]
+    wheel_rates = [getattr(model, f"{corner}_wheel_rate") for corner in CORNERS]
+    wheelrate = lambda i, z: wheel_rates[i].rate(z)
+
+    # Inelastic load transfer
+    wheelbase = np.abs(cp_pos["FL"][:, 0] - cp_pos["RL"][:, 0])
+    front_track = np.abs(cp_pos["FL"][:, 1] - cp_pos["FR"][:, 1])
+    rear_track = np.abs(cp_pos["RL"][:, 1] - cp_pos["RR"][:, 1])
+    cg_height = cg_pos[:, 2]
+
+    Fr_roll_stiffness = 1 / 4 * front_track**2 * (wheelrate(0, jounce[:, 0]) + wheelrate(1, jounce[:, 1]))
+    Rr_roll_stiffness = 1 / 4 * rear_track**2 * (wheelrate(2, jounce[:, 2]) + wheelrate(3, jounce[:, 3]))
+    total_roll_stiffness = Fr_roll_stiffness + Rr_roll_stiffness
+
+    Fr_delta_lat = total_mass * accY * cg_height / front_track * (Fr_roll_stiffness / total_roll_stiffness)
+    Rr_delta_lat = total_mass * accY * cg_height / rear_track * (Rr_roll_stiffness / total_roll_stiffness)
+    delta_long = (total_mass * accX * cg_height / wheelbase) / 2
+
+    delta_inelastic = np.column_stack([-Fr_delta_lat - delta_long, Fr_delta_lat - delta_long, -Rr_delta_lat + delta_long, Rr_delta_lat + delta_long])
+
+    # Elastic load transfer, from the closed-form integral of each wheel rate
+    delta_elastic = np.column_stack([wheel_rates[i].force(jounce[:, i]) for i in range(4)])
+
+    static_weight = np.array([quarter_car.static_weight for quarter_car in quarter_cars])
+    Fz = static_weight + delta_inelastic + delta_elastic
+
+    # Tire loads
+    align_ang = alpha if align_to_alpha else vel_ang
+    tire_output = tire_eval_corners(tires=[quarter_car.tire for quarter_car in quarter_cars], FZ=Fz, alpha=alpha, kappa=0, gamma=gamma)
+    tire_forces = [_rotate_z(vectors=tire_output[:, i, 0:3], angles=align_ang[:, i]) for i in range(4)]
+
+    # Aero loads
+    aero_loads = model.aero.eval_many(roll=phi, pitch=theta, yaw=beta * 180 / np.pi, vel=velX)
+
+    # Forces and moments
+    gravity_force = np.array([0, 0, total_mass * 9.81])
+    suspension_forces = sum(tire_forces)
+    suspension_moments = sum(np.cross(cp_wrt_cg[corner], force) for corner, force in zip(CORNERS, tire_forces))
+
+    vehicle_centric_forces = -1 * gravity_force + suspension_forces + aero_loads[:, :3]
+    vehicle_centric_moments = suspension_moments + aero_loads[:, 3:]
+
+    sum_force = total_mass * np.column_stack([accX, accY, np.zeros(n_points)])
+    sum_moment = np.column_stack([np.zeros(n_points), np.zeros(n_points), 108.2 * accYaw])
+
+    residuals = np.column_stack([vehicle_centric_forces - sum_force, vehicle_centric_moments - sum_moment])
+    outputs = {"gamma": gamma, "delta": delta, "alpha": alpha, "turn_radius": turn_radius, "velX": velX}
+
+    return residuals, outputs
+
+
+def solve_ymd_grid_batch(model: Any, hwa_sweep: Sequence[float], beta_sweep: Sequence[float]) -> list[list[dict]]:
+    """
+    ## Solve YMD Grid (Batch)
+
+    Solves every point of a YMD grid simultaneously with a batched damped Newton method
+    - Points that fail to converge are re-solved individually with solve_point(), seeded from the batched result
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing physical_model_batch(), solve_point(), and COLD_START
+    hwa_sweep : Sequence[float]
+        Handwheel angle sweep in degrees
+    beta_sweep : Sequence[float]
+        Body slip angle sweep in radians
+
+    Returns
+    -------
+    list[list[dict]]
+        Solved points indexed as [beta index][hwa index]
+    """
+    beta_grid, hwa_grid = np.meshgrid(beta_sweep, hwa_sweep, indexing='ij')
+    hwa_vals = hwa_grid.ravel()
+    beta_vals = beta_grid.ravel()
+
+    nfev = [0]
+
+    def func(x: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        # Residual evaluations are counted per point
+        nfev[0] += len(rows)
+        return model.physical_model_batch(x=x, args=[hwa_vals[rows], beta_vals[rows]])[0]
+
+    x0 = np.tile(np.array(model.COLD_START, dtype=float), (len(hwa_vals), 1))
+
+    start = time.perf_counter()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x, converged, _ = batch_newton(func=func, x0=x0)
+        _, outputs = model.physical_model_batch(x=x, args=[hwa_vals, beta_vals])
+
+    # Points the batch misses fall back to solve_point(), which records them under its own site
+    telemetry.record(site="YMD batch Newton", nfev=nfev[0], wall_time=time.perf_counter() - start, converged=int(converged.sum()),
+                     calls=len(converged))
+
+    points = []
+    for i, (hwa, beta) in enumerate(zip(hwa_vals, beta_vals)):
+        if converged[i]:
+            points.append({"x": list(x[i]),
+                           "gamma": list(outputs["gamma"][i]),
+                           "delta": list(outputs["delta"][i]),
+                           "alpha": list(outputs["alpha"][i]),
+                           "turn_radius": float(outputs["turn_radius"][i]),
+                           "velX": float(outputs["velX"][i]),
+                           "warm_start": False,
+                           "converged": True})
+        else:
+            points.append(model.solve_point(hwa=hwa, beta=beta, x0=x[i] if np.all(np.isfinite(x[i])) else None))
+
+    n_hwa = len(hwa_sweep)
+
+    return [points[i * n_hwa:(i + 1) * n_hwa] for i in range(len(beta_sweep))]
@@ -0,0 +1,232 @@
+from typing import Any, Sequence, Tuple, Union
+
+import numpy as np
+
+
+def outward_indices(n: int) -> tuple[list[int], list[int]]:
+    """
+    ## Outward Indices
+
+    Splits a sweep into two marches that start at its center and run out to either end
+
+    Parameters
+    ----------
+    n : int
+        Number of sweep values
+
+    Returns
+    -------
+    tuple[list[int], list[int]]
+        Indices from the center to the last value, and from the center to the first value
+    """
+    center = n // 2
+
+    return list(range(center, n)), list(range(center, -1, -1))
+
+
+def march(model: Any, hwa_vals: Sequence[float], beta_vals: Sequence[float], x0: Union[Sequence[float], None] = None) -> list[dict]:
+    """
+    ## March
+
+    Solves a sequence of neighbouring YMD points, seeding each solve with the last converged state
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing solve_point()
+    hwa_vals : Sequence[float]
+        Handwheel angle of each point in degrees
+    beta_vals : Sequence[float]
+        Body slip angle of each point in radians
+    x0 : Union[Sequence[float], None], optional
+        Seed for the first point, by default None (cold start)
+
+    Returns
+    -------
+    list[dict]
+        Solved points, in march order
+    """
+    points = []
+
+    for hwa, beta in zip(hwa_vals, beta_vals):
+        point = model.solve_point(hwa=hwa, beta=beta, x0=x0)
+        points.append(point)
+
+        if point["converged"]:
+            x0 = point["x"]
+
+    return points
+
+
+def solve_ymd_spine(model: Any, hwa_sweep: Sequence[float], beta_sweep: Sequence[float]) -> list[dict]:
+    """
+    ## Solve YMD Spine
+
+    Solves the center hwa line of a YMD grid, marching outward in beta from a cold start at its center
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing solve_point()
+    hwa_sweep : Sequence[float]
+        Handwheel angle sweep in degrees
+    beta_sweep : Sequence[float]
+        Body slip angle sweep in radians
+
+    Returns
+    -------
+    list[dict]
+        Solved points, one per beta value
+    """
+    hwa = hwa_sweep[len(hwa_sweep) // 2]
+    upper, lower = outward_indices(n=len(beta_sweep))
+
+    spine: list[dict] = [{}] * len(beta_sweep)
+    upper_points = march(model=model, hwa_vals=[hwa] * len(upper), beta_vals=[beta_sweep[i] for i in upper])
+    x0 = upper_points[0]["x"] if upper_points[0]["converged"] else None
+    lower_points = march(model=model, hwa_vals=[hwa] * (len(lower) - 1), beta_vals=[beta_sweep[i] for i in lower[1:]], x0=x0)
+
+    for index, point in zip(upper + lower[1:], upper_points + lower_points):
+        spine[index] = point
+
+    return spine
+
+
+def solve_ymd_line(model: Any, hwa_sweep: Sequence[float], beta: float, center_point: dict) -> list[dict]:
+    """
+    ## Solve YMD Line
+
+    Solves one beta line of a YMD grid, marching outward in hwa from its solved spine point
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing solve_point()
+    hwa_sweep : Sequence[float]
+        Handwheel angle sweep in degrees
+    beta : float
+        Body slip angle of the line in radians
+    center_point : dict
+        Solved spine point of the line, from solve_ymd_spine()
+
+    Returns
+    -------
+    list[dict]
+        Solved points, one per hwa value
+    """
+    upper, lower = outward_indices(n=len(hwa_sweep))
+    x0 = center_point["x"] if center_point["converged"] else None
+
+    line: list[dict] = [{}] * len(hwa_sweep)
+    line[upper[0]] = center_point
+
+    for indices in (upper[1:], lower[1:]):
+        for index, point in zip(indices, march(model=model, hwa_vals=[hwa_sweep[i] for i in indices], beta_vals=[beta] * len(indices), x0=x0)):
+            line[index] = point
+
+    return line
+
+
+def solve_ymd_grid(model: Any, hwa_sweep: Sequence[float], beta_sweep: Sequence[float]) -> list[list[dict]]:
+    """
+    ## Solve YMD Grid
+
+    Solves a full YMD grid by continuation: the spine first, then every beta line seeded from it
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing solve_point()
+    hwa_sweep : Sequence[float]
+        Handwheel angle sweep in degrees
+    beta_sweep : Sequence[float]
+        Body slip angle sweep in radians
+
+    Returns
+    -------
+    list[list[dict]]
+        Solved points indexed as [beta index][hwa index]
+    """
+    spine = solve_ymd_spine(model=model, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep)
+
+    return [solve_ymd_line(model=model, hwa_sweep=hwa_sweep, beta=beta, center_point=center_point) for beta, center_point in zip(beta_sweep, spine)]
+
+
+def schedule_seeds(history: Sequence[Tuple[float, list[list[dict]]]], value: float) -> Union[list[list[Union[list[float], None]]], None]:
+    """
+    ## Schedule Seeds
+
+    Seeds the grid of a schedule entry from the grids of the entries before it
+    - Each point's seed is its converged state at the last two entries, extrapolated linearly in the schedule value,
+      or the last converged state alone if the point didn't converge at the entry before
+
+    Parameters
+    ----------
+    history : Sequence[Tuple[float, list[list[dict]]]]
+        Schedule value and solved grid of each previous entry, in schedule order, on the same hwa and beta sweeps
+    value : float
+        Schedule value of the entry to seed
+
+    Returns
+    -------
+    Union[list[list[Union[list[float], None]]], None]
+        Seed of each point indexed as [beta index][hwa index] (None where no previous entry converged), or None without history
+    """
+    if not history:
+        return None
+
+    last_value, last_grid = history[-1]
+    prev_value, prev_grid = history[-2] if len(history) > 1 else (last_value, last_grid)
+
+    seeds: list[list[Union[list[float], None]]] = []
+    for last_line, prev_line in zip(last_grid, prev_grid):
+        seed_line: list[Union[list[float], None]] = []
+
+        for last, prev in zip(last_line, prev_line):
+            if not last["converged"]:
+                seed_line.append(None)
+            elif prev["converged"] and prev_value != last_value:
+                slope = (np.array(last["x"]) - np.array(prev["x"])) / (last_value - prev_value)
+                seed_line.append(list(np.array(last["x"]) + slope * (value - last_value)))
+            else:
+                seed_line.append(last["x"])
+
+        seeds.append(seed_line)
+
+    return seeds
+
+
+def solve_ymd_seeded_line(model: Any, hwa_sweep: Sequence[float], beta: float, seeds: Sequence[Union[Sequence[float], None]]) -> list[dict]:
+    """
+    ## Solve YMD Seeded Line
+
+    Solves one beta line of a YMD grid from a seed per point (see schedule_seeds())
+    - Points without a seed start from the last converged point of the line, as in march()
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing solve_point()
+    hwa_sweep : Sequence[float]
+        Handwheel angle sweep in degrees
+    beta : float
+        Body slip angle of the line in radians
+    seeds : Sequence[Union[Sequence[float], None]]
+        Seed of each point, one per hwa value
+
+    Returns
+    -------
+    list[dict]
+        Solved points, one per hwa value
+    """
+    line = []
+    x0 = None
+
+    for hwa, seed in zip(hwa_sweep, seeds):
+        point = model.solve_point(hwa=hwa, beta=beta, x0=seed if seed is not None else x0)
+        line.append(point)
+
+        if point["converged"]:
+            x0 = point["x"]
+
+    return line
@@ -0,0 +1,223 @@
+from src._3_custom_libraries import telemetry
+
+from scipy.optimize import brentq, minimize # type: ignore
+from typing import Any, Tuple, Union
+
+import numpy as np
+import time
+
+
+# Typical magnitude of each state [accX, accY, accYaw, heave, theta, phi], so optimization variables are of order one
+STATE_SCALE = np.array([1, 10, 10, 0.01, 1, 1])
+
+# Largest |accYaw| in rad/s^2 at which a point counts as trimmed
+TRIM_TOL = 1e-3
+
+
+def _point_metrics(point: dict, hwa: float, beta: float) -> dict:
+    # Quantities QSS reports at a solved point, with angles in degrees
+    return {"accY": point["x"][1],
+            "accYaw": point["x"][2],
+            "hwa": hwa,
+            "beta": beta * 180 / np.pi,
+            "alpha": tuple(np.rad2deg(point["alpha"])),
+            "tire_steer": np.rad2deg(np.mean(point["delta"][:2]))}
+
+
+def _solve(model: Any, hwa: float, beta: float, x0: Union[np.ndarray, None] = None) -> Tuple[dict, dict]:
+    point = model.solve_point(hwa=hwa, beta=beta, x0=None if x0 is None else list(x0))
+
+    return point, _point_metrics(point=point, hwa=hwa, beta=beta)
+
+
+def optimize_peak(model: Any, key: str, sign: float, hwa_max: float, beta_max: float, seed: Tuple[float, float, np.ndarray],
+                  trim: bool = False) -> Tuple[dict, dict]:
+    """
+    ## Optimize Peak
+
+    Finds the extreme of accY or accYaw over the (hwa, beta) box, subject to the force and moment balance
+    - Optimization variables are (hwa, beta, state), with the physical model residuals as equality constraints (SLSQP)
+    - With trim, accYaw = 0 is added as a constraint
+    - The optimum is re-solved with solve_point() to recover the full point, falling back to the seed if SLSQP fails
+    - With trim, the seed is only a fallback if it is itself trimmed, otherwise a failed optimization reports NaN metrics
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing physical_model(), solve_point(), and sus.total_mass
+    key : str
+        Quantity to extremize, "accY" or "accYaw"
+    sign : float
+        1 to maximize, -1 to minimize
+    hwa_max : float
+        Handwheel angle bound in degrees
+    beta_max : float
+        Body slip angle bound in radians
+    seed : Tuple[float, float, np.ndarray]
+        Starting hwa (deg), beta (rad), and solved state
+    trim : bool, optional
+        Constrain accYaw to zero, by default False
+
+    Returns
+    -------
+    Tuple[dict, dict]
+        Solved point at the optimum, and its reported quantities
+    """
+    index = {"accY": 1, "accYaw": 2}[key]
+    weight = model.sus.total_mass * 9.81
+
+    def unpack(z: np.ndarray) -> Tuple[float, float, np.ndarray]:
+        return z[0] * hwa_max, z[1] * beta_max, z[2:] * STATE_SCALE
+
+    def residuals(z: np.ndarray) -> np.ndarray:
+        hwa, beta, x = unpack(z)
+
+        return np.asarray(model.physical_model(x=x, args=[hwa, beta])) / weight
+
+    objective_jac = np.zeros(8)
+    objective_jac[2 + index] = -sign * STATE_SCALE[index]
+
+    constraints = [{"type": "eq", "fun": residuals}]
+    if trim:
+        constraints.append({"type": "eq", "fun": lambda z: np.array([z[4]]), "jac": lambda z: np.eye(8)[4:5]})
+
+    hwa_seed, beta_seed, x_seed = seed
+    z0 = np.concatenate([[hwa_seed / hwa_max, beta_seed / beta_max], np.asarray(x_seed) / STATE_SCALE])
+    bounds = [(-1, 1), (-1, 1)] + [(None, None)] * 6
+
+    start = time.perf_counter()
+    result = minimize(lambda z: objective_jac @ z, x0=z0, jac=lambda z: objective_jac, bounds=bounds, constraints=constraints, method="SLSQP",
+                      options={"maxiter": 100, "ftol": 1e-9})
+    telemetry.record(site="YMD direct SLSQP", nfev=result.nfev, wall_time=time.perf_counter() - start, converged=bool(result.success))
+
+    hwa, beta, x = unpack(result.x)
+    point, metrics = _solve(model=model, hwa=hwa, beta=beta, x0=x)
+
+    optimized = result.success and point["converged"] and (not trim or abs(metrics["accYaw"]) < TRIM_TOL)
+    seed_valid = not trim or abs(x_seed[2]) < TRIM_TOL
+
+    # Keep the seed if the optimization failed or landed somewhere worse, as long as the seed satisfies the same constraints
+    if seed_valid and (not optimized or sign * metrics[key] < sign * x_seed[index]):
+        return _solve(model=model, hwa=hwa_seed, beta=beta_seed, x0=x_seed)
+
+    if not optimized:
+        return point, dict.fromkeys(metrics, np.nan)
+
+    return point, metrics
+
+
+def _slope(model: Any, hwa: float, beta: float, x0: np.ndarray, step: float, wrt: str, hwa_max: float, beta_max: float) -> float:
+    # Central (one-sided at the bounds) difference of accYaw along a grid line, per degree of average front tire steer or beta
+    if wrt == "hwa":
+        ends = [(float(np.clip(hwa + offset, -hwa_max, hwa_max)), beta) for offset in (-step, step)]
+    else:
+        ends = [(hwa, float(np.clip(beta + offset, -beta_max, beta_max))) for offset in (-step, step)]
+
+    (_, low), (_, high) = [_solve(model=model, hwa=end[0], beta=end[1], x0=x0) for end in ends]
+    denominator = high["tire_steer"] - low["tire_steer"] if wrt == "hwa" else high["beta"] - low["beta"]
+
+    return (high["accYaw"] - low["accYaw"]) / denominator
+
+
+def _trim_seed(model: Any, hwa: float, beta_max: float, fallback: Tuple[float, float, np.ndarray]) -> Tuple[float, float, np.ndarray]:
+    # Root of accYaw along the beta line at hwa, found with Brent's method
+    accYaw = lambda beta: model.solve_point(hwa=hwa, beta=beta)["x"][2]
+
+    try:
+        beta = brentq(accYaw, -beta_max, beta_max, xtol=1e-6)
+    except ValueError:
+        return fallback
+
+    return hwa, beta, np.asarray(model.solve_point(hwa=hwa, beta=beta)["x"])
+
+
+def optimize_ymd_metrics(model: Any, hwa: float, beta: float, refinement: int) -> dict:
+    """
+    ## Optimize YMD Metrics
+
+    Computes the QSS YMD metrics directly, without solving a diagram
+    - Peak accY and accYaw come from constrained optimization over (hwa, beta) (see optimize_peak()), seeded from a 3x3 scan
+    - Peak trim accY starts from the accYaw = 0 root on the full-lock hwa lines, then is optimized with accYaw = 0 as a constraint
+    - Control and stability derivatives are differences along the grid lines through each point, with the same spacing as a
+      Refinement-line diagram
+
+    Parameters
+    ----------
+    model : Any
+        YMD model exposing physical_model(), solve_point(), and sus.total_mass
+    hwa : float
+        Handwheel angle sweep half-range in degrees
+    beta : float
+        Body slip angle sweep half-range in degrees
+    refinement : int
+        Number of hwa and beta values a diagram would use, setting the derivative step
+
+    Returns
+    -------
+    dict
+        Metrics with the same keys as QSS.ymd_metrics()
+    """
+    beta_max = beta * np.pi / 180
+    hwa_step = 2 * hwa / (refinement - 1)
+    beta_step = 2 * beta_max / (refinement - 1)
+
+    # Coarse scan, used as seeds
+    scan = []
+    for hwa_val in (-hwa, 0, hwa):
+        for beta_val in (-beta_max, 0, beta_max):
+            point = model.solve_point(hwa=hwa_val, beta=beta_val)
+            scan.append((hwa_val, beta_val, np.asarray(point["x"])))
+
+    best = lambda index, sign: max(scan, key=lambda seed: sign * seed[2][index])
+
+    peaks = {}
+    for key, index in (("accY", 1), ("accYaw", 2)):
+        for label, sign in (("min", -1), ("max", 1)):
+            peaks[(key, label)] = optimize_peak(model=model, key=key, sign=sign, hwa_max=hwa, beta_max=beta_max, seed=best(index, sign))
+
+    trims = {}
+    for label, sign in (("min", -1), ("max", 1)):
+        # Peak accY sits at full lock, opposite in sign to hwa
+        seed = _trim_seed(model=model, hwa=-sign * hwa, beta_max=beta_max, fallback=min(scan, key=lambda seed: abs(seed[2][2])))
+        trims[label] = optimize_peak(model=model, key="accY", sign=sign, hwa_max=hwa, beta_max=beta_max, seed=seed, trim=True)[1]
+
+    # Derivatives at zero steer and zero slip
+    center_x = np.asarray(model.solve_point(hwa=0, beta=0)["x"])
+    dN_dd_b0 = _slope(model=model, hwa=0, beta=0, x0=center_x, step=hwa_step, wrt="hwa", hwa_max=hwa, beta_max=beta_max)
+    dN_db_d0 = _slope(model=model, hwa=0, beta=0, x0=center_x, step=beta_step, wrt="beta", hwa_max=hwa, beta_max=beta_max)
+
+    # Derivatives at peak accY
+    slopes = {}
+    for label in ("min", "max"):
+        point, metrics = peaks[("accY", label)]
+        hwa_val, beta_val = metrics["hwa"], metrics["beta"] * np.pi / 180
+        slopes[("dd", label)] = _slope(model=model, hwa=hwa_val, beta=beta_val, x0=np.asarray(point["x"]), step=hwa_step, wrt="hwa",
+                                       hwa_max=hwa, beta_max=beta_max)
+        slopes[("db", label)] = _slope(model=model, hwa=hwa_val, beta=beta_val, x0=np.asarray(point["x"]), step=beta_step, wrt="beta",
+                                       hwa_max=hwa, beta_max=beta_max)
+
+    metric_dict = {"min_trim_accY": trims["min"]["accY"],
+                   "max_trim_accY": trims["max"]["accY"],
+                   "dN_dd_b1_neg_accY": slopes[("dd", "min")],
+                   "dN_dd_b1_pos_accY": slopes[("dd", "max")],
+                   "dN_db_d1_neg_accY": slopes[("db", "min")],
+                   "dN_db_d1_pos_accY": slopes[("db", "max")],
+                   "dN_dd_b0": dN_dd_b0,
+                   "dN_db_d0": dN_db_d0}
+
+    for label in ("min", "max"):
+        accY_metrics = peaks[("accY", label)][1]
+        accYaw_metrics = peaks[("accYaw", label)][1]
+
+        metric_dict.update({f"{label}_accY": accY_metrics["accY"],
+                            f"N_at_{label}_accY": accY_metrics["accYaw"],
+                            f"alpha_at_{label}_accY": accY_metrics["alpha"],
+                            f"beta_at_{label}_accY": accY_metrics["beta"],
+                            f"hwa_at_{label}_accY": accY_metrics["hwa"],
+                            f"{label}_N": accYaw_metrics["accYaw"],
+                            f"alpha_at_{label}_N": accYaw_metrics["alpha"],
+                            f"beta_at_{label}_N": accYaw_metrics["beta"],
+                            f"hwa_at_{label}_N": accYaw_metrics["hwa"],
+                            f"accY_at_{label}_N": accYaw_metrics["accY"]})
+
+    return metric_dict
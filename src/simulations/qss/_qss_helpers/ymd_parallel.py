@@ -0,0 +1,229 @@
+from src.simulations.qss._qss_helpers.ymd_continuation import schedule_seeds, solve_ymd_line, solve_ymd_seeded_line, solve_ymd_spine
+from src.simulations.qss._qss_helpers.ymd_batch import solve_ymd_grid_batch
+from src.simulations.qss._qss_helpers.ymd_adaptive import solve_ymd_adaptive
+from src.simulations.qss._qss_helpers.ymd import YMD, ConstantVelocity, ConstantRadius
+from src.simulations.qss._qss_helpers.ymd_result import YMDResult
+from src._3_custom_libraries.parallel import WorkerPool
+from src._3_custom_libraries import telemetry
+
+from typing import Callable, Iterable, Iterator, Sequence, Tuple, Union
+
+import numpy as np
+
+
+# Per-process YMD engine, built on first use so the FMU, suspension, tires, aero map, and fits load once per worker
+# and are shared by every CV and CR schedule entry the worker solves
+_worker_config: dict = {}
+_worker_engine: dict[str, YMD] = {}
+
+CONSTRAINTS = {"CV": ConstantVelocity, "CR": ConstantRadius}
+
+# Radius schedules are too coarse to extrapolate across (seeded CR grids took more evaluations and found different roots)
+SEEDED_MODES = ("CV",)
+
+
+def _init_worker(model_path: str, hwa: float, beta: float, refinement: int, solver: str, adaptive: bool, adaptive_tol: float) -> None:
+    _worker_config.update({"model_path": model_path, "hwa": hwa, "beta": beta, "refinement": refinement, "solver": solver,
+                           "adaptive": adaptive, "adaptive_tol": adaptive_tol})
+    _worker_engine.clear()
+
+def _worker_model(mode: str, value: float) -> YMD:
+    constraint = CONSTRAINTS[mode](value)
+
+    if "engine" not in _worker_engine:
+        _worker_engine["engine"] = YMD(constraint=constraint, **_worker_config)
+
+    # The operating condition is the only thing that changes between schedule entries
+    _worker_engine["engine"].constraint = constraint
+
+    return _worker_engine["engine"]
+
+def _solve_spine(item: Tuple[str, float, np.ndarray, np.ndarray]) -> list[dict]:
+    mode, value, hwa_sweep, beta_sweep = item
+
+    return solve_ymd_spine(model=_worker_model(mode=mode, value=value), hwa_sweep=hwa_sweep, beta_sweep=beta_sweep)
+
+def _solve_grid(item: Tuple[str, float, np.ndarray, np.ndarray]) -> list[list[dict]]:
+    mode, value, hwa_sweep, beta_sweep = item
+
+    return solve_ymd_grid_batch(model=_worker_model(mode=mode, value=value), hwa_sweep=hwa_sweep, beta_sweep=beta_sweep)
+
+def _solve_adaptive(item: Tuple[str, float, np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, list[list[dict]]]:
+    mode, value, hwa_sweep, beta_sweep = item
+    model = _worker_model(mode=mode, value=value)
+
+    return solve_ymd_adaptive(model=model, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep, tol=model.adaptive_tol)
+
+def _optimize_metrics(item: Tuple[str, float]) -> dict:
+    mode, value = item
+
+    return _worker_model(mode=mode, value=value).optimize_metrics()
+
+def _solve_line(item: Tuple[str, float, np.ndarray, float, dict]) -> list[dict]:
+    mode, value, hwa_sweep, beta, center_point = item
+
+    return solve_ymd_line(model=_worker_model(mode=mode, value=value), hwa_sweep=hwa_sweep, beta=beta, center_point=center_point)
+
+def _solve_seeded_line(item: Tuple[str, float, np.ndarray, float, list]) -> list[dict]:
+    mode, value, hwa_sweep, beta, seeds = item
+
+    return solve_ymd_seeded_line(model=_worker_model(mode=mode, value=value), hwa_sweep=hwa_sweep, beta=beta, seeds=seeds)
+
+
+def _solve_in_order(pool: WorkerPool, entries: Sequence[Tuple[str, float]], hwa_sweep: np.ndarray, beta_sweep: np.ndarray) -> Iterator[list[list[dict]]]:
+    # Schedule entries one at a time, velocity entries seeded from the entries before them, with the lines of each grid distributed
+    histories: dict[str, list[Tuple[float, list[list[dict]]]]] = {}
+
+    for mode, value in entries:
+        history = histories.setdefault(mode, [])
+        seeds = schedule_seeds(history=history[-2:], value=value) if mode in SEEDED_MODES else None
+
+        if seeds is None:
+            spine = list(pool.map(_solve_spine, [(mode, value, hwa_sweep, beta_sweep)]))[0]
+            grid = list(pool.map(_solve_line, [(mode, value, hwa_sweep, beta_val, center_point) for beta_val, center_point in zip(beta_sweep, spine)]))
+        else:
+            grid = list(pool.map(_solve_seeded_line, [(mode, value, hwa_sweep, beta_val, seed_line) for beta_val, seed_line in zip(beta_sweep, seeds)]))
+
+        history.append((value, grid))
+
+        yield grid
+
+def _group_lines(lines: Iterable[list[dict]], refinement: int) -> Iterator[list[list[dict]]]:
+    # Lines arrive in submission order, refinement beta lines per schedule entry
+    grid = []
+
+    for line in lines:
+        grid.append(line)
+
+        if len(grid) == refinement:
+            yield grid
+            grid = []
+
+
+def solve_ymd_schedules(model_path: str, schedules: dict[str, Sequence[float]], hwa: float, beta: float, refinement: int,
+                        solver: str = "continuation", adaptive: bool = False, adaptive_tol: float = 1e-3, schedule_warm_start: bool = False,
+                        max_workers: Union[int, None] = None, chunksize: int = 1,
+                        on_result: Union[Callable[[str, YMDResult], None], None] = None) -> dict[str, list[YMDResult]]:
+    """
+    ## Solve YMD Schedules
+
+    Solves the YMD grid of every schedule entry across a process pool
+    - "continuation": each grid's center hwa line (spine) is solved first, then every beta line is seeded from the spine
+      Spines are distributed one per schedule entry, then (schedule entry, beta) lines are distributed one per work item
+    - "newton": each grid is solved in one batched damped Newton solve, distributed one per schedule entry
+    - adaptive: each grid is refined from a coarse set of lines (see solve_ymd_adaptive), distributed one per schedule entry
+    - schedule_warm_start (continuation, not adaptive): entries are solved in schedule order, with every point of a CV grid seeded
+      from the entries before it extrapolated linearly in velocity (see schedule_seeds()), and only the lines of each grid are distributed
+    - Unconverged points of every grid are recorded as failure maps (see telemetry.py)
+    - on_result is called with each entry's result as soon as its grid is complete, in schedule order, while the workers carry on
+      with the entries after it
+
+    Parameters
+    ----------
+    model_path : str
+        Path to vehicle model yaml
+    schedules : dict[str, Sequence[float]]
+        Schedule values keyed by mode, "CV" (velocities) or "CR" (turn radii)
+    hwa : float
+        Handwheel angle sweep half-range in degrees
+    beta : float
+        Body slip angle sweep half-range in degrees
+    refinement : int
+        Number of hwa and beta values in each sweep
+    solver : str, optional
+        Grid solver, "continuation" or "newton", by default "continuation"
+    adaptive : bool, optional
+        Solve only the hwa and beta lines the metrics need, with refinement setting the finest line spacing, by default False
+    adaptive_tol : float, optional
+        Relative change in the envelope metrics at which adaptive refinement stops, by default 1e-3
+    schedule_warm_start : bool, optional
+        Seed each velocity schedule entry from the entries before it, by default False
+    max_workers : Union[int, None], optional
+        Maximum number of worker processes (1 solves in this process), by default None (number of CPUs)
+    chunksize : int, optional
+        Number of work items sent to a worker at a time, by default 1
+    on_result : Union[Callable[[str, YMDResult], None], None], optional
+        Called with the mode and result of each schedule entry as it completes, by default None
+
+    Returns
+    -------
+    dict[str, list[YMDResult]]
+        YMD results keyed by mode, one per schedule entry in schedule order
+    """
+    hwa_sweep = np.linspace(-hwa, hwa, refinement) # leave as deg
+    beta_sweep = np.linspace(-beta, beta, refinement) * np.pi / 180 # convert to rad
+
+    entries = [(mode, value) for mode, values in schedules.items() for value in values]
+    grid_items = [(mode, value, hwa_sweep, beta_sweep) for mode, value in entries]
+
+    results: dict[str, list[YMDResult]] = {mode: [] for mode in schedules.keys()}
+
+    with WorkerPool(initializer=_init_worker, initargs=(model_path, hwa, beta, refinement, solver, adaptive, adaptive_tol), max_workers=max_workers,
+                    chunksize=chunksize) as pool:
+        # Grids are consumed as the pool returns them, so on_result runs while later entries are still being solved
+        grids: Iterable[Tuple[np.ndarray, np.ndarray, list[list[dict]]]]
+
+        if adaptive:
+            grids = pool.map(_solve_adaptive, grid_items)
+        elif schedule_warm_start and solver == "continuation":
+            grids = ((hwa_sweep, beta_sweep, grid) for grid in _solve_in_order(pool=pool, entries=entries, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep))
+        elif solver == "newton":
+            grids = ((hwa_sweep, beta_sweep, grid) for grid in pool.map(_solve_grid, grid_items))
+        else:
+            spines = list(pool.map(_solve_spine, grid_items))
+            line_items = [(mode, value, hwa_sweep, beta_val, center_point) for (mode, value), spine in zip(entries, spines)
+                                                                           for beta_val, center_point in zip(beta_sweep, spine)]
+            grids = ((hwa_sweep, beta_sweep, grid) for grid in _group_lines(lines=pool.map(_solve_line, line_items), refinement=refinement))
+
+        for (mode, value), (hwa_vals, beta_vals, grid) in zip(entries, grids):
+            result = YMDResult.from_grid(const_key=CONSTRAINTS[mode].const_key, const=value, hwa_sweep=hwa_vals, beta_sweep=beta_vals, grid=grid)
+            results[mode].append(result)
+            telemetry.record_failures(name=f"{mode} {value}", points=result.failure_map())
+
+            if on_result is not None:
+                on_result(mode, result)
+
+    return results
+
+
+def optimize_ymd_schedules(model_path: str, schedules: dict[str, Sequence[float]], hwa: float, beta: float, refinement: int,
+                           max_workers: Union[int, None] = None, chunksize: int = 1) -> dict[str, list[dict]]:
+    """
+    ## Optimize YMD Schedules
+
+    Computes the YMD metrics of every schedule entry directly (see YMD.optimize_metrics()) across a process pool, one entry per work item
+
+    Parameters
+    ----------
+    model_path : str
+        Path to vehicle model yaml
+    schedules : dict[str, Sequence[float]]
+        Schedule values keyed by mode, "CV" (velocities) or "CR" (turn radii)
+    hwa : float
+        Handwheel angle sweep half-range in degrees
+    beta : float
+        Body slip angle sweep half-range in degrees
+    refinement : int
+        Number of hwa and beta values a diagram would use, setting the derivative step
+    max_workers : Union[int, None], optional
+        Maximum number of worker processes (1 solves in this process), by default None (number of CPUs)
+    chunksize : int, optional
+        Number of work items sent to a worker at a time, by default 1
+
+    Returns
+    -------
+    dict[str, list[dict]]
+        Metric dicts keyed by mode, one per schedule entry in schedule order
+    """
+    entries = [(mode, value) for mode, values in schedules.items() for value in values]
+
+    with WorkerPool(initializer=_init_worker, initargs=(model_path, hwa, beta, refinement, "continuation", False, 1e-3), max_workers=max_workers,
+                    chunksize=chunksize) as pool:
+        metrics = list(pool.map(_optimize_metrics, entries))
+
+    results: dict[str, list[dict]] = {mode: [] for mode in schedules.keys()}
+
+    for (mode, _), metric_dict in zip(entries, metrics):
+        results[mode].append(metric_dict)
+
+    return results
@@ -0,0 +1,240 @@
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+import numpy as np
+
+
+SCALAR_FIELDS = ("accX", "accY", "accYaw", "heave", "theta", "phi", "turn_radius", "velX", "warm_start", "converged", "nfev")
+VECTOR_FIELDS = ("gamma", "delta", "alpha")
+FIELDS = SCALAR_FIELDS + VECTOR_FIELDS
+
+
+@dataclass
+class YMDResult:
+    """
+    ## YMD Result
+
+    Solved YMD grid, with every field stored as an ndarray indexed [beta, hwa]
+    - Scalar fields have shape (n_beta, n_hwa), tire fields (gamma, delta, alpha) have shape (n_beta, n_hwa, 4) in FL, FR, RL, RR order
+    - Angles are stored in degrees
+    - nfev holds the fsolve function evaluation count of each point (NaN where the point came from the batched Newton solver)
+    - hwa isolines (constant hwa, varying beta) and beta isolines (constant beta, varying hwa) are views into the same arrays
+
+    Parameters
+    ----------
+    const_key : str
+        Name of the swept operating condition ("velX" or "turn_radius")
+    const : float
+        Value of the swept operating condition
+    hwa_vals : np.ndarray
+        Handwheel angle sweep in degrees, shape (n_hwa,)
+    beta_vals : np.ndarray
+        Body slip angle sweep in degrees, shape (n_beta,)
+    """
+    const_key: str
+    const: float
+    hwa_vals: np.ndarray
+    beta_vals: np.ndarray
+    data: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.hwa_vals = np.asarray(self.hwa_vals, dtype=float)
+        self.beta_vals = np.asarray(self.beta_vals, dtype=float)
+
+        shape = (len(self.beta_vals), len(self.hwa_vals))
+
+        for key in SCALAR_FIELDS:
+            if key not in self.data:
+                self.data[key] = np.full(shape, False) if key in ("warm_start", "converged") else np.full(shape, np.nan)
+        for key in VECTOR_FIELDS:
+            if key not in self.data:
+                self.data[key] = np.full(shape + (4,), np.nan)
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.data[key]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self.beta_vals), len(self.hwa_vals))
+
+    @property
+    def hwa(self) -> np.ndarray:
+        """
+        Handwheel angle at every grid point in degrees, shape (n_beta, n_hwa) (read-only broadcast view)
+        """
+        return np.broadcast_to(self.hwa_vals[None, :], self.shape)
+
+    @property
+    def beta(self) -> np.ndarray:
+        """
+        Body slip angle at every grid point in degrees, shape (n_beta, n_hwa) (read-only broadcast view)
+        """
+        return np.broadcast_to(self.beta_vals[:, None], self.shape)
+
+    def hwa_lines(self, key: str) -> np.ndarray:
+        """
+        ## hwa Lines
+
+        Views a field as hwa isolines
+
+        Parameters
+        ----------
+        key : str
+            Field name, including "hwa" and "beta"
+
+        Returns
+        -------
+        np.ndarray
+            View of shape (n_hwa, n_beta, ...), where row j is the isoline at hwa_vals[j]
+        """
+        return np.swapaxes(self._field(key), 0, 1)
+
+    def beta_lines(self, key: str) -> np.ndarray:
+        """
+        ## beta Lines
+
+        Views a field as beta isolines
+
+        Parameters
+        ----------
+        key : str
+            Field name, including "hwa" and "beta"
+
+        Returns
+        -------
+        np.ndarray
+            View of shape (n_beta, n_hwa, ...), where row i is the isoline at beta_vals[i]
+        """
+        return self._field(key)
+
+    def _field(self, key: str) -> np.ndarray:
+        if key == "hwa":
+            return self.hwa
+        if key == "beta":
+            return self.beta
+
+        return self.data[key]
+
+    def store(self, i: int, j: int, point: dict) -> None:
+        """
+        ## Store
+
+        Stores one solved point
+
+        Parameters
+        ----------
+        i : int
+            Index into beta_vals
+        j : int
+            Index into hwa_vals
+        point : dict
+            Solved point from solve_point()
+
+        Returns
+        -------
+        None
+        """
+        for key, value in zip(("accX", "accY", "accYaw", "heave", "theta", "phi"), point["x"]):
+            self.data[key][i, j] = value
+
+        for key in ("gamma", "delta", "alpha"):
+            self.data[key][i, j] = np.rad2deg(point[key])
+
+        for key in ("turn_radius", "velX", "warm_start", "converged"):
+            self.data[key][i, j] = point[key]
+
+        # Batched Newton solves don't count evaluations per point
+        self.data["nfev"][i, j] = point.get("nfev", np.nan)
+
+    def failure_map(self) -> list[dict]:
+        """
+        ## Failure Map
+
+        Lists the points whose solve didn't converge
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        list[dict]
+            Grid indices (i into beta_vals, j into hwa_vals) and hwa and beta in degrees of each unconverged point
+        """
+        beta_idx, hwa_idx = np.nonzero(~self.data["converged"].astype(bool))
+
+        return [{"i": int(i), "j": int(j), "hwa": float(self.hwa_vals[j]), "beta": float(self.beta_vals[i])} for i, j in zip(beta_idx, hwa_idx)]
+
+    @classmethod
+    def from_grid(cls, const_key: str, const: float, hwa_sweep: Sequence[float], beta_sweep: Sequence[float], grid: Sequence[Sequence[dict]]) -> "YMDResult":
+        """
+        ## From Grid
+
+        Builds a result from solved points
+
+        Parameters
+        ----------
+        const_key : str
+            Name of the swept operating condition ("velX" or "turn_radius")
+        const : float
+            Value of the swept operating condition
+        hwa_sweep : Sequence[float]
+            Handwheel angle sweep in degrees
+        beta_sweep : Sequence[float]
+            Body slip angle sweep in radians
+        grid : Sequence[Sequence[dict]]
+            Solved points indexed [beta][hwa]
+
+        Returns
+        -------
+        YMDResult
+            Result holding every point of the grid
+        """
+        result = cls(const_key=const_key, const=const, hwa_vals=np.asarray(hwa_sweep), beta_vals=np.rad2deg(beta_sweep))
+
+        for i, line in enumerate(grid):
+            for j, point in enumerate(line):
+                result.store(i=i, j=j, point=point)
+
+        return result
+
+    def save(self, path: str) -> None:
+        """
+        ## Save
+
+        Saves the result to an .npz file
+
+        Parameters
+        ----------
+        path : str
+            Output path
+
+        Returns
+        -------
+        None
+        """
+        arrays: dict[str, Any] = {"const_key": np.array(self.const_key), "const": np.array(self.const), "hwa_vals": self.hwa_vals, "beta_vals": self.beta_vals,
+                                 **self.data}
+
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "YMDResult":
+        """
+        ## Load
+
+        Loads a result saved with save()
+
+        Parameters
+        ----------
+        path : str
+            Path to .npz file
+
+        Returns
+        -------
+        YMDResult
+            Loaded result
+        """
+        with np.load(path) as f:
+            return cls(const_key=str(f["const_key"]), const=float(f["const"]), hwa_vals=f["hwa_vals"], beta_vals=f["beta_vals"],
+                       data={key: f[key] for key in FIELDS if key in f})
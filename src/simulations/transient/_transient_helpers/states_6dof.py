@@ -1,5 +1,6 @@
 from _4_custom_libraries.misc_math import rotation_matrix
 from _4_custom_libraries.simulation import Simulation
+from src.vehicle_model.suspension_model.suspension_elements._2_elements.tire import tire_eval_corners
 
 from typing import Tuple, Sequence
 
@@ -231,10 +232,12 @@ class States6DOF(Simulation):
         RL_gamma = self.kin_FMU["RL_gamma"](np.array([hwa * 180 / np.pi, heave, pitch, roll]))[0] * np.pi / 180
         RR_gamma = self.kin_FMU["RR_gamma"](np.array([hwa * 180 / np.pi, heave, pitch, roll]))[0] * np.pi / 180
 
-        FL_tire_loads = FL_corner.tire.tire_eval(FZ=abs(FL_corner.static_weight), alpha=FL_alpha, kappa=0, gamma=FL_gamma)
-        FR_tire_loads = FR_corner.tire.tire_eval(FZ=abs(FR_corner.static_weight), alpha=FR_alpha, kappa=0, gamma=FR_gamma)
-        RL_tire_loads = RL_corner.tire.tire_eval(FZ=abs(RL_corner.static_weight), alpha=RL_alpha, kappa=0, gamma=RL_gamma)
-        RR_tire_loads = RR_corner.tire.tire_eval(FZ=abs(RR_corner.static_weight), alpha=RR_alpha, kappa=0, gamma=RR_gamma)
+        corners = [FL_corner, FR_corner, RL_corner, RR_corner]
+        FL_tire_loads, FR_tire_loads, RL_tire_loads, RR_tire_loads = tire_eval_corners(tires=[corner.tire for corner in corners],
+                                                                                       FZ=[abs(corner.static_weight) for corner in corners],
+                                                                                       alpha=[FL_alpha, FR_alpha, RL_alpha, RR_alpha],
+                                                                                       kappa=0,
+                                                                                       gamma=[FL_gamma, FR_gamma, RL_gamma, RR_gamma])
 
         # === Decompose Loads ===
         FL_tire_forces = np.array(FL_tire_loads[0:3])
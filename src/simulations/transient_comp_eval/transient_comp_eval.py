@@ -75,6 +75,7 @@ class TransientCompEval(Simulation):
         # Make a fake static CompEval instance to reuse its GGV methods
         # Create a CompEval instance to access its methods without re-running simulations
         self._qss = CompEval.__new__(CompEval)  # Create instance without __init__
+        self._qss.context = self.context  # Shares this simulation's model instead of loading its own
         self._qss.V_MAX = self.V_MAX
         self._qss.X_OFFSET = self.X_OFFSET
         self._qss.SCALE_FACTOR = self.SCALE_FACTOR
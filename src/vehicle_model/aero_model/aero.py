@@ -1,6 +1,6 @@
-from scipy.interpolate import RBFInterpolator
+from scipy.interpolate import RBFInterpolator # type: ignore
 
-import pandas as pd
+import pandas as pd # type: ignore
 import numpy as np
 
 
@@ -50,6 +50,36 @@ class Aero:
 
         return Fx, Fy, Fz, Mx, My, Mz
 
+    def eval_many(self, roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray, vel: np.ndarray) -> np.ndarray:
+        """
+        ## Evaluate Many
+
+        Evaluates aero loads at many operating points in one pass per interpolator
+
+        Parameters
+        ----------
+        roll : np.ndarray
+            Roll angles in degrees
+        pitch : np.ndarray
+            Pitch angles in degrees
+        yaw : np.ndarray
+            Yaw angles in degrees
+        vel : np.ndarray
+            Velocities in m/s
+
+        Returns
+        -------
+        np.ndarray
+            Loads in the form [Fx, Fy, Fz, Mx, My, Mz], shape (N, 6)
+        """
+        roll, pitch, yaw, vel = np.broadcast_arrays(*[np.atleast_1d(np.asarray(x, dtype=float)) for x in (roll, pitch, yaw, vel)])
+        coeff = 0.5 * 1.225 * vel**2  # dynamic pressure
+
+        query_points = np.column_stack([roll, pitch, yaw])
+        interps = [self.CxA_interp, self.CyA_interp, self.CzA_interp, self.MxA_interp, self.MyA_interp, self.MzA_interp]
+
+        return coeff[:, None] * np.column_stack([interp(query_points) for interp in interps])
+
 
 if __name__ == "__main__":
     aer = Aero("./_1_model_inputs/aero_map.csv")
@@ -7,10 +7,62 @@ from src.vehicle_model.suspension_model.suspension_elements._2_elements.spring i
 from src.vehicle_model.suspension_model.suspension_elements._2_elements.tire import Tire
 from src.vehicle_model.suspension_model.suspension_elements._1_elements.link import Link
 from src.vehicle_model.suspension_model.suspension_elements._1_elements.node import Node
+from src._3_custom_libraries.tire_lut import TireLUT, cached_tire_lut
+from src._3_custom_libraries.assets import load_asset
 
 from LHR_tire_toolkit.MF52 import MF52 # type: ignore
 from typing import Union
 import yaml
+import os
+
+
+def load_tire(tir_path: str) -> MF52:
+    """
+    ## Load Tire
+
+    Loads an MF52 tire model, shared by every corner and vehicle model that uses the same .tir file
+
+    Parameters
+    ----------
+    tir_path : str
+        Path to .tir file
+
+    Returns
+    -------
+    MF52
+        Shared tire model, named after the .tir file
+    """
+    return load_asset(path=tir_path, kind="MF52", loader=lambda path: MF52(tire_name=os.path.splitext(os.path.basename(path))[0], file_path=path))
+
+
+def load_tire_model(tire_params: dict) -> Union[MF52, TireLUT]:
+    """
+    ## Load Tire Model
+
+    Loads the tire model of a corner: the exact MF52, or its lookup table if "lut_method" is set to anything but "none"
+    - Lookup tables are cached on disk by .tir file hash and grid (see cached_tire_lut()) and shared like any other asset
+
+    Parameters
+    ----------
+    tire_params : dict
+        "tire" entry of a quarter car in the vehicle definition yaml
+
+    Returns
+    -------
+    Union[MF52, TireLUT]
+        Shared tire model
+    """
+    tir_path = tire_params["tir_path"]["Value"]
+    mf52 = load_tire(tir_path)
+
+    if "lut_method" not in tire_params.keys() or tire_params["lut_method"]["Value"] == "none":
+        return mf52
+
+    method = tire_params["lut_method"]["Value"]
+    grid = [tuple(axis) for axis in tire_params["lut_grid"]["Value"]]
+
+    return load_asset(path=tir_path, kind=f"TireLUT {method} {grid}", loader=lambda path: cached_tire_lut(tire=mf52, tir_path=path, grid=grid, method=method))
+
 
 class SuspensionData:
     """
@@ -88,8 +140,8 @@ class SuspensionData:
                 FL_tire_toe = FL_tire_params["static_toe"]["Value"]
                 FL_tire_camber = FL_tire_params["static_camber"]["Value"]
 
-                FL_mf52 = MF52(tire_name="FL_tire", file_path=FL_tir_file_path)
-                self.FL_tire = Tire(tire=FL_mf52, contact_patch=FL_contact_patch, outer_diameter=FL_tire_od, width=FL_tire_width,
+                FL_tire_model = load_tire_model(FL_tire_params)
+                self.FL_tire = Tire(tire=FL_tire_model, contact_patch=FL_contact_patch, outer_diameter=FL_tire_od, width=FL_tire_width,
                                     inner_diameter=FL_tire_id, static_toe=FL_tire_toe, static_gamma=FL_tire_camber)
 
                 self.FL_nodes["contact_patch"] = FL_contact_patch
@@ -244,8 +296,8 @@ class SuspensionData:
             FR_tire_toe = -FR_tire_params["static_toe"]["Value"]
             FR_tire_camber = -FR_tire_params["static_camber"]["Value"]
 
-            FR_mf52 = MF52(tire_name="FR_tire", file_path=FR_tir_file_path)
-            self.FR_tire = Tire(tire=FR_mf52, contact_patch=FR_contact_patch, outer_diameter=FR_tire_od, width=FR_tire_width,
+            FR_tire_model = load_tire_model(FR_tire_params)
+            self.FR_tire = Tire(tire=FR_tire_model, contact_patch=FR_contact_patch, outer_diameter=FR_tire_od, width=FR_tire_width,
                                 inner_diameter=FR_tire_id, static_toe=FR_tire_toe, static_gamma=FR_tire_camber)
 
             self.FR_nodes["contact_patch"] = FR_contact_patch
@@ -422,8 +474,8 @@ class SuspensionData:
                 RL_tire_toe = RL_tire_params["static_toe"]["Value"]
                 RL_tire_camber = RL_tire_params["static_camber"]["Value"]
 
-                RL_mf52 = MF52(tire_name="RL_tire", file_path=RL_tir_file_path)
-                self.RL_tire = Tire(tire=RL_mf52, contact_patch=RL_contact_patch, outer_diameter=RL_tire_od, width=RL_tire_width,
+                RL_tire_model = load_tire_model(RL_tire_params)
+                self.RL_tire = Tire(tire=RL_tire_model, contact_patch=RL_contact_patch, outer_diameter=RL_tire_od, width=RL_tire_width,
                                     inner_diameter=RL_tire_id, static_toe=RL_tire_toe, static_gamma=RL_tire_camber)
 
                 self.RL_nodes["contact_patch"] = RL_contact_patch
@@ -572,8 +624,8 @@ class SuspensionData:
             RR_tire_toe = -RR_tire_params["static_toe"]["Value"]
             RR_tire_camber = -RR_tire_params["static_camber"]["Value"]
 
-            RR_mf52 = MF52(tire_name="RR_tire", file_path=RR_tir_file_path)
-            self.RR_tire = Tire(tire=RR_mf52, contact_patch=RR_contact_patch, outer_diameter=RR_tire_od, width=RR_tire_width,
+            RR_tire_model = load_tire_model(RR_tire_params)
+            self.RR_tire = Tire(tire=RR_tire_model, contact_patch=RR_contact_patch, outer_diameter=RR_tire_od, width=RR_tire_width,
                                 inner_diameter=RR_tire_id, static_toe=RR_tire_toe, static_gamma=RR_tire_camber)
 
             self.RR_nodes["contact_patch"] = RR_contact_patch
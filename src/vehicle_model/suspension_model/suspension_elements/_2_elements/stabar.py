@@ -67,8 +67,8 @@ class Stabar:
         Updates Stabar to match initial geometry
 
         """
-        self.left_rotation = nearest_root(func=self._droplink_eqn, x0=0, bounds=(-np.pi/2, np.pi/2), tol=1e-10, args=[self.left_droplink])
-        self.right_rotation = nearest_root(func=self._droplink_eqn, x0=0, bounds=(-np.pi/2, np.pi/2), tol=1e-10, args=[self.right_droplink])
+        self.left_rotation = nearest_root(func=self._droplink_eqn, x0=0, bounds=(-np.pi/2, np.pi/2), tol=1e-10, args=[self.left_droplink], site="Stabar.update")
+        self.right_rotation = nearest_root(func=self._droplink_eqn, x0=0, bounds=(-np.pi/2, np.pi/2), tol=1e-10, args=[self.right_droplink], site="Stabar.update")
 
         self.left_droplink.outboard_node.rotate(origin=self.bar.inboard_node, direction=self.bar.direction, angle=self.left_rotation)
         self.right_droplink.outboard_node.rotate(origin=self.bar.inboard_node, direction=self.bar.direction, angle=self.right_rotation)
@@ -1,7 +1,9 @@
 from src.vehicle_model.suspension_model.suspension_elements._1_elements.node import Node
 from src._3_custom_libraries.misc_math import rotation_matrix
+from src._3_custom_libraries.tire_lut import tire_model_eval_many
 
 from LHR_tire_toolkit.MF52 import MF52 # type: ignore
+from typing import Sequence, Union
 import numpy as np
 
 
@@ -25,6 +27,9 @@ class Tire:
         self.static_toe: float = static_toe
         self.static_gamma: float = static_gamma
 
+        # Whether the tire model accepts array inputs, found on the first batched call
+        self._vectorized: Union[bool, None] = None
+
         # This only works for Z-up SAE J670 coords
         x_rot = np.array(rotation_matrix(unit_vec=[1, 0, 0], theta=static_gamma * np.pi / 180))
         z_rot = np.array(rotation_matrix(unit_vec=[0, 0, 1], theta=static_toe * np.pi / 180))
@@ -37,6 +42,36 @@ class Tire:
     
     def tire_eval(self, FZ: float, alpha: float, kappa: float, gamma: float) -> list[float]:
         return self.tire.tire_eval(FZ=FZ, alpha=alpha, kappa=kappa, gamma=gamma)
+
+    def tire_eval_many(self, FZ: np.ndarray, alpha: np.ndarray, kappa: np.ndarray, gamma: np.ndarray) -> np.ndarray:
+        """
+        ## Tire Evaluate Many
+
+        Evaluates tire loads at many operating points in one Magic Formula pass
+        - Inputs are broadcast against each other
+        - Falls back to one tire_eval() per point if the tire model does not accept arrays
+
+        Parameters
+        ----------
+        FZ : np.ndarray
+            Normal loads in N
+        alpha : np.ndarray
+            Slip angles in radians
+        kappa : np.ndarray
+            Slip ratios
+        gamma : np.ndarray
+            Inclination angles in radians
+
+        Returns
+        -------
+        np.ndarray
+            Loads in the form [Fx, Fy, Fz, Mx, My, Mz], shape (N, 6)
+        """
+        FZ, alpha, kappa, gamma = np.broadcast_arrays(*[np.atleast_1d(np.asarray(x, dtype=float)).ravel() for x in (FZ, alpha, kappa, gamma)])
+
+        loads, self._vectorized = tire_model_eval_many(tire=self.tire, FZ=FZ, alpha=alpha, kappa=kappa, gamma=gamma, vectorized=self._vectorized)
+
+        return loads
         
     @property
     def delta(self) -> float:
@@ -121,4 +156,46 @@ class Tire:
         tire_name = self.tire.tire_name
         tire_center = self.center_node.position
 
-        return f"Tire Name: {tire_name}\nTire Center: {tire_center}"
\ No newline at end of file
+        return f"Tire Name: {tire_name}\nTire Center: {tire_center}"
+
+
+def tire_eval_corners(tires: Sequence[Tire], FZ: np.ndarray, alpha: np.ndarray, kappa: np.ndarray, gamma: np.ndarray) -> np.ndarray:
+    """
+    ## Tire Evaluate Corners
+
+    Evaluates every corner of a vehicle at N operating points, with one tire_eval_many() per distinct tire model
+    - Corners sharing a tire model (e.g. loaded once through the asset registry) are stacked into the same pass
+
+    Parameters
+    ----------
+    tires : Sequence[Tire]
+        Tire at each corner
+    FZ : np.ndarray
+        Normal loads in N, shape (len(tires),) or (N, len(tires))
+    alpha : np.ndarray
+        Slip angles in radians, broadcastable to FZ
+    kappa : np.ndarray
+        Slip ratios, broadcastable to FZ
+    gamma : np.ndarray
+        Inclination angles in radians, broadcastable to FZ
+
+    Returns
+    -------
+    np.ndarray
+        Loads in the form [Fx, Fy, Fz, Mx, My, Mz], shape (len(tires), 6) or (N, len(tires), 6)
+    """
+    FZ, alpha, kappa, gamma = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (FZ, alpha, kappa, gamma)])
+    shape = FZ.shape
+    points = [x.reshape((-1, len(tires))) for x in (FZ, alpha, kappa, gamma)]
+
+    groups: dict[int, list[int]] = {}
+    for i, tire in enumerate(tires):
+        groups.setdefault(id(tire.tire), []).append(i)
+
+    loads = np.empty(points[0].shape + (6,))
+    for corners in groups.values():
+        FZ_group, alpha_group, kappa_group, gamma_group = [x[:, corners].ravel() for x in points]
+        group_loads = tires[corners[0]].tire_eval_many(FZ=FZ_group, alpha=alpha_group, kappa=kappa_group, gamma=gamma_group)
+        loads[:, corners] = group_loads.reshape((-1, len(corners), 6))
+
+    return loads.reshape(shape + (6,))
@@ -96,9 +96,9 @@ class PushPullRod:
         projected_moment = np.dot(moment, self.bellcrank.pivot_direction)
 
         if projected_moment > 0:
-            self.bellcrank_angle = directional_root(func=self._bellcrank_eqn, x0=0, bounds=(0, np.pi/2), tol=1e-6, args=[])
+            self.bellcrank_angle = directional_root(func=self._bellcrank_eqn, x0=0, bounds=(0, np.pi/2), tol=1e-6, args=[], site="PushPullRod.bellcrank")
         else:
-            self.bellcrank_angle = directional_root(func=self._bellcrank_eqn, x0=0, bounds=(-np.pi/2, 0), tol=1e-6, args=[])
+            self.bellcrank_angle = directional_root(func=self._bellcrank_eqn, x0=0, bounds=(-np.pi/2, 0), tol=1e-6, args=[], site="PushPullRod.bellcrank")
 
     def _bellcrank_eqn(self, x: float, args: Sequence):
         self.bellcrank.rotate(x)
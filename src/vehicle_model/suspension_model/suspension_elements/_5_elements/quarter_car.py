@@ -3,9 +3,9 @@ from src.vehicle_model.suspension_model.suspension_elements._2_elements.wishbone
 from src.vehicle_model.suspension_model.suspension_elements._2_elements.tire import Tire
 from src.vehicle_model.suspension_model.suspension_elements._1_elements.link import Link
 from src._3_custom_libraries.misc_math import rotation_matrix
+from src._3_custom_libraries import telemetry
 
 # from scipy.interpolate import CubicSpline
-from scipy.optimize import fsolve # type: ignore
 from typing import Sequence
 import numpy as np
 
@@ -126,7 +126,7 @@ class QuarterCar:
     def _update_geometry(self) -> None:
         # Update rack here so it's only updated once
         self.tie_rod.inboard_node.position[1] = self.tie_rod.inboard_node.initial_position[1] + self.rack_displacement
-        lower_rot, upper_rot, _ = fsolve(func=self._geometry_resid_func, x0=[0, 0, 0])
+        lower_rot, upper_rot, _ = telemetry.fsolve(site="QuarterCar._update_geometry", func=self._geometry_resid_func, x0=[0, 0, 0])
         
         self.lower_wishbone.rotate(angle=lower_rot)
         self.upper_wishbone.rotate(angle=upper_rot)
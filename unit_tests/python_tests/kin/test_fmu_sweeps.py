@@ -0,0 +1,52 @@
+from src.simulations.kin.kin import Kinematics, _load_FMU
+from src._3_custom_libraries.pose_store import model_hash
+
+from scipy.interpolate import RegularGridInterpolator
+from unittest.mock import patch
+from unittest import TestCase
+import numpy as np
+
+
+MODEL_PATH = "./unit_tests/python_tests/_test_dependencies/unit_test_vehicle.yml"
+
+
+class TestFMUSweeps(TestCase):
+    def setUp(self):
+        axes = (np.linspace(-10, 10, 3), np.linspace(-0.05, 0.05, 5), np.linspace(-5, 5, 3), np.linspace(-5, 5, 5))
+        H, Z, P, R = np.meshgrid(*axes, indexing="ij")
+
+        # Every corner gets a different output, so a lookup under the wrong corner shows up
+        self.FMU_fits = {}
+        for i, corner in enumerate(["FL", "FR", "RL", "RR"]):
+            self.FMU_fits[f"{corner}_gamma"] = RegularGridInterpolator(axes, (i + 1) * Z + 0.1 * i * R + 0.01 * H)
+        self.FMU_fits["keys"] = list(self.FMU_fits.keys())
+
+        self.kin = Kinematics.__new__(Kinematics)
+
+    def test_batched_tables(self):
+        """Each sweep's table matches per-point FMU queries, for every corner"""
+        sweeps = [("jounce", "mm", (-40, 40), 7), ("roll", "rad", (-0.05, 0.05), 6)]
+        tables = self.kin.evaluate_FMU_sweeps(FMU_fits=self.FMU_fits, sweeps=sweeps)
+
+        poses = {sweeps[0]: [[0, jounce / 1000, 0, 0] for jounce in np.linspace(-40, 40, 7)],
+                 sweeps[1]: [[0, 0, 0, roll * 180 / np.pi] for roll in np.linspace(-0.05, 0.05, 6)]}
+
+        for sweep_key, sweep_poses in poses.items():
+            for corner in ["FL", "FR", "RL", "RR"]:
+                key = f"{corner}_gamma"
+                expected = [self.FMU_fits[key](np.array(pose))[0] for pose in sweep_poses]
+
+                np.testing.assert_allclose(tables[sweep_key][key], expected, rtol=0, atol=1e-12)
+
+    def test_stale_FMU(self):
+        """An FMU generated from another model is rejected"""
+        self.FMU_fits["model_hash"] = "stale"
+
+        with patch("src.simulations.kin.kin.load_kin_FMU", return_value=self.FMU_fits):
+            with self.assertRaises(Exception):
+                _load_FMU(model_path=MODEL_PATH)
+
+        self.FMU_fits["model_hash"] = model_hash(model_path=MODEL_PATH)
+
+        with patch("src.simulations.kin.kin.load_kin_FMU", return_value=self.FMU_fits):
+            self.assertIs(_load_FMU(model_path=MODEL_PATH), self.FMU_fits)
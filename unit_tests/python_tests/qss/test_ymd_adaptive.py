@@ -0,0 +1,64 @@
+from src.simulations.qss._qss_helpers.ymd_adaptive import coarse_indices, envelope_metrics, solve_ymd_adaptive
+from unittest import TestCase
+import numpy as np
+
+
+class AnalyticYMD:
+    solver = "continuation"
+
+    def __init__(self) -> None:
+        self.solves = 0
+
+    def point(self, hwa, beta):
+        accY = 15 * np.tanh(0.03 * hwa - 6 * beta)
+        accYaw = 20 * np.tanh(0.04 * hwa) * np.exp(-(4 * beta)**2) + 40 * np.tanh(3 * beta)
+
+        return accY, accYaw
+
+    def solve_point(self, hwa, beta, x0=None):
+        self.solves += 1
+        accY, accYaw = self.point(hwa, beta)
+
+        return {"x": [0, accY, accYaw, 0, 0, 0], "warm_start": x0 is not None, "converged": True}
+
+
+class StraightYMD(AnalyticYMD):
+    """Every point on one line, so the envelope has no area and no metrics"""
+    def point(self, hwa, beta):
+        return 0.1 * hwa, 0.2 * hwa
+
+
+class TestYMDAdaptive(TestCase):
+    def setUp(self):
+        self.hwa_sweep = np.linspace(-90, 90, 41)
+        self.beta_sweep = np.linspace(-10, 10, 41) * np.pi / 180
+
+    def test_coarse_indices(self):
+        self.assertListEqual(coarse_indices(n=41, count=5), [0, 10, 20, 30, 40])
+        self.assertListEqual(coarse_indices(n=6, count=2), [0, 3, 5])
+
+    def test_matches_full_grid(self):
+        """Adaptive refinement reaches the full grid envelope metrics with a fraction of the solves"""
+        model = AnalyticYMD()
+        hwa_vals, beta_vals, grid = solve_ymd_adaptive(model=model, hwa_sweep=self.hwa_sweep, beta_sweep=self.beta_sweep, tol=1e-3)
+
+        accY, accYaw = model.point(*np.meshgrid(self.hwa_sweep, self.beta_sweep))
+        full = envelope_metrics(accY=accY, accYaw=accYaw)
+        adaptive = envelope_metrics(accY=np.array([[point["x"][1] for point in line] for line in grid]),
+                                    accYaw=np.array([[point["x"][2] for point in line] for line in grid]))
+
+        self.assertTrue(np.allclose(adaptive, full, rtol=1e-2))
+        self.assertEqual(model.solves, len(hwa_vals) * len(beta_vals))
+        self.assertLess(model.solves, 0.5 * 41 * 41)
+
+        # Derivative lines are always present
+        self.assertIn(0, hwa_vals)
+        self.assertIn(0, beta_vals)
+
+    def test_degenerate(self):
+        """Rounds without metrics never stop refinement early"""
+        model = StraightYMD()
+        hwa_vals, beta_vals, _ = solve_ymd_adaptive(model=model, hwa_sweep=self.hwa_sweep, beta_sweep=self.beta_sweep, tol=1e-3)
+
+        self.assertEqual(len(hwa_vals), 41)
+        self.assertEqual(len(beta_vals), 41)
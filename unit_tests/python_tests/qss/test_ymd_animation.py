@@ -0,0 +1,62 @@
+from src.simulations.qss._qss_helpers.ymd_animation import YMDAnimation
+from src.simulations.qss._qss_helpers.qss_plots import QSSPlots
+from src.simulations.qss._qss_helpers.ymd_result import YMDResult
+from unittest import TestCase
+
+import matplotlib.pyplot as plt
+import imageio.v2 as imageio
+import numpy as np
+import tempfile
+import os
+
+
+class TestYMDAnimation(TestCase):
+    def setUp(self):
+        hwa_sweep = np.array([-10, 0, 10])
+        beta_sweep = np.array([-1, 1]) * np.pi / 180
+
+        self.results = []
+        for velX in (12, 15):
+            grid = [[{"x": [0, hwa * velX / 10, beta * 50, 0, 0, 0], "gamma": [0] * 4, "delta": [0] * 4, "alpha": [0] * 4, "turn_radius": 1,
+                      "velX": velX, "warm_start": True, "converged": True} for hwa in hwa_sweep] for beta in beta_sweep]
+
+            self.results.append(YMDResult.from_grid(const_key="velX", const=velX, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep, grid=grid))
+
+        self.plots = QSSPlots(yaw_inertia=100)
+
+    def test_frames(self):
+        """Frames come straight from the canvas, the same size at every velocity, without touching pyplot"""
+        figures = len(plt.get_fignums())
+        frames = [self.plots.cv_ymd_frame(cv_states=result, dpi=20) for result in self.results]
+
+        self.assertEqual(len(plt.get_fignums()), figures)
+        self.assertEqual(frames[0].shape, frames[1].shape)
+        self.assertEqual(frames[0].shape[2], 3)
+        self.assertEqual(frames[0].dtype, np.uint8)
+        self.assertFalse(np.array_equal(frames[0], frames[1]))
+
+    def test_gif(self):
+        """The animation plays forward then backward"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "ymd_cv.gif")
+            animation = YMDAnimation(output_path=path, fps=30)
+
+            for result in self.results:
+                animation.add_frame(self.plots.cv_ymd_frame(cv_states=result, dpi=20))
+
+            # Frames are kept compressed for the return pass
+            self.assertIsInstance(animation.frames[0], bytes)
+            self.assertEqual(animation.close(), 4)
+            decoded = imageio.mimread(path)
+
+        # Pillow merges the repeated frame at the turnaround
+        self.assertGreaterEqual(len(decoded), 3)
+        self.assertTrue(np.array_equal(decoded[0], decoded[-1]))
+        self.assertFalse(np.array_equal(decoded[0], decoded[1]))
+
+    def test_no_frames(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "ymd_cv.gif")
+
+            self.assertEqual(YMDAnimation(output_path=path).close(), 0)
+            self.assertFalse(os.path.exists(path))
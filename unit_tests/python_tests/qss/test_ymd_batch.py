@@ -0,0 +1,90 @@
+from src.simulations.qss._qss_helpers.ymd import YMD, ConstantVelocity, ConstantRadius
+from src.simulations.qss._qss_helpers.ymd_batch import solve_ymd_grid_batch
+from src.simulations.qss._qss_helpers.ymd_continuation import solve_ymd_grid
+from src.vehicle_model.suspension_model.suspension_elements._2_elements.tire import Tire
+from src.vehicle_model.suspension_model.suspension_elements._1_elements.node import Node
+from src.vehicle_model.aero_model.aero import Aero
+from src._3_custom_libraries.rate_model import RateModel
+
+from scipy.interpolate import RegularGridInterpolator # type: ignore
+from numpy.polynomial import Polynomial
+from types import SimpleNamespace
+from unittest import TestCase
+import numpy as np
+
+
+CORNER_POSITIONS = {"FL": (0.8, 0.6), "FR": (0.8, -0.6), "RL": (-0.8, 0.6), "RR": (-0.8, -0.6)}
+
+
+class SmoothTire:
+    def tire_eval(self, FZ, alpha, kappa, gamma):
+        return [0 * FZ, -1.5 * FZ * np.tanh(8 * alpha) + 20 * gamma, FZ, 0 * FZ, 0 * FZ, 0 * FZ]
+
+
+def analytic_ymd(constraint):
+    """YMD with a linear FMU, one smooth tire model, and a fitted wheel rate at every corner"""
+    axes = (np.linspace(-100, 100, 5), np.linspace(-0.1, 0.1, 5), np.linspace(-5, 5, 5), np.linspace(-5, 5, 5))
+    H, Z, P, R = np.meshgrid(*axes, indexing="ij")
+    fit = lambda values: RegularGridInterpolator(axes, values + 0 * H, bounds_error=False, fill_value=None)
+
+    model = YMD.__new__(YMD)
+    model.constraint = constraint
+    model.kin_FMU = {"veh_CG_x": fit(0), "veh_CG_y": fit(0), "veh_CG_z": fit(0.3 + Z)}
+    model.aero = Aero("./src/_1_model_inputs/aero_map.csv")
+    model.sus = SimpleNamespace(total_mass=300)
+
+    tire = SmoothTire()
+    for corner, (x, y) in CORNER_POSITIONS.items():
+        side = 1 if corner[1] == "L" else -1
+        axle = 1 if corner[0] == "F" else -1
+
+        model.kin_FMU.update({f"{corner}_cp_x": fit(x), f"{corner}_cp_y": fit(y + 0.001 * R), f"{corner}_cp_z": fit(0),
+                              f"{corner}_gamma": fit(0.1 * R - 0.5 * side),
+                              f"{corner}_delta": fit(0.05 * H * (axle > 0) + 0.01 * R),
+                              f"{corner}_wheel_jounce": fit(Z + 0.005 * side * R - 0.01 * axle * P)})
+
+        setattr(model, f"{corner}_quarter_car", SimpleNamespace(static_weight=735.0, tire=Tire(tire=tire, contact_patch=Node(position=[x, y, 0]), outer_diameter=0.4,
+                                                                                              width=0.2, inner_diameter=0.25)))
+        setattr(model, f"{corner}_wheel_rate", RateModel.from_motion_ratio(spring_rate=30000.0, motion_ratio=Polynomial([1.0, 0.5, 2, -3]),
+                                                                          x=np.linspace(-0.127, 0.127, 20)))
+
+    return model
+
+
+class TestYMDBatch(TestCase):
+    def setUp(self):
+        self.models = [analytic_ymd(constraint=ConstantVelocity(velX=15)), analytic_ymd(constraint=ConstantRadius(turn_radius=50))]
+
+    def test_residuals(self):
+        """Batched residuals match single point evaluations under both constraints"""
+        rng = np.random.default_rng(0)
+        x = rng.normal(0, 1, (6, 6)) * [1, 5, 3, 0.01, 1, 1]
+        x[:, 1] = np.abs(x[:, 1]) + 1
+        hwa = rng.uniform(-20, 20, 6)
+        beta = rng.uniform(-0.1, 0.1, 6)
+
+        for model in self.models:
+            residuals, outputs = model.physical_model_batch(x=x, args=[hwa, beta])
+
+            for i in range(len(x)):
+                np.testing.assert_allclose(residuals[i], model.physical_model(x=x[i], args=[hwa[i], beta[i]]), rtol=1e-9, atol=1e-9)
+                np.testing.assert_allclose(outputs["alpha"][i], model.alpha_vals, rtol=0, atol=1e-12)
+                self.assertAlmostEqual(outputs["velX"][i], model.velX)
+
+    def test_grid(self):
+        """The batched Newton grid agrees with the continuation grid"""
+        # Even hwa count skips the straight-line point, where constant radius has no solution (accY = velX = 0)
+        hwa_sweep = np.linspace(-25, 25, 4)
+        beta_sweep = np.linspace(-5, 5, 3) * np.pi / 180
+
+        for model in self.models:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                batch = solve_ymd_grid_batch(model=model, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep)
+                continuation = solve_ymd_grid(model=model, hwa_sweep=hwa_sweep, beta_sweep=beta_sweep)
+
+            # Continuation's fsolve can stall where constant radius accY crosses zero, so only points both solved are compared
+            both = [(a, b) for line_a, line_b in zip(batch, continuation) for a, b in zip(line_a, line_b) if b["converged"]]
+
+            self.assertTrue(all(point["converged"] for line in batch for point in line))
+            self.assertGreater(len(both), len(hwa_sweep) * len(beta_sweep) // 2)
+            np.testing.assert_allclose([a["x"] for a, _ in both], [b["x"] for _, b in both], rtol=0, atol=1e-6)
@@ -0,0 +1,17 @@
+from src.simulations.qss._qss_helpers.ymd import ConstantVelocity, ConstantRadius
+from unittest import TestCase
+import numpy as np
+
+
+class TestYMDConstraints(TestCase):
+    def test_constant_velocity(self):
+        velX, turn_radius = ConstantVelocity(velX=10).speeds(accY=np.array([5.0, -20.0]))
+
+        self.assertTrue(np.allclose(velX, [10, 10]))
+        self.assertTrue(np.allclose(turn_radius, [20, -5]))
+
+    def test_constant_radius(self):
+        velX, turn_radius = ConstantRadius(turn_radius=20).speeds(accY=5.0)
+
+        self.assertAlmostEqual(float(velX), 10)
+        self.assertAlmostEqual(float(turn_radius), 20)
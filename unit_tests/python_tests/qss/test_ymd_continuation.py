@@ -0,0 +1,62 @@
+from src.simulations.qss._qss_helpers.ymd_continuation import outward_indices, schedule_seeds, solve_ymd_grid, solve_ymd_seeded_line, solve_ymd_spine
+from unittest import TestCase
+import numpy as np
+
+
+class DummyYMD:
+    def __init__(self) -> None:
+        self.solves: list = []
+
+    def solve_point(self, hwa, beta, x0=None):
+        self.solves.append((hwa, beta))
+
+        return {"x": [hwa, beta], "warm_start": x0 is not None, "converged": not (hwa == 2 and beta == 0)}
+
+
+class TestYMDContinuation(TestCase):
+    def setUp(self):
+        self.model = DummyYMD()
+        self.hwa_sweep = np.linspace(-2, 2, 5)
+        self.beta_sweep = np.linspace(-1, 1, 3)
+        self.grid = solve_ymd_grid(model=self.model, hwa_sweep=self.hwa_sweep, beta_sweep=self.beta_sweep)
+
+    def test_outward_indices(self):
+        self.assertTupleEqual(outward_indices(n=5), ([2, 3, 4], [2, 1, 0]))
+
+    def test_every_point_solved_once(self):
+        self.assertEqual(len(self.model.solves), 15)
+        self.assertEqual(len(set(self.model.solves)), 15)
+
+    def test_grid_layout(self):
+        for beta, line in zip(self.beta_sweep, self.grid):
+            self.assertListEqual([point["x"] for point in line], [[hwa, beta] for hwa in self.hwa_sweep])
+
+    def test_only_center_is_cold(self):
+        cold = [point["x"] for line in self.grid for point in line if not point["warm_start"]]
+
+        self.assertListEqual(cold, [[0, 0]])
+
+    def test_spine_failed_center(self):
+        """An unconverged center point isn't used to seed the lower march"""
+        model = DummyYMD()
+        spine = solve_ymd_spine(model=model, hwa_sweep=[2], beta_sweep=[-1, 0, 1])
+
+        self.assertListEqual([point["warm_start"] for point in spine], [False, False, False])
+
+    def test_schedule_seeds(self):
+        """Seeds extrapolate linearly from the last two entries, falling back to the last converged state"""
+        self.assertIsNone(schedule_seeds(history=[], value=12))
+
+        first = [[{"x": [1.0, 2.0], "converged": True}, {"x": [1.0, 2.0], "converged": True}, {"x": [0.0, 0.0], "converged": False}]]
+        second = [[{"x": [2.0, 2.0], "converged": True}, {"x": [5.0, 5.0], "converged": False}, {"x": [3.0, 3.0], "converged": True}]]
+
+        self.assertListEqual(schedule_seeds(history=[(12, first)], value=12.5), [[[1.0, 2.0], [1.0, 2.0], None]])
+        self.assertListEqual(schedule_seeds(history=[(12, first), (12.5, second)], value=13), [[[3.0, 2.0], None, [3.0, 3.0]]])
+
+    def test_seeded_line(self):
+        """Seeded points start from their seed, unseeded points from the last converged point of the line"""
+        model = DummyYMD()
+        line = solve_ymd_seeded_line(model=model, hwa_sweep=[0, 1, 2], beta=0, seeds=[None, [1, 0], None])
+
+        self.assertListEqual([point["warm_start"] for point in line], [False, True, True])
+        self.assertListEqual(model.solves, [(0, 0), (1, 0), (2, 0)])
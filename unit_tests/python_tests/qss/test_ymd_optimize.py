@@ -0,0 +1,68 @@
+from src.simulations.qss._qss_helpers.ymd_optimize import optimize_peak, optimize_ymd_metrics
+from types import SimpleNamespace
+from unittest import TestCase
+import numpy as np
+
+
+class AnalyticYMD:
+    sus = SimpleNamespace(total_mass=300)
+
+    def __init__(self) -> None:
+        self.solves = 0
+
+    def point(self, hwa, beta):
+        accY = 15 * np.tanh(0.03 * hwa - 6 * beta)
+        accYaw = 20 * np.tanh(0.04 * hwa) * np.exp(-(4 * beta)**2) + 40 * np.tanh(3 * beta)
+
+        return accY, accYaw
+
+    def physical_model(self, x, args):
+        accY, accYaw = self.point(*args)
+
+        return list(300 * 9.81 * (np.asarray(x) - np.array([0, accY, accYaw, 0, 0, 0])))
+
+    def solve_point(self, hwa, beta, x0=None):
+        self.solves += 1
+        accY, accYaw = self.point(hwa, beta)
+
+        return {"x": [0, accY, accYaw, 0, 0, 0], "alpha": [beta] * 4, "delta": [hwa * np.pi / 180 / 5] * 4, "warm_start": x0 is not None,
+                "converged": True}
+
+
+class TestYMDOptimize(TestCase):
+    def setUp(self):
+        self.model = AnalyticYMD()
+        self.metrics = optimize_ymd_metrics(model=self.model, hwa=90, beta=10, refinement=41)
+
+        hwa_grid, beta_grid = np.meshgrid(np.linspace(-90, 90, 181), np.linspace(-10, 10, 181) * np.pi / 180)
+        self.accY, self.accYaw = self.model.point(hwa_grid, beta_grid)
+
+    def test_peaks(self):
+        """Peaks reach at least the extremes of a fine grid over the same box"""
+        self.assertGreaterEqual(self.metrics["max_accY"], self.accY.max() - 1e-6)
+        self.assertLessEqual(self.metrics["min_accY"], self.accY.min() + 1e-6)
+        self.assertGreaterEqual(self.metrics["max_N"], self.accYaw.max() - 1e-6)
+        self.assertLessEqual(self.metrics["min_N"], self.accYaw.min() + 1e-6)
+
+        self.assertAlmostEqual(self.metrics["hwa_at_max_N"], 90, places=3)
+        self.assertAlmostEqual(self.metrics["beta_at_max_N"], 10, places=3)
+
+    def test_trim(self):
+        """Peak trim accY sits on the accYaw = 0 line"""
+        trim = self.accY[np.abs(self.accYaw) < 0.2]
+
+        self.assertLess(self.metrics["max_trim_accY"], self.metrics["max_accY"])
+        self.assertAlmostEqual(self.metrics["max_trim_accY"], trim.max(), delta=0.1)
+        self.assertAlmostEqual(self.metrics["min_trim_accY"], trim.min(), delta=0.1)
+
+    def test_untrimmed_seed(self):
+        """An untrimmed seed never replaces the trimmed optimum"""
+        seed = (-90, 10 * np.pi / 180, np.asarray(self.model.solve_point(hwa=-90, beta=10 * np.pi / 180)["x"]))
+        _, metrics = optimize_peak(model=self.model, key="accY", sign=-1, hwa_max=90, beta_max=10 * np.pi / 180, seed=seed, trim=True)
+
+        self.assertLess(abs(metrics["accYaw"]), 1e-3)
+        self.assertAlmostEqual(metrics["accY"], self.metrics["min_trim_accY"], places=3)
+
+    def test_keys_and_cost(self):
+        self.assertEqual(len(self.metrics), 28)
+        self.assertLess(self.model.solves, 0.1 * 41 * 41)
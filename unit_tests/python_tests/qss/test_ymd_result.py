@@ -0,0 +1,52 @@
+from src.simulations.qss._qss_helpers.ymd_result import YMDResult
+from unittest import TestCase
+import numpy as np
+import tempfile
+import os
+
+
+class TestYMDResult(TestCase):
+    def setUp(self):
+        self.hwa_sweep = np.array([-10, 0, 10])
+        self.beta_sweep = np.array([-1, 1]) * np.pi / 180
+
+        grid = [[{"x": [0, hwa, beta, 0, 0, 0], "gamma": [0] * 4, "delta": [beta] * 4, "alpha": [0] * 4, "turn_radius": 1, "velX": 15,
+                  "warm_start": True, "converged": True} for hwa in self.hwa_sweep] for beta in self.beta_sweep]
+
+        self.result = YMDResult.from_grid(const_key="velX", const=15, hwa_sweep=self.hwa_sweep, beta_sweep=self.beta_sweep, grid=grid)
+
+    def test_isolines(self):
+        """Each hwa isoline spans every beta and each beta isoline spans every hwa, as views of the same grid"""
+        self.assertEqual(self.result["accY"].shape, (2, 3))
+        self.assertEqual(self.result.hwa_lines("accY").shape, (3, 2))
+        self.assertEqual(self.result.hwa_lines("delta").shape, (3, 2, 4))
+
+        for line in self.result.beta_lines("accY"):
+            self.assertListEqual(list(line), [-10, 0, 10])
+        for hwa, line in zip(self.hwa_sweep, self.result.hwa_lines("accY")):
+            self.assertTrue(np.all(line == hwa))
+
+        self.assertTrue(np.shares_memory(self.result.hwa_lines("accY"), self.result["accY"]))
+        self.assertTrue(np.all(self.result.hwa_lines("hwa") == self.hwa_sweep[:, None]))
+
+    def test_degrees(self):
+        """Angles are stored in degrees"""
+        self.assertAlmostEqual(self.result.beta_vals[0], -1)
+        self.assertAlmostEqual(self.result.hwa_lines("delta")[0, 1, 0], 1)
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "ymd.npz")
+            self.result.save(path)
+            loaded = YMDResult.load(path)
+
+        self.assertEqual(loaded.const_key, "velX")
+        self.assertEqual(loaded.const, 15)
+        self.assertTrue(np.array_equal(loaded.beta_vals, self.result.beta_vals))
+        self.assertTrue(np.array_equal(loaded["alpha"], self.result["alpha"]))
+        self.assertTrue(loaded["converged"].all())
+
+    def test_failure_map(self):
+        self.result["converged"][1, 2] = False
+
+        self.assertListEqual(self.result.failure_map(), [{"i": 1, "j": 2, "hwa": 10.0, "beta": 1.0}])
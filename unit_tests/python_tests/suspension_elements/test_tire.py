@@ -0,0 +1,64 @@
+from src.vehicle_model.suspension_model.suspension_elements._2_elements.tire import Tire, tire_eval_corners
+from src.vehicle_model.suspension_model.suspension_elements._1_elements.node import Node
+
+from unittest import TestCase
+import numpy as np
+
+
+class LinearTire:
+    """Tire model written with numpy operations, so it accepts arrays"""
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def tire_eval(self, FZ, alpha, kappa, gamma):
+        self.calls += 1
+
+        return [FZ * kappa, -FZ * alpha + 10 * gamma, FZ, 0, 0, -0.02 * FZ * alpha]
+
+
+class ScalarTire(LinearTire):
+    """Tire model with scalar branching, so it only accepts one point at a time"""
+    def tire_eval(self, FZ, alpha, kappa, gamma):
+        if FZ < 0:
+            FZ = 0
+
+        return super().tire_eval(FZ=FZ, alpha=alpha, kappa=kappa, gamma=gamma)
+
+
+class TestTire(TestCase):
+    def setUp(self):
+        self.FZ = np.linspace(200, 1000, 5)
+        self.alpha = np.linspace(-0.1, 0.1, 5)
+        self.gamma = np.linspace(-0.02, 0.02, 5)
+
+    def make_tire(self, model):
+        return Tire(tire=model, contact_patch=Node(position=[0, 0, 0]), outer_diameter=0.4, width=0.2, inner_diameter=0.25)
+
+    def expected(self, model):
+        return np.array([model.tire_eval(FZ=fz, alpha=a, kappa=0.05, gamma=g) for fz, a, g in zip(self.FZ, self.alpha, self.gamma)], dtype=float)
+
+    def test_tire_eval_many(self):
+        """Array-capable models are evaluated in one call, scalar models point by point, with the same result"""
+        for model_class, calls in ((LinearTire, 1), (ScalarTire, 5)):
+            model = model_class()
+            tire = self.make_tire(model)
+            loads = tire.tire_eval_many(FZ=self.FZ, alpha=self.alpha, kappa=0.05, gamma=self.gamma)
+
+            self.assertEqual(model.calls, calls)
+            self.assertEqual(loads.shape, (5, 6))
+            self.assertTrue(np.allclose(loads, self.expected(model)))
+
+    def test_tire_eval_corners(self):
+        """Corners sharing a tire model are evaluated together"""
+        front, rear = LinearTire(), LinearTire()
+        tires = [self.make_tire(front), self.make_tire(front), self.make_tire(rear), self.make_tire(rear)]
+
+        FZ = np.column_stack([self.FZ, self.FZ + 50, self.FZ + 100, self.FZ + 150])
+        loads = tire_eval_corners(tires=tires, FZ=FZ, alpha=self.alpha[:, None], kappa=0, gamma=0)
+
+        self.assertEqual(loads.shape, (5, 4, 6))
+        self.assertEqual(front.calls + rear.calls, 2)
+        self.assertTrue(np.allclose(loads[:, 3, 1], -FZ[:, 3] * self.alpha))
+
+        single = tire_eval_corners(tires=tires, FZ=FZ[0], alpha=self.alpha[0], kappa=0, gamma=0)
+        self.assertTrue(np.allclose(single, loads[0]))
@@ -0,0 +1,48 @@
+from src._3_custom_libraries.assets import clear_assets, load_asset
+
+from unittest import TestCase
+import tempfile
+import os
+
+
+class TestAssets(TestCase):
+    def setUp(self):
+        clear_assets()
+        self.loads = 0
+
+    def loader(self, path: str) -> list:
+        self.loads += 1
+
+        with open(path) as f:
+            return [f.read()]
+
+    def test_shared_instance(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "asset.txt")
+
+            with open(path, "w") as f:
+                f.write("a")
+
+            first = load_asset(path=path, kind="text", loader=self.loader)
+            second = load_asset(path=os.path.join(tmp_dir, ".", "asset.txt"), kind="text", loader=self.loader)
+
+            self.assertIs(first, second)
+            self.assertEqual(self.loads, 1)
+
+            load_asset(path=path, kind="other", loader=self.loader)
+            self.assertEqual(self.loads, 2)
+
+    def test_reload_on_change(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "asset.txt")
+
+            with open(path, "w") as f:
+                f.write("a")
+
+            self.assertListEqual(load_asset(path=path, kind="text", loader=self.loader), ["a"])
+
+            with open(path, "w") as f:
+                f.write("bb")
+
+            self.assertListEqual(load_asset(path=path, kind="text", loader=self.loader), ["bb"])
+            self.assertEqual(self.loads, 2)
@@ -0,0 +1,76 @@
+from src._3_custom_libraries.cache import LRUStateCache, LRU_state_cache, quantize_key
+
+from unittest import TestCase
+
+
+class DummySuspension:
+    def __init__(self) -> None:
+        self.state = {"a": 0.0, "b": 0.0}
+
+
+class DummySim:
+    def __init__(self) -> None:
+        self.sus = DummySuspension()
+        self.evals = 0
+
+    @LRU_state_cache(max_entries=2)
+    def heave(self, heave: float):
+        self.evals += 1
+        self.sus = DummySuspension()
+        self.sus.state["a"] = heave
+        self.sus.state["b"] = 2 * heave
+
+        return self
+
+
+class TestLRUStateCache(TestCase):
+    def test_restore(self):
+        cache = LRUStateCache(max_entries=4)
+        cache.put(key=1, state={"a": 1.0, "b": 2.0})
+
+        self.assertDictEqual(cache.get(key=1), {"a": 1.0, "b": 2.0})
+        self.assertIsNone(cache.get(key=2))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_entry_eviction(self):
+        cache = LRUStateCache(max_entries=2)
+        cache.put(key=1, state={"a": 1.0})
+        cache.put(key=2, state={"a": 2.0})
+        cache.get(key=1)
+        cache.put(key=3, state={"a": 3.0})
+
+        self.assertIsNone(cache.get(key=2))
+        self.assertIsNotNone(cache.get(key=1))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_byte_eviction(self):
+        cache = LRUStateCache(max_entries=None, max_bytes=32)
+
+        for i in range(3):
+            cache.put(key=i, state={"a": i, "b": i})
+
+        self.assertEqual(cache.stats()["entries"], 2)
+        self.assertEqual(cache.stats()["bytes"], 32)
+
+    def test_decorator(self):
+        DummySim.heave.cache.clear()
+        sim = DummySim()
+
+        sim.heave(1.0)
+        sim.heave(2.0)
+        sim = sim.heave(1.0)
+
+        self.assertEqual(sim.evals, 2)
+        self.assertDictEqual(sim.sus.state, {"a": 1.0, "b": 2.0})
+        self.assertEqual(DummySim.heave.cache.stats()["hits"], 1)
+
+
+class TestQuantizeKey(TestCase):
+    def test_exact(self):
+        self.assertNotEqual(quantize_key(args=(0.1 + 0.2,)), quantize_key(args=(0.3,)))
+
+    def test_quantized(self):
+        self.assertEqual(quantize_key(args=(0.1 + 0.2, 5), units=("m", None)), quantize_key(args=(0.3, 5), units=("m", None)))
+        self.assertNotEqual(quantize_key(args=(0.3, 5), units=("m", None)), quantize_key(args=(0.3, 6), units=("m", None)))
+        self.assertNotEqual(quantize_key(args=(0.3,), units=("m",)), quantize_key(args=(0.3001,), units=("m",)))
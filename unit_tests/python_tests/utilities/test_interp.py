@@ -0,0 +1,64 @@
+from src._3_custom_libraries.interp import interp2d, interp3d, interp4d
+from scipy.interpolate import interpn
+import numpy as np
+
+from unittest import TestCase
+
+
+class TestInterp(TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_interp4d_batch(self):
+        axes = [np.linspace(-1, 1, 5), np.linspace(0, 2, 4), np.linspace(-3, 3, 6), np.linspace(0, 1, 3)]
+        values = self.rng.random((5, 4, 6, 3))
+        func = interp4d(*axes, v=values.ravel())
+
+        points = np.column_stack([self.rng.uniform(axis.min(), axis.max(), 50) for axis in axes])
+        known = interpn(points=axes, values=values, xi=points)
+
+        self.assertTrue(np.allclose(func(points), known))
+        self.assertTrue(np.allclose(func(*points.T), known))
+        self.assertTrue(np.allclose(func(*points[0]), known[:1]))
+
+    def test_interp4d_clamp(self):
+        axes = [np.linspace(0, 1, 3)] * 4
+        values = self.rng.random((3, 3, 3, 3))
+        func = interp4d(*axes, v=values)
+
+        self.assertAlmostEqual(float(func(5, -5, np.nan, 1)[0]), values[-1, 0, -1, -1])
+
+    def test_interp3d(self):
+        axes = [np.linspace(0, 1, 4), np.linspace(0, 2, 5), np.linspace(-1, 1, 3)]
+        X, Y, Z = np.meshgrid(*axes, indexing='ij')
+        values = 2 * X - Y + 3 * Z
+        func = interp3d(*axes, v=values)
+        self.assertTrue(func.regular)
+
+        points = np.column_stack([self.rng.uniform(axis.min(), axis.max(), 20) for axis in axes])
+        known = 2 * points[:, 0] - points[:, 1] + 3 * points[:, 2]
+
+        self.assertTrue(np.allclose(func(points), known))
+        self.assertAlmostEqual(float(func(2, 1, 0)[0]), 2 * 1 - 1)
+
+    def test_interp2d(self):
+        axes = [np.linspace(0, 1, 4), np.linspace(0, 2, 5)]
+        values = self.rng.random((4, 5))
+        func = interp2d(*axes, z=values.ravel())
+
+        points = np.column_stack([self.rng.uniform(axis.min(), axis.max(), 20) for axis in axes])
+
+        self.assertTrue(np.allclose(func(points), interpn(points=axes, values=values, xi=points)))
+        self.assertAlmostEqual(float(func(-1, 3)[0]), values[0, -1])
+
+    def test_interp3d_scattered(self):
+        points = self.rng.uniform(0, 1, (200, 3))
+        values = points[:, 0] + 2 * points[:, 1] - points[:, 2]
+        func = interp3d(*points.T, v=values)
+
+        self.assertFalse(func.regular)
+        self.assertTrue(np.allclose(func(np.array([[0.5, 0.5, 0.5]])), [1.0]))
+
+        # Corners of the bounding box fall outside the hull, returning the nearest data value
+        corner = func(0, 0, 0)[0]
+        self.assertEqual(corner, values[np.argmin(np.linalg.norm(points, axis=1))])
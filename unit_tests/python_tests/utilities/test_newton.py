@@ -0,0 +1,28 @@
+from src._3_custom_libraries.newton import batch_newton
+from scipy.optimize import fsolve
+
+from unittest import TestCase
+import numpy as np
+
+
+def residual(x: np.ndarray, rows: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    return np.column_stack([x[:, 0]**2 + x[:, 1] - offsets[rows], np.sin(x[:, 0]) + 2 * x[:, 1]])
+
+
+class TestBatchNewton(TestCase):
+    def setUp(self):
+        self.offsets = np.linspace(1, 3, 25)
+
+    def test_matches_fsolve(self):
+        x, converged, _ = batch_newton(func=lambda x, rows: residual(x, rows, self.offsets), x0=np.ones((25, 2)), tol=1e-10)
+
+        self.assertTrue(converged.all())
+
+        for offset, soln in zip(self.offsets, x):
+            known = fsolve(lambda y: residual(np.array([y]), np.array([0]), np.array([offset]))[0], x0=[1, 1])
+            self.assertTrue(np.allclose(soln, known))
+
+    def test_unsolvable(self):
+        x, converged, _ = batch_newton(func=lambda x, rows: x**2 + 1, x0=np.ones((3, 1)), max_iter=5)
+
+        self.assertFalse(converged.any())
@@ -0,0 +1,42 @@
+from src._3_custom_libraries.parallel import WorkerPool, run_parallel
+
+from unittest import TestCase
+import os
+
+
+class TestParallel(TestCase):
+    def test_result_order(self):
+        jobs = [(round, {"number": x + 0.26, "ndigits": 1}) for x in range(4)]
+
+        self.assertListEqual(run_parallel(jobs=jobs, max_workers=2), [0.3, 1.3, 2.3, 3.3])
+
+    def test_fresh_process(self):
+        pids = run_parallel(jobs=[(os.getpid, {}) for _ in range(3)], max_workers=1)
+
+        self.assertEqual(len(set(pids)), 3)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_pool_reuses_workers(self):
+        with WorkerPool(initializer=_set_offset, initargs=(10,), max_workers=2, chunksize=2) as pool:
+            results = list(pool.map(_worker_pid, range(6))) + list(pool.map(_worker_pid, range(2)))
+
+        self.assertListEqual([x for x, _ in results], list(range(10, 16)) + [10, 11])
+        self.assertLessEqual(len(set(pid for _, pid in results)), 2)
+        self.assertNotIn(os.getpid(), [pid for _, pid in results])
+
+    def test_pool_in_process(self):
+        with WorkerPool(initializer=_set_offset, initargs=(5,), max_workers=1) as pool:
+            results = list(pool.map(_worker_pid, range(2)))
+
+        self.assertListEqual(results, [(5, os.getpid()), (6, os.getpid())])
+        _set_offset(0)
+
+
+_offset = 0
+
+def _set_offset(offset: int) -> None:
+    global _offset
+    _offset = offset
+
+def _worker_pid(x: int):
+    return (x + _offset, os.getpid())
@@ -0,0 +1,67 @@
+from src._3_custom_libraries.pose_store import PoseStore, model_hash
+
+from unittest import TestCase
+import tempfile
+import os
+
+
+class TestPoseStore(TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "poses.db")
+
+            store = PoseStore(path=path)
+            store.put(model_hash="abc", solve_path="fmu", pose=[0, 0.1 + 0.2, 0, 0], state={"a": 1.0, "b": 2.0})
+            store.close()
+
+            store = PoseStore(path=path)
+            self.assertDictEqual(store.get(model_hash="abc", solve_path="fmu", pose=[0, 0.3, 0, 0]), {"a": 1.0, "b": 2.0})
+            self.assertIsNone(store.get(model_hash="abc", solve_path="fmu", pose=[0, 0.3, 0, 1]))
+            self.assertIsNone(store.get(model_hash="def", solve_path="fmu", pose=[0, 0.3, 0, 0]))
+            store.close()
+
+    def test_solve_paths(self):
+        """The same pose solved along different paths is stored separately"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = PoseStore(path=os.path.join(tmp_dir, "poses.db"))
+            store.put(model_hash="abc", solve_path="sweep roll 1", pose=[0, 0, 0, 2], state={"a": 1.0})
+            store.put(model_hash="abc", solve_path="fmu", pose=[0, 0, 0, 2], state={"a": 2.0})
+
+            self.assertDictEqual(store.get(model_hash="abc", solve_path="sweep roll 1", pose=[0, 0, 0, 2]), {"a": 1.0})
+            self.assertDictEqual(store.get(model_hash="abc", solve_path="fmu", pose=[0, 0, 0, 2]), {"a": 2.0})
+            self.assertIsNone(store.get(model_hash="abc", solve_path="sweep roll 5", pose=[0, 0, 0, 2]))
+            store.close()
+
+    def test_concurrent_open(self):
+        """Stores opened while another holds data keep the migrated schema and its rows"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "poses.db")
+
+            first = PoseStore(path=path)
+            first.put(model_hash="abc", solve_path="fmu", pose=[0, 0, 0, 0], state={"a": 1.0})
+            first.commit()
+
+            second = PoseStore(path=path)
+            self.assertDictEqual(second.get(model_hash="abc", solve_path="fmu", pose=[0, 0, 0, 0]), {"a": 1.0})
+
+            first.close()
+            second.close()
+
+    def test_model_hash(self):
+        """Editing a referenced .tir file changes the model hash"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tir_path = os.path.join(tmp_dir, "tire.tir")
+            model_path = os.path.join(tmp_dir, "vehicle.yml")
+
+            with open(tir_path, "w") as f:
+                f.write("FNOMIN = 1000\n")
+            with open(model_path, "w") as f:
+                f.write(f"FL QuarterCar:\n  tire:\n    tir_path:\n      Type: string\n      Unit: N/A\n      Value: {tir_path}\n")
+
+            before = model_hash(model_path=model_path)
+            self.assertEqual(model_hash(model_path=model_path), before)
+
+            with open(tir_path, "w") as f:
+                f.write("FNOMIN = 1100\n")
+
+            self.assertNotEqual(model_hash(model_path=model_path), before)
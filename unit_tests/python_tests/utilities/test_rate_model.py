@@ -0,0 +1,26 @@
+from src._3_custom_libraries.rate_model import RateModel
+from numpy.polynomial import Polynomial
+from scipy.integrate import quad
+
+from unittest import TestCase
+import numpy as np
+
+
+class TestRateModel(TestCase):
+    def setUp(self):
+        self.x = np.linspace(-0.127, 0.127, 20)
+
+    def test_linear_spring(self):
+        spring = RateModel.fit(x=self.x, y=np.full(20, 1000.0), deg=3)
+
+        self.assertTrue(np.allclose(spring.rate(self.x), 1000))
+        self.assertTrue(np.allclose(spring.force(self.x), 1000 * self.x))
+        self.assertTrue(np.allclose(spring.energy(self.x), 500 * self.x**2))
+
+    def test_motion_ratio(self):
+        motion_ratio = Polynomial([1.0, 0.5, 2.0, -3.0])
+        wheel_rate = RateModel.from_motion_ratio(spring_rate=30000, motion_ratio=motion_ratio, x=self.x)
+
+        for jounce in [-0.1, -0.02, 0.05, 0.12]:
+            known = quad(lambda z: 30000 / motion_ratio(z)**2, 0, jounce)[0]
+            self.assertAlmostEqual(float(wheel_rate.force(jounce)), known, delta=abs(known) * 1e-3)
@@ -0,0 +1,47 @@
+from src._3_custom_libraries.report import Report
+
+from matplotlib.figure import Figure
+from unittest import TestCase
+from pypdf import PdfReader
+
+import matplotlib.pyplot as plt
+import tempfile
+import os
+
+
+def _text_page(text: str) -> Figure:
+    fig = plt.figure(figsize=(4, 3))
+    fig.text(0.5, 0.5, text, ha="center")
+
+    return fig
+
+def _text_pages(texts: list[str]) -> list[Figure]:
+    return [_text_page(text) for text in texts]
+
+
+class TestReport(TestCase):
+    def render(self, max_workers: int) -> list[str]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            save_path = os.path.join(tmp_dir, "report.pdf")
+
+            report = Report(save_path=save_path, max_workers=max_workers)
+            report.add_figure(_text_page("title"))
+            report.add_page(_text_pages, texts=["a", "b"])
+            report.add_figure([_text_page("appendix")])
+            report.add_page(_text_page, text="c")
+
+            self.assertEqual(report.close(), 5)
+            self.assertFalse(os.path.exists(report.tmp_dir.name))
+
+            return [page.extract_text().strip() for page in PdfReader(save_path).pages]
+
+    def test_page_order(self):
+        """Pages keep the order they were added in, whether rendered here or in workers"""
+        self.assertListEqual(self.render(max_workers=1), ["title", "a", "b", "appendix", "c"])
+        self.assertListEqual(self.render(max_workers=2), ["title", "a", "b", "appendix", "c"])
+
+    def test_figures_closed(self):
+        before = len(plt.get_fignums())
+        self.render(max_workers=1)
+
+        self.assertEqual(len(plt.get_fignums()), before)
@@ -0,0 +1,56 @@
+from src._3_custom_libraries.simulation import Simulation, SimulationContext
+from unittest import TestCase
+import numpy as np
+
+
+MODEL_PATH = "./unit_tests/python_tests/_test_dependencies/unit_test_vehicle.yml"
+
+
+class TestSimulationContext(TestCase):
+    def test_lazy(self):
+        """Nothing is built until it is read, and each piece is built once"""
+        context = SimulationContext(model_path=MODEL_PATH)
+        self.assertNotIn("sus_data", context.__dict__)
+
+        sus = context.sus
+
+        self.assertIn("sus_data", context.__dict__)
+        self.assertNotIn("aero", context.__dict__)
+        self.assertIs(context.sus, sus)
+        self.assertIs(context.tires["FL"], sus.FL_quarter_car.tire)
+
+    def test_shared(self):
+        """Simulations of the same model share one context and its pieces"""
+        first = Simulation(model_path=MODEL_PATH)
+        second = Simulation(model_path=MODEL_PATH)
+
+        self.assertIs(first.context, SimulationContext.shared(model_path=MODEL_PATH))
+        self.assertIs(first.context, second.context)
+        self.assertIs(first.sus_data, second.sus_data)
+
+    def test_sus_copy(self):
+        """Each simulation moves its own copy of the suspension, keeping the shared tire models"""
+        first = Simulation(model_path=MODEL_PATH)
+        second = Simulation(model_path=MODEL_PATH)
+
+        self.assertIsNot(first.sus_copy, first.sus)
+        self.assertIsNot(first.sus_copy, second.sus_copy)
+        self.assertIs(first.sus_copy, first.sus_copy)
+        self.assertIs(first.sus_copy.FL_quarter_car.tire.tire, first.sus.FL_quarter_car.tire.tire)
+
+    def test_wheel_rates(self):
+        """Motion ratio fits and wheel rates are fitted from the FMU once per context"""
+        context = SimulationContext(model_path=MODEL_PATH)
+        context.kin_FMU = {key: lambda pose: np.array([0.5]) for key in ["FL_bump_spring_MR", "FR_bump_spring_MR", "RL_bump_spring_MR",
+                                                                         "RR_bump_spring_MR", "Fr_roll_stabar_MR", "Rr_roll_stabar_MR"]}
+
+        wheel_rates = context.wheel_rates
+        spring_rate = context.sus.FL_quarter_car.push_pull_rod.spring.compliance
+
+        self.assertIs(context.wheel_rates, wheel_rates)
+        self.assertAlmostEqual(context.motion_ratios["Fr_stabar"](1.0), 0.5)
+        self.assertAlmostEqual(wheel_rates["FL"].rate(0.01), spring_rate / 0.5**2, places=3)
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            Simulation(model_path=MODEL_PATH).not_a_piece
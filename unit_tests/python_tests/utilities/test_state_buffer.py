@@ -0,0 +1,54 @@
+from src._3_custom_libraries.state_buffer import StateBuffer
+import numpy as np
+
+from unittest import TestCase
+import tempfile
+import os
+
+
+class TestStateBuffer(TestCase):
+    def test_column_order(self):
+        buffer = StateBuffer(keys=["a", "b"], n_points=4)
+
+        for i in range(4):
+            buffer.write(index=i, state={"a": i, "b": 10 * i})
+
+        self.assertListEqual(list(buffer.column("a")), [0, 1, 2, 3])
+        self.assertListEqual(list(buffer.column("b")), [0, 10, 20, 30])
+
+    def test_column_reshape(self):
+        buffer = StateBuffer(keys=["a"], n_points=16)
+
+        for i in range(16):
+            buffer.write(index=i, state={"a": i})
+
+        known = np.arange(16, dtype=float).reshape((2, 2, 2, 2))
+        self.assertTrue(np.array_equal(buffer.column("a", shape=(2, 2, 2, 2)), known))
+
+    def test_memmap(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "states.npy")
+            buffer = StateBuffer(keys=["a", "b"], n_points=3, memmap_path=path)
+
+            for i in range(3):
+                buffer.write(index=i, state={"a": i, "b": -i})
+
+            buffer.flush()
+            data = np.load(path)
+            del buffer
+
+            self.assertListEqual(list(data[:, 1]), [0, -1, -2])
+
+    def test_close(self):
+        """Closing releases the memmap, so its file can be deleted"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "states.npy")
+            buffer = StateBuffer(keys=["a"], n_points=2, memmap_path=path)
+            buffer.write(index=0, state={"a": 1.0})
+            column = buffer.column("a")
+
+            buffer.close()
+            os.remove(path)
+
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(column[0], 1.0)
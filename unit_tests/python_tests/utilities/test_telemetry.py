@@ -0,0 +1,63 @@
+from src._3_custom_libraries.parallel import WorkerPool, run_parallel
+from src._3_custom_libraries.misc_math import nearest_root
+from src._3_custom_libraries import telemetry
+
+from unittest import TestCase
+import tempfile
+import json
+import os
+
+
+class TestTelemetry(TestCase):
+    def setUp(self):
+        telemetry.reset()
+
+    def tearDown(self):
+        telemetry.reset()
+
+    def test_fsolve(self):
+        """Calls, evaluations, and convergence are counted per site"""
+        x = telemetry.fsolve(site="square", func=lambda x: x**2 - 4, x0=[1.0])
+        _, _, ier, _ = telemetry.fsolve(site="square", func=lambda x: x**2 + 1, x0=[1.0], full_output=True)
+
+        stats = telemetry.summary()["sites"]["square"]
+
+        self.assertAlmostEqual(x[0], 2)
+        self.assertNotEqual(ier, 1)
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["converged"], 1)
+        self.assertEqual(stats["failure_rate"], 0.5)
+        self.assertGreater(stats["nfev"], 2)
+
+    def test_root_finders(self):
+        root = nearest_root(func=lambda x, args: x - 0.3, x0=0, bounds=(-1, 1), tol=1e-8, site="line")
+
+        self.assertAlmostEqual(root, 0.3)
+        self.assertGreater(telemetry.summary()["sites"]["line"]["nfev"], 3)
+
+    def test_workers(self):
+        """Statistics recorded in worker processes are merged into the parent"""
+        with WorkerPool(max_workers=2) as pool:
+            list(pool.map(_solve, range(4)))
+            pool.submit(_solve, 4).result()
+
+        run_parallel(jobs=[(_solve, {"x": 5})], max_workers=1)
+
+        self.assertEqual(telemetry.summary()["sites"]["worker"]["calls"], 6)
+        self.assertEqual(telemetry.summary()["failures"]["grid 5"], [{"i": 0, "j": 5}])
+
+    def test_write_summary(self):
+        telemetry.record(site="batch", nfev=30, wall_time=0.1, converged=8, calls=10)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "telemetry", "qss.json")
+            telemetry.write_summary(path=path)
+
+            with open(path) as f:
+                self.assertEqual(json.load(f)["sites"]["batch"]["failed"], 2)
+
+
+def _solve(x: int) -> float:
+    telemetry.record_failures(name=f"grid {x}", points=[{"i": 0, "j": x}])
+
+    return telemetry.fsolve(site="worker", func=lambda y: y - x, x0=[0.0])[0]
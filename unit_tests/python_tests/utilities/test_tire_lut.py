@@ -0,0 +1,100 @@
+from src._3_custom_libraries.tire_lut import TireLUT, cached_tire_lut, grid_axes, tire_model_eval_many
+from src._3_custom_libraries.assets import clear_assets
+
+from unittest import TestCase
+import numpy as np
+import tempfile
+import json
+import os
+
+
+class SmoothTire:
+    """Magic Formula style lateral curve, with scalar branching so it's only evaluated point by point"""
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def tire_eval(self, FZ, alpha, kappa, gamma):
+        if not np.isscalar(FZ):
+            raise TypeError("scalar inputs only")
+
+        self.calls += 1
+        Fy = -1.5 * FZ * np.sin(1.4 * np.arctan(10 * alpha)) + 20 * gamma * FZ / 1000
+
+        return [FZ * kappa, Fy, FZ, 0.0, 0.0, -0.02 * Fy]
+
+
+class TestTireLUT(TestCase):
+    def setUp(self):
+        clear_assets()
+        self.tire = SmoothTire()
+        self.grid = [(0, 2000, 11), (-15, 15, 61), (-0.1, 0.1, 5), (-4, 4, 5)]
+        self.lut = TireLUT.build(tire=self.tire, tire_name="smooth", axes=grid_axes(self.grid))
+
+    def test_grid_points(self):
+        """The table is exact on its grid, and matches the tire model's output format"""
+        FZ, alpha = 800, 2 * np.pi / 180
+
+        self.assertTrue(np.allclose(self.lut.tire_eval(FZ=FZ, alpha=alpha, kappa=0.05, gamma=0),
+                                    self.tire.tire_eval(FZ=FZ, alpha=alpha, kappa=0.05, gamma=0)))
+        self.assertIsInstance(self.lut.tire_eval(FZ=FZ, alpha=alpha, kappa=0, gamma=0)[1], float)
+
+        loads = self.lut.tire_eval(FZ=np.array([[400, 800]]), alpha=alpha, kappa=0, gamma=0)
+        self.assertEqual(len(loads), 6)
+        self.assertEqual(loads[1].shape, (1, 2))
+
+    def test_eval_many(self):
+        """Scalar-only tire models fall back to per point calls with the same loads as one array call"""
+        FZ, alpha, kappa, gamma = np.array([400.0, 800.0]), np.array([0.01, -0.02]), np.zeros(2), np.array([0.0, 0.01])
+
+        scalar_loads, vectorized = tire_model_eval_many(self.tire, FZ, alpha, kappa, gamma)
+        self.assertFalse(vectorized)
+
+        calls = self.tire.calls
+        tire_model_eval_many(self.tire, FZ, alpha, kappa, gamma, vectorized=False)
+        self.assertEqual(self.tire.calls, calls + 2)
+
+        array_loads, vectorized = tire_model_eval_many(self.lut, FZ, alpha, kappa, gamma)
+        self.assertTrue(vectorized)
+        self.assertEqual(array_loads.shape, scalar_loads.shape)
+        self.assertTrue(np.allclose(array_loads, scalar_loads, atol=1.0))
+
+    def test_clamped(self):
+        inside = self.lut.tire_eval(FZ=2000, alpha=15 * np.pi / 180, kappa=0, gamma=0)
+        outside = self.lut.tire_eval(FZ=3000, alpha=30 * np.pi / 180, kappa=0, gamma=0)
+
+        self.assertListEqual(inside, outside)
+
+    def test_validate(self):
+        """Spline lookup is more accurate than multilinear on a smooth curve"""
+        linear = self.lut.validate(tire=self.tire, n_samples=500)
+        cubic = TireLUT(tire_name="smooth", axes=self.lut.axes, loads=self.lut.loads, method="cubic").validate(tire=self.tire, n_samples=500)
+
+        self.assertLess(linear["Fy"]["max_rel"], 1e-2)
+        self.assertLess(cubic["Fy"]["rms"], linear["Fy"]["rms"])
+        self.assertEqual(linear["Mx"]["max"], 0)
+
+    def test_disk_cache(self):
+        """Tables are built once per .tir file contents and grid"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tir_path = os.path.join(tmp_dir, "smooth.tir")
+            with open(tir_path, "w") as f:
+                f.write("a")
+
+            grid = [(0, 2000, 3), (-15, 15, 5), (0, 0, 1), (0, 0, 1)]
+            cached_tire_lut(tire=self.tire, tir_path=tir_path, grid=grid, cache_dir=tmp_dir)
+            calls = self.tire.calls
+
+            cached = cached_tire_lut(tire=self.tire, tir_path=tir_path, grid=grid, cache_dir=tmp_dir)
+            self.assertEqual(self.tire.calls, calls)
+            self.assertEqual(cached.loads.shape, (3, 5, 1, 1, 6))
+
+            reports = [name for name in os.listdir(tmp_dir) if name.endswith("_linear.json")]
+            self.assertEqual(len(reports), 1)
+            with open(os.path.join(tmp_dir, reports[0])) as f:
+                self.assertIn("Fy", json.load(f))
+
+            with open(tir_path, "w") as f:
+                f.write("b")
+
+            cached_tire_lut(tire=self.tire, tir_path=tir_path, grid=grid, cache_dir=tmp_dir)
+            self.assertGreater(self.tire.calls, calls)